@@ -7,8 +7,13 @@ Licensed under GPL v3 (see LICENSE file for details)
 from dataclasses import dataclass
 from typing import Iterable
 
-import openai
-import google.genai as genai
+from .lazy_modules import lazy_module_getattr
+
+# The provider SDKs are slow to import, and a session without that provider's key never
+# needs them. `ai_models.openai` / `ai_models.genai` stay reachable as module attributes
+# and are imported on first access.
+__getattr__ = lazy_module_getattr(globals(), {"openai": "openai", "genai": "google.genai"})
+
 
 PROVIDER_OPENAI = "OPENAI"
 PROVIDER_GOOGLEAI = "GOOGLEAI"
@@ -133,6 +138,8 @@ def model_options_for_capability(
 def discover_openai_model_options(api_key: str | None) -> list[ModelOption]:
     if not api_key:
         return []
+    import openai
+
     client = openai.OpenAI(api_key=api_key)
     response = client.models.list()
     options = []
@@ -155,6 +162,8 @@ def discover_openai_model_options(api_key: str | None) -> list[ModelOption]:
 def discover_google_model_options(api_key: str | None) -> list[ModelOption]:
     if not api_key:
         return []
+    import google.genai as genai
+
     client = genai.Client(api_key=api_key)
     pager = client.models.list(config={"page_size": 200, "query_base": True})
     options = []
@@ -4,19 +4,22 @@ Copyright © 2025 Keystone Intelligence LLC
 Licensed under GPL v3 (see LICENSE file for details)
 """
 
+import functools
 import os
 import sys
 from PySide6 import QtGui
 
 
+@functools.cache
 def base_dir() -> str:
     """
     Get the absolute path to a bundled resource, whether running
     as a PyInstaller-built EXE or as a plain .py script.
     """
-    # PyInstaller sets _MEIPASS when running in a bundle.
-    base_path = getattr(sys, "_MEIPASS", os.path.abspath("."))
-    return str(base_path)
+    # PyInstaller sets frozen and _MEIPASS when running in a bundle.
+    if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
+        return str(getattr(sys, "_MEIPASS"))
+    return os.path.abspath(".")
 
 
 GRAPHICS_DIR = os.path.join(base_dir(), "graphics")
@@ -30,16 +33,19 @@ SAGE_FILE_EXTENSION = ".sage"
 RECENT_PROJECTS_KEY = "Recent Projects"
 MAX_RECENT_PROJECTS = 5
 SIDEBAR_ICON_SIZE = 12
-SIDEBAR_DEPTH_COLORS = [
-    QtGui.QColor("#3498db"),
-    QtGui.QColor("#2ecc71"),
-    QtGui.QColor("#f1c40f"),
-    QtGui.QColor("#e67e22"),
-    QtGui.QColor("#e74c3c"),
-    QtGui.QColor("#9b59b6"),
-    QtGui.QColor("#1abc9c"),
-    QtGui.QColor("#7f8c8d"),
-]
+SIDEBAR_DEPTH_COLORS = tuple(
+    QtGui.QColor(code)
+    for code in (
+        "#3498db",
+        "#2ecc71",
+        "#f1c40f",
+        "#e67e22",
+        "#e74c3c",
+        "#9b59b6",
+        "#1abc9c",
+        "#7f8c8d",
+    )
+)
 
 # --- Logo Path ---
 # Assume this script is in the root directory relative to main.py
@@ -47,9 +53,31 @@ LOGO_FILENAME = os.path.join(GRAPHICS_DIR, "logo_large.png")
 
 
 SETTINGS_FILE_NAME = "./.sagesettings"
+# Real settings files are a few KB; anything past this is corrupt and not worth parsing.
+SETTINGS_FILE_MAX_BYTES = 1_000_000
 TESTING_PROVIDER_ENABLED = os.environ.get(
     "SPRITESAGE_ENABLE_TESTING_PROVIDER", "1"
 ).strip().lower() not in {"0", "false", "no", "off"}
+# Opt-in cache of AI responses, keyed on the request and the bytes of its input
+# images, so repeating an identical request skips the provider round-trip.
+RESPONSE_CACHE_ENABLED = os.environ.get("SPRITESAGE_CACHE", "0").strip().lower() in {
+    "1",
+    "true",
+    "yes",
+    "on",
+}
+RESPONSE_CACHE_DIR = "./.sagecache"
+# Optional boolean in the settings file; when present it overrides SPRITESAGE_CACHE.
+RESPONSE_CACHE_SETTING = "Response Cache"
+# Opt-in reuse of animation name suggestions for prompts whose embeddings are
+# nearly identical to an earlier one. Off by default since matches are approximate.
+SEMANTIC_CACHE_ENABLED = os.environ.get("SPRITESAGE_SEMANTIC_CACHE", "0").strip().lower() in {
+    "1",
+    "true",
+    "yes",
+    "on",
+}
+SEMANTIC_CACHE_THRESHOLD = 0.95
 DEFAULT_SETTINGS = {
     "OPENAI_API_KEY": "",
     "GOOGLE_AI_STUDIO_API_KEY": "",
@@ -87,10 +115,86 @@ APP_PALETTE = {
     "editable_value_bg": "#313335",  # Using console bg color for editable fields
 }
 
+# Pre-parsed colors so widgets don't re-parse the same hex strings.
+APP_PALETTE_QCOLORS = {key: QtGui.QColor(value) for key, value in APP_PALETTE.items()}
+
+
+def palette_qcolor(palette, key: str, default: str = "#000000") -> QtGui.QColor:
+    """Return the QColor for a palette entry, reusing APP_PALETTE_QCOLORS when possible."""
+    value = palette.get(key, default)
+    if APP_PALETTE.get(key) == value:
+        return APP_PALETTE_QCOLORS[key]
+    return QtGui.QColor(value)
+
 
 def build_application_stylesheet(app_palette=None) -> str:
-    """Return shared application styles for transient dialogs."""
+    """Return shared application styles for transient dialogs and the main panels."""
     palette = app_palette or APP_PALETTE
+    return _application_stylesheet(tuple(palette.items()))
+
+
+# Rules for the image loader/viewer widgets and their overlay buttons, filled in
+# with str.format by _application_stylesheet.
+_IMAGE_WIDGET_QSS_TEMPLATE = """
+QLabel#imageLoader[state="empty"],
+QLabel#imageLoader[state="filled"] {{
+    background-color: {image_loader_bg};
+    border: 1px dashed {image_loader_border};
+    color: {label_color};
+    min-width: 120px;
+    min-height: 120px;
+    padding: 5px;
+}}
+QLabel#imageLoader[state="filled"] {{
+    border-style: solid;
+}}
+QLabel#imageLoader[state="empty"]:hover,
+QLabel#imageLoader[state="filled"]:hover {{
+    border-color: #FFFFFF;
+}}
+QLabel#imageLoader QPushButton#imageLoaderRemoveButton {{
+    background-color: #AA3333;
+    color: white;
+    border: 1px solid #AA3333;
+    border-radius: 11px;
+    padding: 1px;
+}}
+QLabel#imageLoader QPushButton#imageLoaderRemoveButton:hover {{
+    background-color: #CC4444;
+}}
+QLabel#imageLoader QPushButton#imageLoaderRemoveButton:pressed {{
+    background-color: #882222;
+}}
+QWidget QPushButton#actionIconButton {{
+    background-color: {button_bg};
+    color: {button_fg};
+    border: 1px solid {border_color};
+    padding: 2px;
+}}
+QWidget QPushButton#actionIconButton:hover {{
+    background-color: #6A6A6A;
+    border: 1px solid #777777;
+}}
+QWidget QPushButton#actionIconButton:pressed {{
+    background-color: #4E4E4E;
+}}
+QLabel#imageViewer[state="empty"],
+QLabel#imageViewer[state="filled"] {{
+    background-color: {viewer_bg};
+    color: {viewer_fg};
+    border: 1px dashed {border_color};
+}}
+QLabel#imageViewer[state="filled"] {{
+    border-style: solid;
+}}
+"""
+
+
+@functools.lru_cache(maxsize=8)
+def _application_stylesheet(palette_items: tuple) -> str:
+    # Dialogs rebuild the stylesheet every time they open; identical palettes
+    # share one formatted string.
+    palette = dict(palette_items)
     dialog_bg = palette.get("dialog_bg", palette.get("widget_bg", "#3C3F41"))
     text_color = palette.get("text_color", "#BBBBBB")
     panel_bg = palette.get("dialog_text_panel_bg", "#ECE7DB")
@@ -101,6 +205,16 @@ def build_application_stylesheet(app_palette=None) -> str:
     button_bg = palette.get("button_bg", "#555555")
     button_fg = palette.get("button_fg", text_color)
     input_bg = palette.get("editable_value_bg", "#313335")
+    image_widget_rules = _IMAGE_WIDGET_QSS_TEMPLATE.format(
+        image_loader_bg=palette.get("image_loader_bg", "#3A3A3A"),
+        image_loader_border=palette.get("image_loader_border", "#666666"),
+        label_color=palette.get("label_color", "#A0A0A0"),
+        button_bg=button_bg,
+        button_fg=palette.get("button_fg", "#D3D3D3"),
+        border_color=border_color,
+        viewer_bg=palette.get("widget_bg", "#2B2B2B"),
+        viewer_fg=palette.get("placeholder_text", "#808080"),
+    )
 
     return f"""
         QMessageBox, QInputDialog, QDialog#SpriteSagePopupDialog {{
@@ -187,39 +301,85 @@ def build_application_stylesheet(app_palette=None) -> str:
         QDialog#SpriteSagePopupDialog QProgressBar::chunk {{
             background-color: {palette.get('tree_item_selected_bg', '#5A7E9E')};
         }}
+        QPlainTextEdit#console {{
+            background-color: {palette.get('console_bg', '#313335')};
+            color: {text_color};
+            border: 1px solid {border_color};
+            font-family: Consolas, Courier New, monospace;
+        }}
+        QWidget#editorWidget,
+        QWidget#editorWidget QWidget {{
+            background-color: {palette.get('widget_bg', '#3C3F41')};
+        }}
+        QPlainTextEdit#mainEditor {{
+            background-color: {palette.get('widget_bg', '#3C3F41')};
+            color: {text_color};
+            border: 1px solid {border_color};
+            font-family: Consolas, Courier New, monospace;
+        }}
+        {image_widget_rules}
     """
 
 
 # --- Constants for Icon Handling ---
-# IMPORTANT: Adjust these paths to where your actual icon files are located!
-# Using Qt Resource System (qrc) is recommended for better deployment.
-FOLDER_ICON_PATH = os.path.join(GRAPHICS_DIR, "folder.png")
-IMAGE_ICON_PATH = os.path.join(GRAPHICS_DIR, "image.png")
-SPRITE_ICON_PATH = os.path.join(GRAPHICS_DIR, "sprite.png")
-SPRITESHEET_ICON_PATH = os.path.join(GRAPHICS_DIR, "spritesheet.png")
-UNKNOWN_ICON_PATH = os.path.join(GRAPHICS_DIR, "unknown.png")
+# Icons listed in graphics/graphics.qrc are served from the compiled Qt resource
+# module when it has been generated (see BUILD.md), and from GRAPHICS_DIR otherwise.
+try:
+    from . import resources_rc  # noqa: F401
+
+    HAS_QT_RESOURCES = True
+except ImportError:
+    HAS_QT_RESOURCES = False
+
+
+def icon_path(filename: str) -> str:
+    """Return the resource path for a bundled icon, or its file path as a fallback."""
+    if HAS_QT_RESOURCES:
+        return f":/graphics/{filename}"
+    return os.path.join(GRAPHICS_DIR, filename)
+
+
+FOLDER_ICON_PATH = icon_path("folder.png")
+IMAGE_ICON_PATH = icon_path("image.png")
+SPRITE_ICON_PATH = icon_path("sprite.png")
+SPRITESHEET_ICON_PATH = icon_path("spritesheet.png")
+UNKNOWN_ICON_PATH = icon_path("unknown.png")
 BUSY_GIF_PATH = os.path.join(GRAPHICS_DIR, "wizard.gif")
-ACTION_ICON_PATH = os.path.join(GRAPHICS_DIR, "inference.png")
+ACTION_ICON_PATH = icon_path("inference.png")
 IMAGE_GRID_ITEM_SIZE = 120  # Size for each cell in the image grid
+PIXMAP_CACHE_LIMIT_KB = 64 * 1024  # Decoded images kept in QPixmapCache
 
-EMPTY_SPRITE_TEMPLATE = {
-    "uuid": "",
-    "name": "",
-    "description": "",
-    "width": 256,
-    "height": 256,
-    "base_image": None,
-    "include_base_image_in_animations": True,
-    "animations": {},
-}
 
-EMPTY_SAGE_TEMPLATE = {
-    "Project Name": "",
-    "version": "1.0",
-    "createdAt": "",
-    "Project Description": "",
-    "Keywords": "",
-    "Reference Images": ["", "", "", ""],
-}
+@functools.cache
+def get_icon(path: str) -> QtGui.QIcon:
+    """Return a shared QIcon for path, constructed on first request."""
+    return QtGui.QIcon(path)
+
+
+def new_sprite_template() -> dict:
+    """Return a fresh, unshared dict for a new .sprite file."""
+    return {
+        "uuid": "",
+        "name": "",
+        "description": "",
+        "width": 256,
+        "height": 256,
+        "base_image": None,
+        "include_base_image_in_animations": True,
+        "animations": {},
+    }
+
+
+def new_sage_template() -> dict:
+    """Return a fresh, unshared dict for a new .sage project file."""
+    return {
+        "Project Name": "",
+        "version": "1.0",
+        "createdAt": "",
+        "Project Description": "",
+        "Keywords": "",
+        "Reference Images": ["", "", "", ""],
+    }
+
 
 MAX_UNDO_COUNT = 1000
@@ -15,24 +15,24 @@ class ConsoleWidget(QtWidgets.QPlainTextEdit):
     def __init__(self, palette, parent=None):
         super().__init__(parent)
         self.app_palette = palette
+        # Styled by the application-wide stylesheet (see build_application_stylesheet).
+        self.setObjectName("console")
         self.setReadOnly(True)
         self.setPlaceholderText("Console / Log Area")
         self.setMinimumSize(MIN_EDITOR_CONSOLE_WIDTH, MIN_EDITOR_CONSOLE_HEIGHT)
-        self._apply_styles()
         self.log_message("Console Initialized. Create or load a project.")
 
-    def _apply_styles(self):
-        self.setStyleSheet(f"""
-            QPlainTextEdit {{
-                background-color: {self.app_palette['console_bg']};
-                color: {self.app_palette['text_color']};
-                border: 1px solid {self.app_palette['placeholder_border']};
-                font-family: Consolas, Courier New, monospace; /* Added monospace font */
-            }}
-        """)
-
     def log_message(self, message):
+        self.log_messages([message])
+
+    def log_messages(self, messages):
+        """Append several messages with a single document update."""
+        if not messages:
+            return
         timestamp = time.strftime("%H:%M:%S")
-        self.appendPlainText(f"[{timestamp}] {message}")
-        # Ensure the latest message is visible
-        self.verticalScrollBar().setValue(self.verticalScrollBar().maximum())
+        scroll_bar = self.verticalScrollBar()
+        # Only follow the log if the user hasn't scrolled up to read earlier output.
+        at_bottom = scroll_bar.value() == scroll_bar.maximum()
+        self.appendPlainText("\n".join(f"[{timestamp}] {message}" for message in messages))
+        if at_bottom:
+            scroll_bar.setValue(scroll_bar.maximum())
@@ -4,63 +4,126 @@ Copyright © 2025 Keystone Intelligence LLC
 Licensed under GPL v3 (see LICENSE file for details)
 """
 
+from __future__ import annotations
+
+import functools
+import json
 import os
+from typing import TYPE_CHECKING, Callable
+
 from PySide6 import QtCore, QtWidgets
 
-from .image_viewer import ImageViewerWidget
-from .sage_editor import SageEditorView, SageFile
-from .sprite_editor import SpriteEditorView
+from .file_stat_cache import FileStatCache
+from .sage_file import SageFile
 from .config import MIN_EDITOR_CONSOLE_WIDTH, MIN_EDITOR_CONSOLE_HEIGHT
 from .undo_redo import UndoRedoState
 
+if TYPE_CHECKING:
+    from .console import ConsoleWidget
+    from .image_viewer import ImageViewerWidget
+    from .sage_editor import SageEditorView
+    from .sprite_editor import SpriteEditorView
+
 IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".bmp", ".gif", ".tiff", ".webp"}
 
 
+@functools.lru_cache(maxsize=32)
+def _read_sage_data(file_path: str, mtime_ns: int, size: int) -> dict:
+    # mtime_ns and size only key the cache so an edited file is parsed again.
+    with open(file_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _load_sage(file_path: str) -> SageFile:
+    """Parse a .sage file, reusing the last parse while the file is unchanged on disk."""
+    stat = os.stat(file_path)
+    # Build a fresh SageFile each time: the editor mutates the one it is given, and
+    # from_dict only reads the shared cached dict.
+    data = _read_sage_data(file_path, stat.st_mtime_ns, stat.st_size)
+    return SageFile.from_dict(data=data, filepath=file_path)
+
+
 class EditorWidget(QtWidgets.QWidget):
     undo_redo_state_changed = QtCore.Signal(object)
 
-    def __init__(self, palette, parent=None):
+    def __init__(self, palette, parent=None, console: ConsoleWidget | None = None):
         super().__init__(parent)
         self.app_palette = palette
+        self._console = console
         self.current_file_path = None
         self.project_file_path = None
+        # Styled by the application-wide stylesheet (see build_application_stylesheet).
+        self.setObjectName("editorWidget")
 
         self.plain_text_editor = QtWidgets.QPlainTextEdit()
+        self.plain_text_editor.setObjectName("mainEditor")
         self.plain_text_editor.setPlaceholderText(
             "Main Editor / Viewer Area\n\nUse 'File' menu or sidebar buttons\nto create or open a project."
         )
         self.plain_text_editor.setReadOnly(True)
 
-        self.sage_editor = SageEditorView(self.app_palette)
-        self.sage_editor.sprite_row_action.connect(self.load_file)
-        self.sage_editor.undo_redo_state_changed.connect(self._emit_undo_redo_state)
-
-        self.image_viewer = ImageViewerWidget(self.app_palette)
-
-        self.sprite_editor = SpriteEditorView(self.app_palette)
-        self.sprite_editor.return_to_sage.connect(self.load_file)
-        self.sprite_editor.undo_redo_state_changed.connect(self._emit_undo_redo_state)
-        self.sprite_editor.project_file_changed.connect(self._apply_project_change)
+        # The heavier views are built on first use (see the properties below).
+        self._sage_editor: SageEditorView | None = None
+        self._image_viewer: ImageViewerWidget | None = None
+        self._sprite_editor: SpriteEditorView | None = None
 
         self.stacked_layout = QtWidgets.QStackedLayout()
         self.stacked_layout.addWidget(self.plain_text_editor)
-        self.stacked_layout.addWidget(self.sage_editor)
-        self.stacked_layout.addWidget(self.image_viewer)
-        self.stacked_layout.addWidget(self.sprite_editor)
 
         main_layout = QtWidgets.QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.addLayout(self.stacked_layout)
 
         self.setMinimumSize(MIN_EDITOR_CONSOLE_WIDTH, MIN_EDITOR_CONSOLE_HEIGHT)
-        self._apply_styles()
+
+    @property
+    def sage_editor(self) -> SageEditorView:
+        return self._ensure_sage_editor()
+
+    @property
+    def image_viewer(self) -> ImageViewerWidget:
+        return self._ensure_image_viewer()
+
+    @property
+    def sprite_editor(self) -> SpriteEditorView:
+        return self._ensure_sprite_editor()
+
+    def _ensure_sage_editor(self) -> SageEditorView:
+        if self._sage_editor is None:
+            # Imported here so the AI and model-baking stack loads only when a project opens.
+            from .sage_editor import SageEditorView
+
+            self._sage_editor = SageEditorView(self.app_palette)
+            self._sage_editor.sprite_row_action.connect(self.load_file)
+            self._sage_editor.undo_redo_state_changed.connect(self._emit_undo_redo_state)
+            self.stacked_layout.addWidget(self._sage_editor)
+        return self._sage_editor
+
+    def _ensure_image_viewer(self) -> ImageViewerWidget:
+        if self._image_viewer is None:
+            from .image_viewer import ImageViewerWidget
+
+            self._image_viewer = ImageViewerWidget(self.app_palette)
+            self.stacked_layout.addWidget(self._image_viewer)
+        return self._image_viewer
+
+    def _ensure_sprite_editor(self) -> SpriteEditorView:
+        if self._sprite_editor is None:
+            from .sprite_editor import SpriteEditorView
+
+            self._sprite_editor = SpriteEditorView(self.app_palette)
+            self._sprite_editor.return_to_sage.connect(self.load_file)
+            self._sprite_editor.undo_redo_state_changed.connect(self._emit_undo_redo_state)
+            self._sprite_editor.project_file_changed.connect(self._apply_project_change)
+            self.stacked_layout.addWidget(self._sprite_editor)
+        return self._sprite_editor
 
     def undo_redo_state(self):
         current_widget = self.stacked_layout.currentWidget()
-        if current_widget == self.sprite_editor:
-            return self.sprite_editor.undo_redo_state()
-        if current_widget == self.sage_editor:
-            return self.sage_editor.undo_redo_state()
+        if self._sprite_editor is not None and current_widget == self._sprite_editor:
+            return self._sprite_editor.undo_redo_state()
+        if self._sage_editor is not None and current_widget == self._sage_editor:
+            return self._sage_editor.undo_redo_state()
         return UndoRedoState()
 
     def _emit_undo_redo_state(self, *_args):
@@ -74,17 +137,6 @@ class EditorWidget(QtWidgets.QWidget):
         self._emit_undo_redo_state()
         self._log_message(label)
 
-    def _apply_styles(self):
-        self.plain_text_editor.setStyleSheet(f"""
-            QPlainTextEdit {{
-                background-color: {self.app_palette['widget_bg']};
-                color: {self.app_palette['text_color']};
-                border: 1px solid {self.app_palette['placeholder_border']};
-                font-family: Consolas, Courier New, monospace;
-            }}
-        """)
-        self.setStyleSheet(f"background-color: {self.app_palette['widget_bg']};")
-
     def load_file(self, file_path: str | None):
         self.current_file_path = None
 
@@ -92,7 +144,7 @@ class EditorWidget(QtWidgets.QWidget):
             self.clear_editor()
             return
 
-        if not os.path.isfile(file_path):
+        if not FileStatCache.instance().is_file(file_path):
             self.plain_text_editor.setPlainText("")
             self.plain_text_editor.setPlaceholderText("Selected item is not a file.")
             self.plain_text_editor.setReadOnly(True)
@@ -100,24 +152,18 @@ class EditorWidget(QtWidgets.QWidget):
             self._emit_undo_redo_state()
             return
 
-        _, extension = os.path.splitext(file_path.lower())
+        extension = os.path.splitext(file_path)[1].lower()
 
         self.current_file_path = file_path  # Set path before trying to load
-        if extension == ".sage":
-            self._load_sage_file(file_path)
-        elif extension == ".sprite":
-            self._load_sprite_file(file_path)
-        elif extension in IMAGE_EXTENSIONS:
-            self._load_image_file(file_path)
-        else:
-            self._load_text_file(file_path)
+        _EXT_DISPATCH.get(extension, EditorWidget._load_text_file)(self, file_path)
 
     def _read_file_content(self, file_path: str) -> str:
-        with open(file_path, "r", encoding="utf-8") as f:
+        # Text mode decodes and translates every newline style to "\n" in one pass.
+        with open(file_path, encoding="utf-8") as f:
             return f.read()
 
     def _load_sage_file(self, file_path: str):
-        sage_file = SageFile.from_json(file_path)
+        sage_file = _load_sage(file_path)
         self.project_file_path = file_path
         self.sage_editor.load_data(sage_file)
         self.stacked_layout.setCurrentWidget(self.sage_editor)
@@ -146,9 +192,8 @@ class EditorWidget(QtWidgets.QWidget):
         self.project_file_path = project_file_path
 
     def _ensure_sage_context(self):
-        sage_file = self.sage_editor.sage_file
-        if sage_file is not None:
-            return sage_file
+        if self._sage_editor is not None and self._sage_editor.sage_file is not None:
+            return self._sage_editor.sage_file
         if not self.project_file_path or not os.path.isfile(self.project_file_path):
             return None
 
@@ -210,42 +255,45 @@ class EditorWidget(QtWidgets.QWidget):
         self._emit_undo_redo_state()
 
     def _log_message(self, message):
-        parent_widget = self.parent()
-        while parent_widget:
-            console_widget = getattr(parent_widget, "console_widget", None)
-            log_message = getattr(console_widget, "log_message", None)
-            if callable(log_message):
-                log_message(message)
-                return
-            parent_widget = parent_widget.parent()
-        print(f"LOG (Editor): {message}")
+        if self._console is not None:
+            self._console.log_message(message)
+        else:
+            print(f"LOG (Editor): {message}")
 
     def save(self):
         if not self.current_file_path:
             self._log_message("No file loaded to save.")
             return False
 
-        self.sage_editor.save()
-        self.sprite_editor.save()
+        current_widget = self.stacked_layout.currentWidget()
+        if self._sage_editor is not None and current_widget == self._sage_editor:
+            self._sage_editor.save()
+        elif self._sprite_editor is not None and current_widget == self._sprite_editor:
+            self._sprite_editor.save()
+        else:
+            return False
+        return True
 
     def undo(self):
-        if self.stacked_layout.currentWidget() == self.sprite_editor:
-            self.sprite_editor.undo()
-        elif self.stacked_layout.currentWidget() == self.sage_editor:
-            self.sage_editor.undo()
+        current_widget = self.stacked_layout.currentWidget()
+        if self._sprite_editor is not None and current_widget == self._sprite_editor:
+            self._sprite_editor.undo()
+        elif self._sage_editor is not None and current_widget == self._sage_editor:
+            self._sage_editor.undo()
         else:
             print("No redo command found for the current widget")
 
     def redo(self):
-        if self.stacked_layout.currentWidget() == self.sprite_editor:
-            self.sprite_editor.redo()
-        elif self.stacked_layout.currentWidget() == self.sage_editor:
-            self.sage_editor.redo()
+        current_widget = self.stacked_layout.currentWidget()
+        if self._sprite_editor is not None and current_widget == self._sprite_editor:
+            self._sprite_editor.redo()
+        elif self._sage_editor is not None and current_widget == self._sage_editor:
+            self._sage_editor.redo()
         else:
             print("No redo command found for the current widget")
 
     def export_project_to_godot(self):
-        if self.sage_editor.sage_file is None:
+        if self._sage_editor is None or self._sage_editor.sage_file is None:
             QtWidgets.QMessageBox.warning(
                 self,
                 "Export Project",
@@ -255,7 +303,10 @@ class EditorWidget(QtWidgets.QWidget):
         self.sage_editor._export_project_to_godot()
 
     def export_sprite_to_godot(self):
-        if self.stacked_layout.currentWidget() != self.sprite_editor:
+        if (
+            self._sprite_editor is None
+            or self.stacked_layout.currentWidget() != self._sprite_editor
+        ):
             QtWidgets.QMessageBox.warning(
                 self,
                 "Export Sprite",
@@ -263,3 +314,11 @@ class EditorWidget(QtWidgets.QWidget):
             )
             return
         self.sprite_editor.export_current_sprite_to_godot()
+
+
+# Extension -> EditorWidget loader; anything else opens as text.
+_EXT_DISPATCH: dict[str, Callable[[EditorWidget, str], None]] = {
+    ".sage": EditorWidget._load_sage_file,
+    ".sprite": EditorWidget._load_sprite_file,
+    **{extension: EditorWidget._load_image_file for extension in IMAGE_EXTENSIONS},
+}
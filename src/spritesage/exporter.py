@@ -4,7 +4,8 @@ Copyright © 2025 Keystone Intelligence LLC
 Licensed under GPL v3 (see LICENSE file for details)
 """
 
-import uuid
+import itertools
+import os
 from pathlib import Path
 from typing import Callable
 from .sprite_file import SpriteFile
@@ -13,6 +14,34 @@ from .utils import remove_background
 
 ProgressCallback = Callable[..., None]
 
+# Godot resource text templates, filled with %-formatting.
+_TRES_HEADER_TMPL = '[gd_resource type="SpriteFrames" load_steps=1 format=3 uid="%s"]\n\n'
+_TEXTURE_EXT_RES_TMPL = '[ext_resource type="Texture2D" uid="%s" path="%s" id="%s"]\n\n'
+_ATLAS_TMPL = (
+    '[sub_resource type="AtlasTexture" id="%s"]\n'
+    'atlas = ExtResource("%s")\n'
+    "region = Rect2(%d, %d, %d, %d)\n\n"
+)
+_ANIMATION_HEADER = '  {\n    "frames": [\n'
+_FRAME_TMPL = '      {\n        "duration": 1.0,\n        "texture": SubResource("%s")\n      },\n'
+_ANIMATION_FOOTER_TMPL = '    ],\n    "loop": true,\n    "name": &"%s",\n    "speed": 1.0\n  },\n'
+_TSCN_HEADER_TMPL = '[gd_scene load_steps=2 format=3 uid="%s"]\n\n'
+_ANIMATED_SPRITE_TMPL = (
+    '[ext_resource type="SpriteFrames" uid="%s" path="%s" id="%s"]\n\n'
+    '[node name="%s" type="AnimatedSprite2D"]\n'
+    'sprite_frames = ExtResource("%s")\n'
+    'animation = &"%s"\n'
+)
+_SPRITE2D_TMPL = (
+    '[ext_resource type="Texture2D" uid="%s" path="%s" id="%s"]\n\n'
+    '[node name="%s" type="Sprite2D"]\n'
+    'texture = ExtResource("%s")\n'
+)
+
+
+def _new_uid() -> str:
+    return f"uid://{os.urandom(6).hex()}"
+
 
 class GodotSpriteExporter:
     """
@@ -55,60 +84,50 @@ class GodotSpriteExporter:
         cols = sheet_size // w
 
         # 3) Prepare UIDs
-        tres_uid = f"uid://{uuid.uuid4().hex[:12]}"
-        texture_uid = f"uid://{uuid.uuid4().hex[:12]}"
+        tres_uid = _new_uid()
+        texture_uid = _new_uid()
         ext_res_id = "1"
-        sub_ids = [f"AtlasTexture_{uuid.uuid4().hex[:6]}" for _ in range(self.frame_count)]
+        # One random read for every frame; ids only need to be unique within this file.
+        raw = os.urandom(6 * self.frame_count)
+        sub_ids = [f"AtlasTexture_{raw[i:i + 6].hex()}" for i in range(0, len(raw), 6)]
 
-        # 4) Open .tres for writing
+        # 4) Build the .tres text and write it in one go
         tres_path = self.output_dir / f"{self.sprite_file.name}_frames.tres"
-        with open(tres_path, "w") as tres:
-            # Header
-            tres.write(
-                f'[gd_resource type="SpriteFrames" load_steps=1 format=3 uid="{tres_uid}"]\n\n'
-            )
+        parts: list[str] = []
+        ap = parts.append
+        # Header
+        ap(_TRES_HEADER_TMPL % tres_uid)
 
-            sheet_path = Path(sheet_png)
-            try:
-                rel = sheet_path.relative_to(self.output_dir)
-                godot_path = f"{rel.as_posix()}"
-            except ValueError:
-                godot_path = sheet_path.as_posix().replace("\\", "/")
-            tres.write(
-                f'[ext_resource type="Texture2D" uid="{texture_uid}" '
-                f'path="{godot_path}" id="{ext_res_id}"]\n\n'
-            )
-
-            # Subresources: one AtlasTexture per frame
-            for idx, sub_id in enumerate(sub_ids):
-                x = (idx % cols) * w
-                y = (idx // cols) * h
-                tres.write(f'[sub_resource type="AtlasTexture" id="{sub_id}"]\n')
-                tres.write(f'atlas = ExtResource("{ext_res_id}")\n')
-                tres.write(f"region = Rect2({x}, {y}, {w}, {h})\n\n")
-
-            # Resource block: animations array (JSON-style keys)
-            tres.write("[resource]\n")
-            tres.write("animations = [\n")
-
-            frame_idx = 0
-            for anim_name in sorted(self.sprite_file.animations.keys()):
-                frames = self.sprite_file.get_animation_playback_frames(anim_name)
-                tres.write("  {\n")
-                tres.write('    "frames": [\n')
-                for _ in frames:
-                    sub_id = sub_ids[frame_idx]
-                    tres.write("      {\n")
-                    tres.write('        "duration": 1.0,\n')
-                    tres.write(f'        "texture": SubResource("{sub_id}")\n')
-                    tres.write("      },\n")
-                    frame_idx += 1
-                tres.write("    ],\n")
-                tres.write('    "loop": true,\n')
-                tres.write(f'    "name": &"{anim_name}",\n')
-                tres.write('    "speed": 1.0\n')
-                tres.write("  },\n")
-            tres.write("]\n")
+        sheet_path = Path(sheet_png)
+        try:
+            rel = sheet_path.relative_to(self.output_dir)
+            godot_path = f"{rel.as_posix()}"
+        except ValueError:
+            godot_path = sheet_path.as_posix().replace("\\", "/")
+        ap(_TEXTURE_EXT_RES_TMPL % (texture_uid, godot_path, ext_res_id))
+
+        # Subresources: one AtlasTexture per frame
+        rows = -(-self.frame_count // cols)
+        regions = itertools.product(range(0, rows * h, h), range(0, cols * w, w))
+        for (y, x), sub_id in zip(regions, sub_ids, strict=False):
+            ap(_ATLAS_TMPL % (sub_id, ext_res_id, x, y, w, h))
+
+        # Resource block: animations array (JSON-style keys)
+        ap("[resource]\nanimations = [\n")
+
+        animations = [
+            (anim_name, self.sprite_file.get_animation_playback_frames(anim_name))
+            for anim_name in sorted(self.sprite_file.animations)
+        ]
+        frame_idx = 0
+        for anim_name, frames in animations:
+            ap(_ANIMATION_HEADER)
+            next_idx = frame_idx + len(frames)
+            parts.extend(_FRAME_TMPL % sub_id for sub_id in sub_ids[frame_idx:next_idx])
+            frame_idx = next_idx
+            ap(_ANIMATION_FOOTER_TMPL % anim_name)
+        ap("]\n")
+        tres_path.write_text("".join(parts), encoding="utf-8")
 
         # keep the SpriteFrames UID around for the .tscn
         self.tres_uid = tres_uid
@@ -118,10 +137,10 @@ class GodotSpriteExporter:
 
     def export_tscn(self):
         # generate a new UID for the scene
-        tscn_uid = f"uid://{uuid.uuid4().hex[:12]}"
+        tscn_uid = _new_uid()
 
         # make a fresh ext_resource id (so it's unique)
-        scene_ext_id = f"1_{uuid.uuid4().hex[:6]}"
+        scene_ext_id = f"1_{os.urandom(3).hex()}"
 
         # names & defaults
         name = self.sprite_file.name
@@ -130,17 +149,12 @@ class GodotSpriteExporter:
         default_anim = next(iter(self.sprite_file.animations.keys()))
 
         tscn_path = self.output_dir / f"{name}.tscn"
-        with open(tscn_path, "w") as tscn:
-            tscn.write(f'[gd_scene load_steps=2 format=3 uid="{tscn_uid}"]\n\n')
-            tscn.write(
-                f'[ext_resource type="SpriteFrames" '
-                f'uid="{self.tres_uid}" '
-                f'path="{tres_file}" '
-                f'id="{scene_ext_id}"]\n\n'
-            )
-            tscn.write(f'[node name="{name}" type="AnimatedSprite2D"]\n')
-            tscn.write(f'sprite_frames = ExtResource("{scene_ext_id}")\n')
-            tscn.write(f'animation = &"{default_anim}"\n')
+        tscn_path.write_text(
+            _TSCN_HEADER_TMPL % tscn_uid
+            + _ANIMATED_SPRITE_TMPL
+            % (self.tres_uid, tres_file, scene_ext_id, name, scene_ext_id, default_anim),
+            encoding="utf-8",
+        )
 
     def export_sprite2d(self):
         name = self.sprite_file.name
@@ -152,22 +166,17 @@ class GodotSpriteExporter:
         remove_background(src, dst)
 
         # prepare UIDs for scene and texture
-        tscn_uid = f"uid://{uuid.uuid4().hex[:12]}"
-        tex_uid = f"uid://{uuid.uuid4().hex[:12]}"
+        tscn_uid = _new_uid()
+        tex_uid = _new_uid()
         ext_id = "1"
 
         # write a minimal .tscn for Sprite2D
         tscn_path = self.output_dir / f"{name}.tscn"
-        with open(tscn_path, "w") as f:
-            f.write(f'[gd_scene load_steps=2 format=3 uid="{tscn_uid}"]\n\n')
-            f.write(
-                f'[ext_resource type="Texture2D" '
-                f'uid="{tex_uid}" '
-                f'path="{dst.name}" '
-                f'id="{ext_id}"]\n\n'
-            )
-            f.write(f'[node name="{name}" type="Sprite2D"]\n')
-            f.write(f'texture = ExtResource("{ext_id}")\n')
+        tscn_path.write_text(
+            _TSCN_HEADER_TMPL % tscn_uid
+            + _SPRITE2D_TMPL % (tex_uid, dst.name, ext_id, name, ext_id),
+            encoding="utf-8",
+        )
 
 
 class GodotProjectExporter:
@@ -0,0 +1,89 @@
+"""
+SPDX-License-Identifier: GPL-3.0-only
+Copyright © 2025 Keystone Intelligence LLC
+Licensed under GPL v3 (see LICENSE file for details)
+"""
+
+import os
+
+from PySide6 import QtCore
+
+
+class FileStatCache(QtCore.QObject):
+    """
+    Remembers which paths are known to be files or directories so repeated
+    editor navigation doesn't stat the same paths over and over.
+
+    Only positive answers are cached: a path that was missing is checked again
+    on the next call, so a file created and opened in the same event-loop turn
+    is never reported as missing. The parent directory of every cached path is
+    watched and its entries are dropped when files are added, removed or
+    renamed there; the watch goes away with the last cached entry under it.
+    """
+
+    _instance: "FileStatCache | None" = None
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._known_files: set[str] = set()
+        self._known_directories: set[str] = set()
+        self._watcher = QtCore.QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._invalidate_directory)
+
+    @classmethod
+    def instance(cls) -> "FileStatCache":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def is_file(self, path: str) -> bool:
+        return self._check(path, os.path.isfile, self._known_files)
+
+    def is_dir(self, path: str) -> bool:
+        return self._check(path, os.path.isdir, self._known_directories)
+
+    def _check(self, path: str, predicate, known: set[str]) -> bool:
+        key = os.path.abspath(path)
+        if key in known:
+            return True
+        if not predicate(key):
+            return False
+        known.add(key)
+        # The watcher drops directories that are deleted or renamed, so ask it rather than
+        # remembering what was added; a recreated directory is then watched again.
+        directory = os.path.dirname(key)
+        if directory not in self._watcher.directories():
+            self._watcher.addPath(directory)
+        return True
+
+    def invalidate(self, path: str | None = None) -> None:
+        """Forget one path, or everything when no path is given."""
+        if path is None:
+            self._known_files.clear()
+            self._known_directories.clear()
+            watched = self._watcher.directories()
+            if watched:
+                self._watcher.removePaths(watched)
+        else:
+            key = os.path.abspath(path)
+            self._known_files.discard(key)
+            self._known_directories.discard(key)
+            self._unwatch_if_unused(os.path.dirname(key))
+
+    def _invalidate_directory(self, directory: str) -> None:
+        directory = os.path.abspath(directory)
+        self._known_files = {
+            path for path in self._known_files if os.path.dirname(path) != directory
+        }
+        self._known_directories = {
+            path for path in self._known_directories if os.path.dirname(path) != directory
+        }
+        self._unwatch_if_unused(directory)
+
+    def _unwatch_if_unused(self, directory: str) -> None:
+        if directory not in self._watcher.directories():
+            return
+        for path in (*self._known_files, *self._known_directories):
+            if os.path.dirname(path) == directory:
+                return
+        self._watcher.removePath(directory)
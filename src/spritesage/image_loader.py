@@ -4,13 +4,177 @@ Copyright © 2025 Keystone Intelligence LLC
 Licensed under GPL v3 (see LICENSE file for details)
 """
 
+import functools
 import os
 import shutil
+from collections import OrderedDict
+from stat import S_ISREG
+from typing import Callable, cast
 from PySide6 import QtWidgets, QtGui, QtCore
 from PySide6.QtWidgets import QStyle, QMessageBox
 from PySide6.QtCore import Qt
 
-from .config import ACTION_ICON_PATH
+from .config import ACTION_ICON_PATH, get_icon
+from .file_stat_cache import FileStatCache
+
+_ASYNC_DECODE_MIN_BYTES = 1024 * 1024  # Larger files are decoded off the GUI thread
+
+
+def _decode_image(abs_path: str, max_size: QtCore.QSize | None = None) -> QtGui.QImage:
+    reader = QtGui.QImageReader(abs_path)
+    reader.setAutoTransform(True)
+    if max_size is not None:
+        source_size = reader.size()
+        if source_size.isValid() and (
+            source_size.width() > max_size.width() or source_size.height() > max_size.height()
+        ):
+            # Let the image plugin decode straight to the thumbnail resolution
+            reader.setScaledSize(source_size.scaled(max_size, Qt.AspectRatioMode.KeepAspectRatio))
+    return reader.read()
+
+
+def _decode_pixmap(abs_path: str, max_size: QtCore.QSize | None = None) -> QtGui.QPixmap:
+    image = _decode_image(abs_path, max_size)
+    return QtGui.QPixmap.fromImage(image) if not image.isNull() else QtGui.QPixmap()
+
+
+def scaled_for_display(
+    pixmap: QtGui.QPixmap,
+    size: QtCore.QSize,
+    dpr: float,
+    transformation: Qt.TransformationMode,
+) -> QtGui.QPixmap:
+    """
+    Scales pixmap to fit size (logical pixels) at device resolution and tags it
+    with dpr, so Qt paints it 1:1 instead of resampling again on HiDPI screens.
+    """
+    scaled = pixmap.scaled(size * dpr, Qt.AspectRatioMode.KeepAspectRatio, transformation)
+    scaled.setDevicePixelRatio(dpr)
+    return scaled
+
+
+class DebouncedRescaleMixin:
+    """
+    Resize handling shared by the image widgets: a cheap nearest-neighbour scale is
+    shown while the size keeps changing, and one smooth scale follows once it pauses.
+    Smooth scales are remembered per (width, height, dpr, pixmap cacheKey).
+    """
+
+    RESCALE_DEBOUNCE_MS = 16
+    _scaled_cache_size = 1  # Smooth scales kept; raise it for widgets that flip between sizes
+
+    def _init_rescale(self, smooth_slot: Callable[[], None]) -> None:
+        self._scaled_cache: OrderedDict[tuple[int, int, float, int], QtGui.QPixmap] = OrderedDict()
+        # Coalesces resize bursts into a single smooth rescale once resizing pauses
+        self._rescale_timer = QtCore.QTimer(cast(QtCore.QObject, self))
+        self._rescale_timer.setSingleShot(True)
+        self._rescale_timer.setInterval(self.RESCALE_DEBOUNCE_MS)
+        self._rescale_timer.timeout.connect(smooth_slot)
+
+    def _smooth_scaled(
+        self, pixmap: QtGui.QPixmap, size: QtCore.QSize, dpr: float
+    ) -> QtGui.QPixmap:
+        self._rescale_timer.stop()  # This smooth pass supersedes any pending settle pass
+        key = (size.width(), size.height(), dpr, pixmap.cacheKey())
+        scaled = self._scaled_cache.pop(key, None)
+        if scaled is None:
+            scaled = scaled_for_display(
+                pixmap, size, dpr, Qt.TransformationMode.SmoothTransformation
+            )
+        self._scaled_cache[key] = scaled
+        while len(self._scaled_cache) > self._scaled_cache_size:
+            self._scaled_cache.popitem(last=False)
+        return scaled
+
+    def _fast_scaled(
+        self,
+        pixmap: QtGui.QPixmap,
+        size: QtCore.QSize,
+        dpr: float,
+        source: QtGui.QPixmap | None = None,
+    ) -> QtGui.QPixmap:
+        """The remembered smooth scale if there is one, else a fast scale of source or pixmap."""
+        scaled = self._scaled_cache.get((size.width(), size.height(), dpr, pixmap.cacheKey()))
+        if scaled is not None:
+            return scaled
+        return scaled_for_display(
+            source if source is not None else pixmap,
+            size,
+            dpr,
+            Qt.TransformationMode.FastTransformation,
+        )
+
+    def _reset_rescale(self) -> None:
+        self._scaled_cache.clear()
+        self._rescale_timer.stop()
+
+
+def _pixmap_cache_key(
+    abs_path: str, stat: os.stat_result, max_size: QtCore.QSize | None = None
+) -> str:
+    key = f"{abs_path}:{stat.st_mtime_ns}:{stat.st_size}"
+    if max_size is not None:
+        key += f":{max_size.width()}x{max_size.height()}"
+    return key
+
+
+def cached_pixmap(abs_path: str, max_size: QtCore.QSize | None = None) -> QtGui.QPixmap:
+    """
+    Returns the decoded pixmap for abs_path, reusing the QPixmapCache entry
+    for as long as the file's mtime and size are unchanged. When max_size is
+    given, larger images are decoded directly at that bound (aspect ratio kept).
+    """
+    try:
+        stat = os.stat(abs_path)
+    except OSError:
+        return _decode_pixmap(abs_path, max_size)
+    key = _pixmap_cache_key(abs_path, stat, max_size)
+    pixmap = QtGui.QPixmapCache.find(key)
+    if pixmap is None:
+        pixmap = _decode_pixmap(abs_path, max_size)
+        if not pixmap.isNull():
+            QtGui.QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+class _ImageDecodeSignals(QtCore.QObject):
+    decoded = QtCore.Signal(str, str, QtGui.QImage)  # abs_path, cache key, image
+
+
+class _ImageDecodeJob(QtCore.QRunnable):
+    """Decodes an image into a QImage on a QThreadPool worker thread."""
+
+    def __init__(self, abs_path, max_size, cache_key, signals):
+        super().__init__()
+        self.abs_path = abs_path
+        self.max_size = max_size
+        self.cache_key = cache_key
+        self.signals = signals
+
+    def run(self):
+        image = _decode_image(self.abs_path, self.max_size)
+        try:
+            self.signals.decoded.emit(self.abs_path, self.cache_key, image)
+        except RuntimeError:
+            pass  # The requesting widget was destroyed while the image was decoding
+
+
+@functools.cache
+def _get_action_icon() -> QtGui.QIcon:
+    """Returns the icon shared by every ActionIconButton, resolving the fallback once."""
+    icon = get_icon(ACTION_ICON_PATH)
+    if icon.isNull():
+        # Fallback to a standard Qt icon if the custom one fails
+        print(f"Warning: Could not load action icon from {ACTION_ICON_PATH}. Using fallback.")
+        icon = QtWidgets.QApplication.style().standardIcon(
+            QStyle.StandardPixmap.SP_FileDialogDetailedView
+        )
+    return icon
+
+
+@functools.cache
+def _get_remove_icon() -> QtGui.QIcon:
+    return QtWidgets.QApplication.style().standardIcon(QStyle.StandardPixmap.SP_DialogCloseButton)
 
 
 class ActionIconButton(QtWidgets.QPushButton):
@@ -28,15 +192,7 @@ class ActionIconButton(QtWidgets.QPushButton):
         self.action_string = action_string
 
         # Use the common icon for all "action" buttons
-        # Use a standard icon if the path is invalid/placeholder
-        icon = QtGui.QIcon(ACTION_ICON_PATH)
-        if icon.isNull():
-            # Fallback to a standard Qt icon if the custom one fails
-            print(f"Warning: Could not load action icon from {ACTION_ICON_PATH}. Using fallback.")
-            icon = self.style().standardIcon(
-                QStyle.StandardPixmap.SP_FileDialogDetailedView
-            )  # Example fallback
-        self.setIcon(icon)
+        self.setIcon(_get_action_icon())
         self.setFixedSize(24, 24)
         # Either use the provided tooltip or the action_string
         self.setToolTip(tooltip if tooltip else action_string)
@@ -44,35 +200,16 @@ class ActionIconButton(QtWidgets.QPushButton):
         # Connect normal clicked signal to our custom signal with the action string
         self.clicked.connect(self._on_clicked)
 
-        # Apply initial styling
-        self._apply_styles()
+        # Styled by the application stylesheet (config.build_application_stylesheet)
+        self.setObjectName("actionIconButton")
 
     def _on_clicked(self):
         # Emit a signal that includes the action string
         self.clicked_with_action.emit(self.action_string)
 
-    def _apply_styles(self):
-        # Here, replicate any style that you want to use consistently for
-        # all action-icon buttons. You may adapt from your existing style methods.
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.app_palette.get('button_bg', '#555555')};
-                color: {self.app_palette.get('button_fg', '#D3D3D3')};
-                border: 1px solid {self.app_palette.get('placeholder_border', '#555555')};
-                padding: 2px;
-            }}
-            QPushButton:hover {{
-                background-color: #6A6A6A;
-                border: 1px solid #777777;
-            }}
-            QPushButton:pressed {{
-                background-color: #4E4E4E;
-            }}
-        """)
-
 
 # --- Custom Image Loader Widget (Generalized) ---
-class ImageLoaderWidget(QtWidgets.QLabel):
+class ImageLoaderWidget(DebouncedRescaleMixin, QtWidgets.QLabel):
     """
     A clickable label to load and display an image, handling file paths.
     Includes an overlay action button and a remove button.
@@ -90,6 +227,7 @@ class ImageLoaderWidget(QtWidgets.QLabel):
 
     _BUTTON_SIZE = 22  # Slightly smaller button for overlay
     _BUTTON_MARGIN = 3
+    _file_dialog: QtWidgets.QFileDialog | None = None  # Shared by every loader, see _image_dialog
 
     def __init__(self, base_dir, palette, index, parent=None):
         super().__init__(parent)
@@ -99,7 +237,16 @@ class ImageLoaderWidget(QtWidgets.QLabel):
         self.index = index
         self.image_path = None  # Relative path from base_dir
         self._absolute_path = None  # Absolute path (derived)
-        self._pixmap = None  # Store the original pixmap for rescaling
+        self._pixmap = None  # Thumbnail decoded at most at _decode_bound (device pixels)
+        self._decode_bound = None
+        self._loaded_cache_key = None  # Pixmap cache key of the file currently shown
+        self._last_button_layout = None  # (remove button x, remove button shown)
+        self._relpath_cache_key = None  # (absolute path, sage_dir) of the last relpath
+        self._relpath_cache_value = None
+        self._init_rescale(self._display_pixmap)
+
+        self._decode_signals = _ImageDecodeSignals(self)
+        self._decode_signals.decoded.connect(self._on_image_decoded)
 
         self.setFrameShape(QtWidgets.QFrame.Shape.Box)
         self.setFrameShadow(QtWidgets.QFrame.Shadow.Sunken)
@@ -119,49 +266,49 @@ class ImageLoaderWidget(QtWidgets.QLabel):
         self.action_button.clicked_with_action.connect(self._on_action_button_clicked)
         self.action_button.show()
 
-        # Remove Button (Top-Right)
-        self.remove_button = QtWidgets.QPushButton(self)
-        red_x_icon = self.style().standardIcon(QStyle.StandardPixmap.SP_DialogCloseButton)
-        self.remove_button.setIcon(red_x_icon)
-        self.remove_button.setFixedSize(self._BUTTON_SIZE, self._BUTTON_SIZE)
-        self.remove_button.setToolTip("Remove this image")
-        self.remove_button.setStyleSheet("""
-            QPushButton {
-                background-color: #AA3333;
-                color: white;
-                border: 1px solid #AA3333;
-                border-radius: 11px; /* half of _BUTTON_SIZE for a circular button */
-                padding: 1px;
-            }
-            QPushButton:hover {
-                background-color: #CC4444;
-            }
-            QPushButton:pressed {
-                background-color: #882222;
-            }
-        """)
-        self.remove_button.hide()
-        self.remove_button.clicked.connect(self._on_remove_button_clicked)
+        # Remove Button (Top-Right), built the first time an image path is set
+        self.remove_button: QtWidgets.QPushButton | None = None
 
-        self._apply_styles()
+        self.setObjectName("imageLoader")
+        self.setProperty("state", "empty")
+        self.ensurePolished()  # Apply the QSS min-size now rather than on first show
         self.clear_image(emit_signal=False)  # Don't emit signal on init
 
+    def _ensure_remove_button(self) -> QtWidgets.QPushButton:
+        if self.remove_button is None:
+            self.remove_button = QtWidgets.QPushButton(self)
+            self.remove_button.setIcon(_get_remove_icon())
+            self.remove_button.setFixedSize(self._BUTTON_SIZE, self._BUTTON_SIZE)
+            self.remove_button.setToolTip("Remove this image")
+            self.remove_button.setObjectName("imageLoaderRemoveButton")
+            self.remove_button.clicked.connect(self._on_remove_button_clicked)
+        return self.remove_button
+
     def _update_button_positions(self):
         """Handles visibility and positioning of overlay buttons."""
-        action_btn_x = self._BUTTON_MARGIN
-        action_btn_y = self._BUTTON_MARGIN
-        self.action_button.move(action_btn_x, action_btn_y)
-        self.action_button.raise_()
-
-        if self.image_path is not None:
-            remove_btn_x = self.width() - self.remove_button.width() - self._BUTTON_MARGIN
-            remove_btn_y = self._BUTTON_MARGIN
-            if not self.remove_button.isVisible():
-                self.remove_button.show()
-            self.remove_button.move(remove_btn_x, remove_btn_y)
-            self.remove_button.raise_()
-        else:
-            self.remove_button.hide()
+        show_remove = self.image_path is not None
+        remove_btn_x = self.width() - self._BUTTON_SIZE - self._BUTTON_MARGIN
+        layout = (remove_btn_x, show_remove)
+        if layout == self._last_button_layout:
+            return  # Nothing moved; skip the geometry/raise round-trips
+        self._last_button_layout = layout
+
+        self.setUpdatesEnabled(False)
+        try:
+            self.action_button.move(self._BUTTON_MARGIN, self._BUTTON_MARGIN)
+            self.action_button.raise_()
+
+            if show_remove:
+                remove_button = self._ensure_remove_button()
+                if not remove_button.isVisible():
+                    remove_button.show()
+                remove_button.move(remove_btn_x, self._BUTTON_MARGIN)
+                remove_button.raise_()
+            elif self.remove_button is not None:
+                self.remove_button.hide()
+        finally:
+            self.setUpdatesEnabled(True)
+        self.update()
 
     # RENAMED and SIMPLIFIED: No AI logic, just emit signal
     def _on_action_button_clicked(self, action_string: str):
@@ -169,7 +316,7 @@ class ImageLoaderWidget(QtWidgets.QLabel):
         # The action_string is passed by ActionIconButton, but we mainly care about the index
         print(f"ImageLoaderWidget {self.index} action button clicked.")
         # Check if base_dir is valid before emitting, as the action likely needs it
-        if not self.base_dir or not os.path.isdir(self.base_dir):
+        if not self.base_dir or not FileStatCache.instance().is_dir(self.base_dir):
             QMessageBox.warning(
                 self,
                 "Error",
@@ -180,25 +327,13 @@ class ImageLoaderWidget(QtWidgets.QLabel):
         self.action_clicked.emit(self.index)
 
     def _apply_styles(self):
-        # Styles remain largely the same
-        if self._pixmap and not self._pixmap.isNull():
-            border_style = "solid"
-        else:
-            border_style = "dashed"
-
-        self.setStyleSheet(f"""
-            ImageLoaderWidget {{
-                background-color: {self.app_palette.get('image_loader_bg', '#3A3A3A')};
-                border: 1px {border_style} {self.app_palette.get('image_loader_border', '#666666')};
-                color: {self.app_palette.get('label_color', '#A0A0A0')};
-                min-width: 120px;
-                min-height: 120px;
-                padding: 5px;
-            }}
-            ImageLoaderWidget:hover {{
-                border: 1px {border_style} #FFFFFF;
-            }}
-        """)
+        # Solid border once an image is shown, dashed while empty or broken.
+        # The rules live in the application stylesheet, keyed on the state property.
+        state = "filled" if self._pixmap and not self._pixmap.isNull() else "empty"
+        if self.property("state") != state:
+            self.setProperty("state", state)
+            self.style().unpolish(self)
+            self.style().polish(self)
 
     def load_image(self, relative_fpath: str | None):
         """
@@ -214,30 +349,34 @@ class ImageLoaderWidget(QtWidgets.QLabel):
         relative_fpath = relative_fpath.replace("\\", "/")  # Ensure consistent separators
         abs_path = os.path.abspath(os.path.join(self.base_dir, relative_fpath))
 
-        if os.path.isfile(abs_path):
-            loaded_pixmap = QtGui.QPixmap(abs_path)
+        try:
+            stat = os.stat(abs_path)  # One stat covers the existence check, size and cache key
+        except OSError:
+            stat = None
+
+        if stat is not None and S_ISREG(stat.st_mode):
+            # Decode at device resolution so HiDPI thumbnails are not upscaled later
+            max_size = self._available_size() * self.devicePixelRatioF()
+            cache_key = _pixmap_cache_key(abs_path, stat, max_size)
+            if (
+                relative_fpath == self.image_path
+                and cache_key == self._loaded_cache_key
+                and self._pixmap is not None
+            ):
+                return  # Already showing this revision of the file at this size
+            self._decode_bound = max_size
+            loaded_pixmap = QtGui.QPixmapCache.find(cache_key)
+            if loaded_pixmap is None:
+                if stat.st_size >= _ASYNC_DECODE_MIN_BYTES:
+                    self._start_async_decode(relative_fpath, abs_path, max_size, cache_key)
+                    return
+                loaded_pixmap = _decode_pixmap(abs_path, max_size)
+                if not loaded_pixmap.isNull():
+                    QtGui.QPixmapCache.insert(cache_key, loaded_pixmap)
             if not loaded_pixmap.isNull():
-                self.image_path = relative_fpath
-                self._absolute_path = abs_path
-                self._pixmap = loaded_pixmap
-                self._update_button_positions()
-                self._display_pixmap()
-                self.setToolTip(f"Image: {self.image_path}\nClick to change")
-                self.setStyleSheet(
-                    self.styleSheet().replace("border: 1px dashed", "border: 1px solid")
-                )
-                self.setText("")
+                self._show_loaded_pixmap(relative_fpath, abs_path, loaded_pixmap, cache_key)
             else:
-                # Invalid image file
-                self.image_path = relative_fpath  # Store the problematic path
-                self._absolute_path = abs_path
-                self._pixmap = None
-                self._update_button_positions()
-                self.setPixmap(QtGui.QPixmap())
-                self.setText(f"Invalid\nImage\n({os.path.basename(relative_fpath)})")
-                self.setToolTip(f"Failed to load image: {relative_fpath}\nExpected at: {abs_path}")
-                print(f"Warning: Could not load image file: {abs_path}")
-                self._apply_styles()  # Reapply dashed border
+                self._show_invalid_image(relative_fpath, abs_path)
         else:
             # File not found
             self.image_path = relative_fpath  # Store the missing path
@@ -250,18 +389,90 @@ class ImageLoaderWidget(QtWidgets.QLabel):
             print(f"Warning: Image file not found: {abs_path} (relative: {relative_fpath})")
             self._apply_styles()  # Reapply dashed border
 
+    def _show_loaded_pixmap(
+        self, relative_fpath: str, abs_path: str, pixmap: QtGui.QPixmap, cache_key: str
+    ):
+        self.image_path = relative_fpath
+        self._loaded_cache_key = cache_key
+        self._absolute_path = abs_path
+        self._pixmap = pixmap
+        self._update_button_positions()
+        self._display_pixmap()
+        self.setToolTip(f"Image: {self.image_path}\nClick to change")
+        self._apply_styles()
+        self.setText("")
+
+    def _show_invalid_image(self, relative_fpath: str, abs_path: str):
+        self.image_path = relative_fpath  # Store the problematic path
+        self._absolute_path = abs_path
+        self._pixmap = None
+        self._decode_bound = None
+        self._update_button_positions()
+        self.setPixmap(QtGui.QPixmap())
+        self.setText(f"Invalid\nImage\n({os.path.basename(relative_fpath)})")
+        self.setToolTip(f"Failed to load image: {relative_fpath}\nExpected at: {abs_path}")
+        print(f"Warning: Could not load image file: {abs_path}")
+        self._apply_styles()  # Reapply dashed border
+
+    def _start_async_decode(self, relative_fpath, abs_path, max_size, cache_key):
+        """Shows a placeholder and decodes a large image on the global thread pool."""
+        self.image_path = relative_fpath
+        self._absolute_path = abs_path
+        self._pixmap = None
+        self._update_button_positions()
+        self.setPixmap(QtGui.QPixmap())
+        self.setText("Loading...")
+        self.setToolTip(f"Loading image: {relative_fpath}")
+        QtCore.QThreadPool.globalInstance().start(
+            _ImageDecodeJob(abs_path, max_size, cache_key, self._decode_signals)
+        )
+
+    def _on_image_decoded(self, abs_path: str, cache_key: str, image: QtGui.QImage):
+        if abs_path != self._absolute_path or self.image_path is None:
+            return  # A later load_image/clear_image call superseded this decode
+        if image.isNull():
+            self._show_invalid_image(self.image_path, abs_path)
+            return
+        pixmap = QtGui.QPixmap.fromImage(image)
+        QtGui.QPixmapCache.insert(cache_key, pixmap)
+        self._show_loaded_pixmap(self.image_path, abs_path, pixmap, cache_key)
+
+    def _available_size(self) -> QtCore.QSize:
+        # Calculate available size inside border/padding (approximate)
+        content_margin = 2  # Adjust as needed based on border/padding visual inspection
+        return self.size() - QtCore.QSize(content_margin * 2, content_margin * 2)
+
+    def _display_fast_pixmap(self):
+        """Shows a cheap nearest-neighbour scale while a resize is in progress."""
+        if not self._pixmap or self._pixmap.isNull():
+            return
+        available_size = self._available_size()
+        if available_size.width() <= 0 or available_size.height() <= 0:
+            return
+        self.setPixmap(self._fast_scaled(self._pixmap, available_size, self.devicePixelRatioF()))
+
+    def _needs_larger_decode(self, target: QtCore.QSize) -> bool:
+        bound = self._decode_bound
+        if bound is None or not self._absolute_path or self._pixmap is None:
+            return False
+        if target.width() <= bound.width() and target.height() <= bound.height():
+            return False
+        # Only a thumbnail that was clipped by its bound gains detail from a re-read
+        return self._pixmap.width() >= bound.width() or self._pixmap.height() >= bound.height()
+
     def _display_pixmap(self):
         if self._pixmap and not self._pixmap.isNull():
-            # Calculate available size inside border/padding (approximate)
-            content_margin = 2  # Adjust as needed based on border/padding visual inspection
-            available_size = self.size() - QtCore.QSize(content_margin * 2, content_margin * 2)
+            available_size = self._available_size()
             if available_size.width() > 0 and available_size.height() > 0:
-                scaled_pixmap = self._pixmap.scaled(
-                    available_size,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation,
-                )
-                self.setPixmap(scaled_pixmap)
+                dpr = self.devicePixelRatioF()
+                target = available_size * dpr
+                if self._needs_larger_decode(target):
+                    # The slot outgrew the thumbnail; re-read the source at the new bound
+                    refreshed = cached_pixmap(self._absolute_path, max_size=target)
+                    if not refreshed.isNull():
+                        self._pixmap = refreshed
+                        self._decode_bound = target
+                self.setPixmap(self._smooth_scaled(self._pixmap, available_size, dpr))
             else:
                 self.setPixmap(QtGui.QPixmap())  # Clear if size is too small
         elif not self.image_path:  # No image path set, ensure placeholder text is shown
@@ -270,12 +481,14 @@ class ImageLoaderWidget(QtWidgets.QLabel):
         # else: Keep existing text ("Not Found", "Invalid Image") if path is set but pixmap is null
 
     def get_relative_path(self, sage_dir: str) -> str | None:
-        """Returns the currently stored relative image path."""
-        return (
-            self._absolute_path
-            if not self._absolute_path
-            else os.path.relpath(self._absolute_path, sage_dir)
-        )
+        """Returns the current image path relative to sage_dir, or None if no image is set."""
+        if not self._absolute_path:
+            return None
+        key = (self._absolute_path, sage_dir)
+        if self._relpath_cache_key != key:
+            self._relpath_cache_key = key
+            self._relpath_cache_value = os.path.relpath(self._absolute_path, sage_dir)
+        return self._relpath_cache_value
 
     def get_absolute_path(self) -> str | None:
         return self._absolute_path
@@ -286,6 +499,8 @@ class ImageLoaderWidget(QtWidgets.QLabel):
         self.image_path = None
         self._absolute_path = None
         self._pixmap = None
+        self._decode_bound = None
+        self._reset_rescale()
         self._update_button_positions()
         self.setPixmap(QtGui.QPixmap())
         self.setText(f"+ Add Image\n({self.index + 1})")
@@ -299,11 +514,12 @@ class ImageLoaderWidget(QtWidgets.QLabel):
     def resizeEvent(self, event: QtGui.QResizeEvent):
         super().resizeEvent(event)
         self._update_button_positions()
-        self._display_pixmap()  # Rescale pixmap on resize
+        self._display_fast_pixmap()  # Cheap preview while the size is still changing
+        self._rescale_timer.start()  # Smooth rescale once resizing pauses
 
     def mousePressEvent(self, event: QtGui.QMouseEvent):
         buttons_to_check: list[QtWidgets.QPushButton] = [self.action_button]
-        if self.remove_button.isVisible():
+        if self.remove_button is not None and self.remove_button.isVisible():
             buttons_to_check.append(self.remove_button)
 
         for button in buttons_to_check:
@@ -322,9 +538,23 @@ class ImageLoaderWidget(QtWidgets.QLabel):
         else:
             super().mousePressEvent(event)  # Handle other mouse buttons normally
 
+    @classmethod
+    def _image_dialog(cls) -> QtWidgets.QFileDialog:
+        """
+        Returns the file dialog shared by all loaders, creating it on first use.
+        It has no parent so it outlives the editor views that rebuild their loaders.
+        """
+        if cls._file_dialog is None:
+            dialog = QtWidgets.QFileDialog(None, "Select Reference Image")
+            dialog.setFileMode(QtWidgets.QFileDialog.FileMode.ExistingFile)
+            dialog.setNameFilter("Image Files (*.png *.jpg *.jpeg *.bmp *.gif *.tiff)")
+            dialog.setWindowModality(Qt.WindowModality.ApplicationModal)
+            cls._file_dialog = dialog
+        return cls._file_dialog
+
     def _select_image(self):
         """Handles the file dialog for selecting an image."""
-        if not self.base_dir or not os.path.isdir(self.base_dir):
+        if not self.base_dir or not FileStatCache.instance().is_dir(self.base_dir):
             print("Error: Base directory for image selection is not set or invalid.")
             QMessageBox.warning(
                 self, "Error", "Cannot select image: Project base directory is not valid."
@@ -333,15 +563,15 @@ class ImageLoaderWidget(QtWidgets.QLabel):
 
         # Prefer starting in 'reference_images' if it exists within base_dir
         start_dir = os.path.join(self.base_dir, "reference_images")
-        if not os.path.isdir(start_dir):
+        if not FileStatCache.instance().is_dir(start_dir):
             start_dir = self.base_dir  # Fallback to base_dir
 
-        fpath, _ = QtWidgets.QFileDialog.getOpenFileName(
-            self,
-            "Select Reference Image",
-            start_dir,
-            "Image Files (*.png *.jpg *.jpeg *.bmp *.gif *.tiff)",
-        )
+        dialog = self._image_dialog()
+        dialog.setDirectory(start_dir)
+        fpath = None
+        if dialog.exec() == QtWidgets.QDialog.DialogCode.Accepted:
+            selected = dialog.selectedFiles()
+            fpath = selected[0] if selected else None
 
         if fpath:
             fpath = os.path.abspath(fpath)
@@ -361,33 +591,30 @@ class ImageLoaderWidget(QtWidgets.QLabel):
                 # Paths are on different drives (Windows), needs copying
                 pass  # Handled below
 
-            if final_relative_path:
-                # Image is already within the project structure
-                self.load_image(final_relative_path)
-                self.image_updated.emit(self.image_path)  # Emit the confirmed relative path
-            else:
+            if not final_relative_path:
                 # Image is outside project or on different drive, copy it in
                 target_dir = os.path.join(self.base_dir, "reference_images")
                 try:
                     os.makedirs(target_dir, exist_ok=True)
                     base_filename = os.path.basename(fpath)
-                    target_fpath = os.path.join(target_dir, base_filename)
+                    # Ensure unique filename in target directory. One directory read
+                    # replaces a stat per candidate; names are casefolded so Windows
+                    # and macOS volumes never see a case-only clash as free.
+                    with os.scandir(target_dir) as entries:
+                        existing = {entry.name.casefold() for entry in entries}
+                    candidate = base_filename
                     counter = 1
-                    # Ensure unique filename in target directory
                     name, ext = os.path.splitext(base_filename)
-                    while os.path.exists(target_fpath):
-                        target_fpath = os.path.join(target_dir, f"{name}_{counter}{ext}")
+                    while candidate.casefold() in existing:
+                        candidate = f"{name}_{counter}{ext}"
                         counter += 1
+                    target_fpath = os.path.join(target_dir, candidate)
 
                     print(f"Copying selected image from '{fpath}' to '{target_fpath}'")
-                    shutil.copy2(fpath, target_fpath)  # Copy the file
-
-                    # Now calculate the relative path of the *copied* file to base_dir
-                    final_relative_path = os.path.relpath(target_fpath, self.base_dir).replace(
-                        "\\", "/"
-                    )
-                    self.load_image(final_relative_path)
-                    self.image_updated.emit(self.image_path)  # Emit the new relative path
+                    # copy2 already uses the kernel fast paths (sendfile on Linux,
+                    # fcopyfile on macOS, 1 MiB readinto buffers on Windows) and
+                    # copies metadata; a Python copyfileobj loop would be slower.
+                    shutil.copy2(fpath, target_fpath)
                 except OSError as e:
                     print(f"Error creating directory or copying file: {e}")
                     QMessageBox.critical(
@@ -395,6 +622,7 @@ class ImageLoaderWidget(QtWidgets.QLabel):
                         "File Error",
                         f"Could not copy image file to project directory.\nCheck permissions and path.\n\n{e}",
                     )
+                    return
                 except Exception as e:
                     print(f"Unexpected error during image copy: {e}")
                     QMessageBox.critical(
@@ -402,6 +630,15 @@ class ImageLoaderWidget(QtWidgets.QLabel):
                         "Copy Error",
                         f"An unexpected error occurred while copying the image:\n\n{e}",
                     )
+                    return
+                # The copy lives under base_dir, so its relative path needs no checks
+                final_relative_path = f"reference_images/{os.path.basename(target_fpath)}"
+
+            previous_path = self.image_path
+            self.load_image(final_relative_path)
+            # Notify once, and only when the slot now points at a different file
+            if self.image_path != previous_path:
+                self.image_updated.emit(self.image_path)
 
     # SIMPLIFIED: No direct save call, just clear and emit signal
     def _on_remove_button_clicked(self):
@@ -8,8 +8,10 @@ import os
 from PySide6 import QtWidgets, QtGui
 from PySide6.QtCore import Qt
 
+from .image_loader import DebouncedRescaleMixin, cached_pixmap
 
-class ImageViewerWidget(QtWidgets.QLabel):
+
+class ImageViewerWidget(DebouncedRescaleMixin, QtWidgets.QLabel):
     """
     A simple widget to display an image, scaling it to fit while preserving aspect ratio.
     """
@@ -19,25 +21,22 @@ class ImageViewerWidget(QtWidgets.QLabel):
         self.app_palette = palette
         self._pixmap = QtGui.QPixmap()  # Store the original pixmap
         self._current_path = None
+        self._init_rescale(self._display_scaled_pixmap)
 
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.setMinimumSize(100, 100)  # Set a reasonable minimum size
-        self._apply_styles()
+        self.setObjectName("imageViewer")
+        self.setProperty("state", "empty")
         self.setText("No Image Loaded")  # Placeholder text
 
     def _apply_styles(self):
-        self.setStyleSheet(f"""
-            QLabel {{
-                background-color: {self.app_palette.get('widget_bg', '#2B2B2B')};
-                color: {self.app_palette.get('placeholder_text', '#808080')};
-                border: 1px dashed {self.app_palette.get('placeholder_border', '#555555')};
-            }}
-        """)
-        # If an image is loaded, change border maybe?
-        if not self._pixmap.isNull():
-            self.setStyleSheet(self.styleSheet().replace("dashed", "solid"))
-        else:
-            self.setStyleSheet(self.styleSheet().replace("solid", "dashed"))
+        # Solid border while an image is shown, dashed otherwise. The rules live
+        # in the application stylesheet, keyed on the state property.
+        state = "empty" if self._pixmap.isNull() else "filled"
+        if self.property("state") != state:
+            self.setProperty("state", state)
+            self.style().unpolish(self)
+            self.style().polish(self)
 
     def load_image(self, file_path: str) -> bool:
         """
@@ -51,7 +50,7 @@ class ImageViewerWidget(QtWidgets.QLabel):
             self._apply_styles()  # Update border to dashed
             return False
 
-        loaded_pixmap = QtGui.QPixmap(file_path)
+        loaded_pixmap = cached_pixmap(os.path.abspath(file_path))
         if loaded_pixmap.isNull():
             self._pixmap = QtGui.QPixmap()  # Clear pixmap
             self._current_path = file_path  # Keep path for potential debugging
@@ -72,6 +71,7 @@ class ImageViewerWidget(QtWidgets.QLabel):
         """Clears the displayed image."""
         self._pixmap = QtGui.QPixmap()
         self._current_path = None
+        self._reset_rescale()
         self.setPixmap(QtGui.QPixmap())  # Clear the displayed pixmap
         self.setText("No Image Loaded")
         self.setToolTip("")
@@ -80,23 +80,24 @@ class ImageViewerWidget(QtWidgets.QLabel):
     def _display_scaled_pixmap(self):
         """Scales the stored pixmap to fit the widget size and displays it."""
         if self._pixmap.isNull():
+            self._rescale_timer.stop()
             self.setPixmap(QtGui.QPixmap())  # Ensure it's cleared if pixmap is null
             return
 
         # Scale pixmap to fit the label's current size, keeping aspect ratio
-        scaled_pixmap = self._pixmap.scaled(
-            self.size(),
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
-        )
-        self.setPixmap(scaled_pixmap)
+        self.setPixmap(self._smooth_scaled(self._pixmap, self.size(), self.devicePixelRatioF()))
+
+    def _display_fast_pixmap(self):
+        """Shows a cheap nearest-neighbour scale while a resize is in progress."""
+        self.setPixmap(self._fast_scaled(self._pixmap, self.size(), self.devicePixelRatioF()))
 
     def resizeEvent(self, event: QtGui.QResizeEvent):
         """Handle widget resize events to rescale the displayed image."""
         super().resizeEvent(event)
         # Only rescale if we have a valid pixmap loaded
         if not self._pixmap.isNull():
-            self._display_scaled_pixmap()
+            self._display_fast_pixmap()
+            self._rescale_timer.start()  # Smooth rescale once resizing pauses
 
     # Override mouse events if needed to prevent interactions,
     # but QLabel is generally non-interactive anyway.
@@ -6,26 +6,88 @@ Licensed under GPL v3 (see LICENSE file for details)
 
 from abc import ABC, abstractmethod
 from enum import Enum
+import concurrent.futures
+import contextlib
+import functools
+import hashlib
+import itertools
 import os
+import random
 import json
 import base64
 import mimetypes
-from datetime import datetime
-from typing import Any, List, Optional, cast
+import mmap
+import sys
+import threading
+import time
+from string import Template
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Iterable, List, Optional, TypeVar, cast
 from pydantic import BaseModel, Field
-from dataclasses import dataclass
-import openai
-from PIL import Image
+from dataclasses import asdict, dataclass
 from io import BytesIO
-import google.genai as genai
 
-from .config import SETTINGS_FILE_NAME, TESTING_PROVIDER_ENABLED
+if TYPE_CHECKING:
+    import google.genai as genai
+    import numpy as np
+    import openai
+
+# pybase64 is an optional SIMD base64 codec; fall back to the stdlib when absent.
+try:
+    from pybase64 import b64decode_as_bytearray as _b64decode
+    from pybase64 import b64encode_as_string as _b64encode_str
+
+    _B64_RELEASES_GIL = True
+except ImportError:
+    _B64_RELEASES_GIL = False
+
+    def _b64encode_str(data: bytes | mmap.mmap) -> str:
+        return base64.b64encode(data).decode("ascii")
+
+    def _b64decode(data: str) -> bytes:
+        return base64.b64decode(data)
+
+
+# orjson is optional as well; both paths produce the same compact, non-ASCII-escaped text.
+# Its decode errors subclass json.JSONDecodeError, so callers catch the same exceptions.
+try:
+    from orjson import dumps as _orjson_dumps
+    from orjson import loads as _json_loads
+
+    def _json_compact(value: Any) -> str:
+        return _orjson_dumps(value).decode("utf-8")
+
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_compact(value: Any) -> str:
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+from .config import (
+    RESPONSE_CACHE_DIR,
+    RESPONSE_CACHE_ENABLED,
+    RESPONSE_CACHE_SETTING,
+    SEMANTIC_CACHE_ENABLED,
+    SEMANTIC_CACHE_THRESHOLD,
+    SETTINGS_FILE_MAX_BYTES,
+    SETTINGS_FILE_NAME,
+    TESTING_PROVIDER_ENABLED,
+)
 from .ai_models import (
     GOOGLE_IMAGE_MODEL_SETTING,
     GOOGLE_TEXT_MODEL_SETTING,
     OPENAI_IMAGE_MODEL_SETTING,
     OPENAI_TEXT_MODEL_SETTING,
 )
+from .lazy_modules import lazy_module_getattr
+
+# The provider SDKs and PIL are imported by the code paths that use them, so a
+# session only pays for the provider it talks to. These names stay reachable as
+# module attributes (e.g. `inference.genai`) and are imported on first access.
+__getattr__ = lazy_module_getattr(
+    globals(), {"openai": "openai", "genai": "google.genai", "Image": "PIL.Image"}
+)
 
 
 # ---------------------------
@@ -48,100 +110,123 @@ class GameKeywordsOutput(BaseModel):
 # ---------------------------
 # Constant Templates & Context
 # ---------------------------
+# Shared leading block sent ahead of every request. Providers cache prompts by
+# exact prefix, so keep this text byte-identical and ahead of any images or
+# per-request content.
 GAME_ASSET_CONTEXT = """
 You are an AI assistant specialized in helping game developers conceptualize video games and generate ideas for sprites and 2D game assets. Your responses should be concise and focused on visual descriptions, mood, style, and elements relevant to 2D game art creation. Emphasize sprite design, pixel art, and other aspects unique to 2D games.
 """
 
-GENERATE_DESCRIPTION_PROMPT_TEMPLATE = """
-{context}
-
+GENERATE_DESCRIPTION_PROMPT_TEMPLATE = Template(
+    """
 Generate a compelling but short maximum 3 sentence description for a video game concept.
-{input_guidance}
+$input_guidance
 
 The description should be detailed enough to inspire visual ideas for the game assets such as sprite animations, pixel art characters, 2D environments, props, and effects.
 Output the description according to the required structured format.
 """
+)
 
-GENERATE_KEYWORDS_PROMPT_TEMPLATE = """
-{context}
-
+GENERATE_KEYWORDS_PROMPT_TEMPLATE = Template(
+    """
 Analyze the following video game description and extract a list of the most relevant keywords (around 5-10).
 
 Video Game Description:
-"{project_description}"
+"$project_description"
 
 Identify keywords covering the core themes, genre, art style, key visual elements (including sprite design, pixel art details, 2D backgrounds, and overall mood), and setting.
 These keywords should be concise and useful for searching, tagging, or generating sprites and other 2D game assets.
 Output the keywords as a list according to the required structured format.
 """
+)
 
-GENERATE_REFERENCE_IMAGE_PROMPT_TEMPLATE = """
-{context}
-
+GENERATE_REFERENCE_IMAGE_PROMPT_TEMPLATE = Template(
+    """
 Using the provided context about a video game concept, generate a new reference or style image. The generated image should align with the established style, themes, mood, and visual universe, yet capture a new conceptual perspective.
-{project_description}
-{keywords}
-{camera}
+$project_description
+$keywords
+$camera
 """
+)
 
-GENERATE_BASE_SPRITE_IMAGE_PROMPT_TEMPLATE = """
-{context}
-
+GENERATE_BASE_SPRITE_IMAGE_PROMPT_TEMPLATE = Template(
+    """
 Project Description:
-{project_description}
+$project_description
 
 Keywords:
-{keywords}
+$keywords
 
-Based on the style of the provided context, generate a detailed base sprite image of '{sprite_description}' on a plain white background.
-{camera}
+Based on the style of the provided context, generate a detailed base sprite image of '$sprite_description' on a plain white background.
+$camera
 """
+)
 
 # New Prompt Templates for Sprite Sequence Generation
-GENERATE_NEXT_SPRITE_IMAGE_PROMPT_TEMPLATE = """
-{context}
-
-Animation: {animation_name}
+GENERATE_NEXT_SPRITE_IMAGE_PROMPT_TEMPLATE = Template(
+    """
+Animation: $animation_name
 
 Based on the provided sprite image, generate the next sprite image for the animation sequence. Ensure continuity in visual style, movement, and thematic elements, including the plain white background.
-{camera}
+$camera
 """
+)
 
 
-GENERATE_SPRITE_BETWEEN_IMAGES_PROMPT_TEMPLATE = """
-{context}
-
-Given the two provided sprite images showing different frames of a {animation_name} animation 
+GENERATE_SPRITE_BETWEEN_IMAGES_PROMPT_TEMPLATE = Template(
+    """
+Given the two provided sprite images showing different frames of a $animation_name animation 
 generate a new intermediate frame that represents the midway pose between them.
 Blend the characters motion smoothly, adjust the body orientation appropriately, 
 and preserve the consistent 2D pixel art style, character proportions, and details such as the plain white background.
 The goal is to create a visually correct "in-between" frame that fits naturally between these two sprites in an animation sequence.
-{camera}
+$camera
 """
+)
 
-GENERATE_SPRITE_ANIMATION_SUGGESTION_PROMPT_TEMPLATE = """
-{context}
-
+GENERATE_SPRITE_ANIMATION_SUGGESTION_PROMPT_TEMPLATE = Template(
+    """
 Project Description:
-{project_description}
+$project_description
 
 Keywords:
-{keywords}
+$keywords
 
-Given the sprite description: '{sprite_description}', and current animation names: {current_animation_names}.
+Given the sprite description: '$sprite_description', and current animation names: $current_animation_names.
 
 Suggest an additional animation name that makes sense for this sprite and does not overlap any of its current animations.
 Provide the output as a single animation name with no other text. Make any spaces underscores.
 """
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _format_camera(camera: Optional[str]) -> str:
+    """Camera line for the prompts; cached because camera values come from a short pick list."""
+    if camera and camera.strip().lower() not in {"none", "null"}:
+        return f"\nCamera Perspective/Viewing Angle: {camera}"
+    return ""
+
+
+def _format_project_description(project_description: Optional[str]) -> str:
+    return f"\nProject Description:\n{project_description}" if project_description else ""
+
+
+def _format_keywords(keywords: Optional[str]) -> str:
+    return f"\nKeywords: {keywords}" if keywords else ""
 
 
 class BaseInferenceInput(ABC):
 
     @abstractmethod
     def to_prompt(self) -> str:
-        """Generate a prompt from this input object"""
+        """Generate the request-specific prompt; GAME_ASSET_CONTEXT is sent separately."""
         pass
 
+    def to_full_prompt(self) -> str:
+        """Shared context followed by the prompt, for endpoints without a system message."""
+        return GAME_ASSET_CONTEXT + self.to_prompt()
+
 
 @dataclass
 class GenerateDescriptionInput(BaseInferenceInput):
@@ -154,9 +239,7 @@ class GenerateDescriptionInput(BaseInferenceInput):
             if self.keywords and self.keywords.strip()
             else "Generate a description for an interesting video game concept (e.g., fantasy RPG, sci-fi exploration, cute puzzle game)."
         )
-        return GENERATE_DESCRIPTION_PROMPT_TEMPLATE.format(
-            context=GAME_ASSET_CONTEXT, input_guidance=input_guidance
-        )
+        return GENERATE_DESCRIPTION_PROMPT_TEMPLATE.substitute(input_guidance=input_guidance)
 
 
 @dataclass
@@ -165,8 +248,8 @@ class GenerateKeywordsInput(BaseInferenceInput):
     images: List[str]
 
     def to_prompt(self) -> str:
-        return GENERATE_KEYWORDS_PROMPT_TEMPLATE.format(
-            context=GAME_ASSET_CONTEXT, project_description=self.project_description
+        return GENERATE_KEYWORDS_PROMPT_TEMPLATE.substitute(
+            project_description=self.project_description
         )
 
 
@@ -179,19 +262,10 @@ class GenerateReferenceImageInput(BaseInferenceInput):
     camera: Optional[str]
 
     def to_prompt(self) -> str:
-        return GENERATE_REFERENCE_IMAGE_PROMPT_TEMPLATE.format(
-            context=GAME_ASSET_CONTEXT,
-            project_description=(
-                f"\nProject Description:\n{self.project_description}"
-                if self.project_description
-                else ""
-            ),
-            keywords=f"\nKeywords: {self.keywords}" if self.keywords else "",
-            camera=(
-                f"\nCamera Perspective/Viewing Angle: {self.camera}"
-                if self.camera and self.camera.strip().lower() not in {"none", "null"}
-                else ""
-            ),
+        return GENERATE_REFERENCE_IMAGE_PROMPT_TEMPLATE.substitute(
+            project_description=_format_project_description(self.project_description),
+            keywords=_format_keywords(self.keywords),
+            camera=_format_camera(self.camera),
         )
 
 
@@ -205,20 +279,11 @@ class GenerateBaseSpriteImageInput(BaseInferenceInput):
     camera: Optional[str]
 
     def to_prompt(self) -> str:
-        return GENERATE_BASE_SPRITE_IMAGE_PROMPT_TEMPLATE.format(
-            context=GAME_ASSET_CONTEXT,
-            project_description=(
-                f"\nProject Description:\n{self.project_description}"
-                if self.project_description
-                else ""
-            ),
-            keywords=f"\nKeywords: {self.keywords}" if self.keywords else "",
+        return GENERATE_BASE_SPRITE_IMAGE_PROMPT_TEMPLATE.substitute(
+            project_description=_format_project_description(self.project_description),
+            keywords=_format_keywords(self.keywords),
             sprite_description=self.sprite_description,
-            camera=(
-                f"\nCamera Perspective/Viewing Angle: {self.camera}"
-                if self.camera and self.camera.strip().lower() not in {"none", "null"}
-                else ""
-            ),
+            camera=_format_camera(self.camera),
         )
 
 
@@ -230,14 +295,9 @@ class GenerateNextSpriteImageInput(BaseInferenceInput):
     camera: str
 
     def to_prompt(self) -> str:
-        return GENERATE_NEXT_SPRITE_IMAGE_PROMPT_TEMPLATE.format(
-            context=GAME_ASSET_CONTEXT,
+        return GENERATE_NEXT_SPRITE_IMAGE_PROMPT_TEMPLATE.substitute(
             animation_name=self.animation_name,
-            camera=(
-                f"\nCamera Perspective/Viewing Angle: {self.camera}"
-                if self.camera and self.camera.strip().lower() not in {"none", "null"}
-                else ""
-            ),
+            camera=_format_camera(self.camera),
         )
 
 
@@ -249,14 +309,9 @@ class GenerateSpriteBetweenImagesInput(BaseInferenceInput):
     camera: str
 
     def to_prompt(self) -> str:
-        return GENERATE_SPRITE_BETWEEN_IMAGES_PROMPT_TEMPLATE.format(
-            context=GAME_ASSET_CONTEXT,
+        return GENERATE_SPRITE_BETWEEN_IMAGES_PROMPT_TEMPLATE.substitute(
             animation_name=self.animation_name,
-            camera=(
-                f"\nCamera Perspective/Viewing Angle: {self.camera}"
-                if self.camera and self.camera.strip().lower() not in {"none", "null"}
-                else ""
-            ),
+            camera=_format_camera(self.camera),
         )
 
 
@@ -269,19 +324,325 @@ class GenerateSpriteAnimationSuggestion(BaseInferenceInput):
     keywords: Optional[str]
 
     def to_prompt(self) -> str:
-        return GENERATE_SPRITE_ANIMATION_SUGGESTION_PROMPT_TEMPLATE.format(
-            context=GAME_ASSET_CONTEXT,
-            project_description=(
-                f"\nProject Description:\n{self.project_description}"
-                if self.project_description
-                else ""
-            ),
-            keywords=f"\nKeywords: {self.keywords}" if self.keywords else "",
+        return GENERATE_SPRITE_ANIMATION_SUGGESTION_PROMPT_TEMPLATE.substitute(
+            project_description=_format_project_description(self.project_description),
+            keywords=_format_keywords(self.keywords),
             sprite_description=self.sprite_description,
-            current_animation_names=json.dumps(self.animation_names),
+            current_animation_names=_json_compact(self.animation_names),
         )
 
 
+# ---------------------------
+# Response Cache
+# ---------------------------
+_response_memory: dict[str, str] = {}
+
+
+def _file_digest(path: str) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+    except OSError:
+        return "missing"
+    return digest.hexdigest()
+
+
+def _response_cache_key(client: "BaseAIClient", method_name: str, input: BaseInferenceInput) -> str:
+    """Hash the provider, models, request fields and the contents of every input image."""
+    fields = asdict(cast(Any, input))
+    image_paths = list(fields.get("images") or [])
+    if fields.get("image"):
+        image_paths.append(fields["image"])
+    key_data = {
+        "client": type(client).__name__,
+        "method": method_name,
+        "text_model": client.text_model,
+        "image_model": client.image_model,
+        "input": fields,
+        "images": [_file_digest(path) for path in image_paths],
+    }
+    payload = json.dumps(key_data, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=20).hexdigest()
+
+
+def _cache_entry_path(key: str) -> str:
+    # Fan entries out by key prefix so no single directory grows to thousands of files.
+    return os.path.join(RESPONSE_CACHE_DIR, key[:2], f"{key}.json")
+
+
+def _read_cached_response(key: str) -> Optional[str]:
+    if key in _response_memory:
+        return _response_memory[key]
+    try:
+        with open(_cache_entry_path(key), "rb") as f:
+            value = _json_loads(f.read()).get("value")
+    except (OSError, ValueError):
+        return None
+    if isinstance(value, str):
+        _response_memory[key] = value
+        return value
+    return None
+
+
+def _write_cached_response(key: str, value: str) -> None:
+    _response_memory[key] = value
+    path = _cache_entry_path(key)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"value": value}, f)
+    except OSError as e:
+        print(f"Warning: Could not write response cache entry: {e}")
+
+
+def _response_cache_enabled() -> bool:
+    try:
+        setting = _read_settings().get(RESPONSE_CACHE_SETTING)
+    except (OSError, ValueError):
+        setting = None
+    return setting if isinstance(setting, bool) else RESPONSE_CACHE_ENABLED
+
+
+def cached_response(method):
+    """
+    Serve a text generate_* method from the response cache when SPRITESAGE_CACHE is set,
+    or when the "Response Cache" setting turns it on.
+
+    Only successful results are stored. Image methods are never cached: generation is
+    non-deterministic, and repeating a request is how users re-roll a frame.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, input):
+        if not _response_cache_enabled():
+            return method(self, input)
+        key = _response_cache_key(self, method.__name__, input)
+        cached = _read_cached_response(key)
+        if cached is not None:
+            return cached
+        result = method(self, input)
+        if result is not None:
+            _write_cached_response(key, result)
+        return result
+
+    return wrapper
+
+
+class SemanticSuggestionCache:
+    """
+    In-memory store of (prompt embedding, suggestion) pairs searched by cosine similarity.
+
+    Embeddings are unit-normalised and scalar-quantised to int8 with one scale per
+    row, a quarter of the float32 footprint. Dot products accumulate exactly in
+    int32 and are rescaled to floats only for the threshold comparison.
+    """
+
+    def __init__(self, threshold: float = SEMANTIC_CACHE_THRESHOLD):
+        self.threshold = threshold
+        self._rows: list[np.ndarray] = []
+        self._scales: list[float] = []
+        self._suggestions: list[str] = []
+        self._matrix: Optional[np.ndarray] = None
+        self._scale_vector: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self._suggestions)
+
+    @staticmethod
+    def _quantise(embedding) -> "Optional[tuple[np.ndarray, float]]":
+        # numpy is only needed once the opt-in cache is in use, so keep it off import time.
+        import numpy as np
+
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if vector.ndim != 1 or norm == 0.0:
+            return None
+        vector = vector / norm
+        scale = float(np.abs(vector).max()) / 127.0
+        return np.round(vector / scale).astype(np.int8), scale
+
+    def add(self, embedding, suggestion: str) -> None:
+        quantised = self._quantise(embedding)
+        if quantised is None or (self._rows and quantised[0].shape != self._rows[0].shape):
+            return
+        self._rows.append(quantised[0])
+        self._scales.append(quantised[1])
+        self._suggestions.append(suggestion)
+        self._matrix = None
+
+    def lookup(self, embedding, exclude: Iterable[str] = ()) -> Optional[str]:
+        """Best stored suggestion at or above the threshold that is not in `exclude`."""
+        quantised = self._quantise(embedding)
+        if quantised is None or not self._rows or quantised[0].shape != self._rows[0].shape:
+            return None
+        import numpy as np
+
+        if self._matrix is None:
+            self._matrix = np.stack(self._rows)
+            self._scale_vector = np.asarray(self._scales, dtype=np.float32)
+        query, query_scale = quantised
+        dots = self._matrix.astype(np.int32) @ query.astype(np.int32)
+        similarities = dots * (cast(np.ndarray, self._scale_vector) * query_scale)
+        excluded = set(exclude)
+        for index in np.argsort(similarities)[::-1]:
+            if similarities[index] < self.threshold:
+                break
+            if self._suggestions[index] not in excluded:
+                return self._suggestions[index]
+        return None
+
+
+# One cache per provider and embedding model, since their vector spaces differ.
+_semantic_caches: dict[tuple[str, str], SemanticSuggestionCache] = {}
+
+
+def semantic_cached_suggestion(method):
+    """
+    Reuse an earlier animation suggestion whose prompt embedding is nearly identical.
+
+    Active only when SPRITESAGE_SEMANTIC_CACHE is set and the client can embed text;
+    a suggestion already among the sprite's animations is never returned.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, input):
+        if not SEMANTIC_CACHE_ENABLED:
+            return method(self, input)
+        embedding = self._embed_text(input.to_prompt())
+        if embedding is None:
+            return method(self, input)
+        cache = _semantic_caches.setdefault(
+            (type(self).__name__, self.embedding_model), SemanticSuggestionCache()
+        )
+        cached = cache.lookup(embedding, exclude=input.animation_names)
+        if cached is not None:
+            return cached
+        result = method(self, input)
+        if result:
+            cache.add(embedding, result)
+        return result
+
+    return wrapper
+
+
+# ---------------------------
+# Output Paths
+# ---------------------------
+_SAFE_NAME_TABLE = {i: "_" for i in range(128) if not chr(i).isalnum()}
+
+
+def _safe_name(value: str, limit: int = 20) -> str:
+    """First `limit` characters of value with every non-alphanumeric character replaced by '_'."""
+    value = value[:limit]
+    if value.isascii():
+        return value.translate(_SAFE_NAME_TABLE)
+    return "".join(c if c.isalnum() else "_" for c in value)
+
+
+_output_sequence = itertools.count()
+
+
+def _timestamp() -> str:
+    """Wall-clock stamp plus a process-wide sequence number, unique even within one second."""
+    return f"{time.strftime('%Y_%m_%d_%H_%M_%S')}_{next(_output_sequence):06d}"
+
+
+def _timestamped_image_path(output_folder: str, stem: str) -> str:
+    return os.path.join(output_folder, f"{stem}_{_timestamp()}.png")
+
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def _write_image_bytes(image_bytes: bytes, img_fpath: str) -> None:
+    """Write PNG data as-is; only other formats are decoded and re-encoded through PIL."""
+    if image_bytes.startswith(_PNG_SIGNATURE):
+        # A buffered file writes the whole payload; a raw one may stop short.
+        with open(img_fpath, "wb") as f:
+            f.write(image_bytes)
+    else:
+        from PIL import Image
+
+        Image.open(BytesIO(image_bytes)).save(img_fpath)
+
+
+def _persist_image(image_bytes: bytes, output_folder: str, stem: str) -> str:
+    """Save generated image data under a fresh timestamped name and return its path."""
+    os.makedirs(output_folder, exist_ok=True)
+    img_fpath = _timestamped_image_path(output_folder, stem)
+    _write_image_bytes(image_bytes, img_fpath)
+    return img_fpath
+
+
+# ---------------------------
+# Transient Error Retries
+# ---------------------------
+_T = TypeVar("_T")
+_Model = TypeVar("_Model", bound=BaseModel)
+
+RETRY_ATTEMPTS = 4
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+
+
+def _is_transient_error(error: Exception) -> bool:
+    """Rate limits, timeouts and 5xx responses are worth another attempt; anything else is not."""
+    if isinstance(error, TimeoutError):
+        return True
+    # An SDK that was never imported cannot have raised, so only check loaded ones.
+    openai = sys.modules.get("openai")
+    if openai is not None and isinstance(
+        error,
+        (
+            openai.RateLimitError,
+            openai.APITimeoutError,
+            openai.APIConnectionError,
+            openai.InternalServerError,
+        ),
+    ):
+        return True
+    genai_errors = sys.modules.get("google.genai.errors")
+    if genai_errors is None:
+        return False
+    if isinstance(error, genai_errors.ServerError):
+        return True
+    return isinstance(error, genai_errors.ClientError) and getattr(error, "code", None) == 429
+
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """Read the server's requested back-off from a Retry-After header, when it sent one."""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if headers is None:
+        return None
+    try:
+        return max(0.0, float(headers.get("retry-after")))
+    except (TypeError, ValueError):
+        # Missing, or an HTTP date; fall back to our own schedule.
+        return None
+
+
+def _with_retries(call: Callable[[], _T]) -> _T:
+    """Run a provider request, retrying transient failures with jittered exponential backoff."""
+    attempt = 1
+    while True:
+        try:
+            return call()
+        except Exception as e:
+            if attempt >= RETRY_ATTEMPTS or not _is_transient_error(e):
+                raise
+            retry_after = _retry_after_seconds(e)
+            if retry_after is not None:
+                wait = min(RETRY_MAX_DELAY, retry_after)
+            else:
+                delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** (attempt - 1))
+                wait = random.uniform(delay / 2, delay)
+            print(f"Transient API error ({e}); retrying in {wait:.0f}s.")
+            time.sleep(wait)
+            attempt += 1
+
+
 # ---------------------------
 # Base AI Client Abstraction
 # ---------------------------
@@ -291,6 +652,25 @@ class BaseAIClient(ABC):
         self.image_model = image_model
         self.api_key = api_key
 
+    embedding_model = ""
+
+    def _embed_text(self, text: str) -> Optional[List[float]]:
+        """Embedding of `text` for the semantic cache, or None when unsupported or failing."""
+        return None
+
+    def close(self) -> None:
+        """Release the provider SDK client, if one was created."""
+        client = self.__dict__.pop("_client", None)
+        close = getattr(client, "close", None)
+        if close is not None:
+            close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     @abstractmethod
     def generate_description(self, input: GenerateDescriptionInput) -> Optional[str]:
         """Generate a project description based on keywords and/or images."""
@@ -330,21 +710,69 @@ class BaseAIClient(ABC):
         """Generate a suggested animation name for this sprite."""
         pass
 
-
 # ---------------------------
 # OpenAI Client Implementation
 # ---------------------------
+OPENAI_IMAGE_EDIT_MAX_BYTES = 25 * 1024 * 1024
+# Per-attempt limit; image edits can legitimately take a couple of minutes. Retries are left
+# to _with_retries, so the SDK's own retry loop is switched off instead of stacking on it.
+OPENAI_REQUEST_TIMEOUT = 180.0
+
+# Shared by every client. pybase64 releases the GIL while encoding, so reference images
+# encode in parallel; the stdlib codec holds it, so without pybase64 they encode inline.
+_IMAGE_ENCODE_POOL = concurrent.futures.ThreadPoolExecutor(
+    max_workers=8, thread_name_prefix="image-encode"
+)
+
+# Below this size a plain read() is cheaper than setting up a mapping.
+_MMAP_MIN_BYTES = 64 * 1024
+
+_IMAGE_MIME_TYPES = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+    ".bmp": "image/bmp",
+}
+
+
 class OpenAIClient(BaseAIClient):
+    embedding_model = "text-embedding-3-small"
+
     def __init__(self, text_model="", image_model="", api_key=None):
         super().__init__(text_model, image_model, api_key)
 
+    @functools.cached_property
+    def _client(self) -> "openai.OpenAI":
+        # Built on first use and kept, so consecutive requests share one connection pool.
+        import openai
+
+        return openai.OpenAI(
+            api_key=self.api_key or openai.api_key,
+            timeout=OPENAI_REQUEST_TIMEOUT,
+            max_retries=0,
+        )
+
+    def _embed_text(self, text: str) -> Optional[List[float]]:
+        try:
+            response = self._client.embeddings.create(model=self.embedding_model, input=text)
+            return list(response.data[0].embedding)
+        except Exception as e:
+            print(f"Warning: Could not embed prompt for the semantic cache: {e}")
+            return None
+
     @staticmethod
     def _process_image(image_path: str) -> Optional[str]:
         """Helper to verify image file, deduce its MIME type and return a Base64-encoded data URL."""
-        if not os.path.exists(image_path):
+        try:
+            size = os.stat(image_path).st_size
+        except OSError:
             print(f"Warning: File not found at '{image_path}'. Skipping.")
             return None
-        mime_type, _ = mimetypes.guess_type(image_path)
+        mime_type = _IMAGE_MIME_TYPES.get(os.path.splitext(image_path)[1].lower())
+        if mime_type is None:
+            mime_type, _ = mimetypes.guess_type(image_path)
         if not mime_type or not mime_type.startswith("image/"):
             print(
                 f"Warning: Skipping '{os.path.basename(image_path)}'. Unsupported file type: {mime_type or 'unknown'}"
@@ -352,7 +780,12 @@ class OpenAIClient(BaseAIClient):
             return None
         try:
             with open(image_path, "rb") as img_file:
-                base64_image = base64.b64encode(img_file.read()).decode("utf-8")
+                if size < _MMAP_MIN_BYTES:
+                    base64_image = _b64encode_str(img_file.read())
+                else:
+                    # Encode straight from the page cache rather than copying into bytes first.
+                    with mmap.mmap(img_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        base64_image = _b64encode_str(mapped)
             return f"data:{mime_type};base64,{base64_image}"
         except Exception as e:
             print(f"Error processing image '{os.path.basename(image_path)}': {e}. Skipping.")
@@ -362,50 +795,38 @@ class OpenAIClient(BaseAIClient):
     def _build_user_content(prompt: str, images: List[str]) -> List[dict]:
         """Compose the user_content list by prepending image data if available."""
         user_content = [{"type": "input_text", "text": prompt}]
-        for image_path in images:
-            data_url = OpenAIClient._process_image(image_path)
+        if _B64_RELEASES_GIL and len(images) > 1:
+            data_urls = list(_IMAGE_ENCODE_POOL.map(OpenAIClient._process_image, images))
+        else:
+            data_urls = [OpenAIClient._process_image(image_path) for image_path in images]
+        for image_path, data_url in zip(images, data_urls, strict=True):
             if data_url:
                 user_content.insert(0, {"type": "input_image", "image_url": data_url})
                 print(f"Successfully added image '{os.path.basename(image_path)}' to the request.")
         return user_content
 
     @staticmethod
-    def _response_text_format(schema_model: type[BaseModel], name: str) -> dict:
-        schema = schema_model.model_json_schema()
-        schema["additionalProperties"] = False
-        return {
-            "format": {
-                "type": "json_schema",
-                "name": name,
-                "schema": schema,
-                "strict": True,
-            }
-        }
-
-    def _create_structured_response(
-        self,
-        prompt: str,
-        images: List[str],
-        schema_model: type[BaseModel],
-        schema_name: str,
-    ):
-        return openai.responses.create(
-            model=self.text_model,
-            input=cast(
-                Any,
-                [{"role": "user", "content": self._build_user_content(prompt, images)}],
-            ),
-            text=cast(Any, self._response_text_format(schema_model, schema_name)),
+    def _build_input(prompt: str, images: List[str]) -> List[dict]:
+        """System message with the shared context first, so the cached prefix never varies."""
+        return [
+            {"role": "system", "content": [{"type": "input_text", "text": GAME_ASSET_CONTEXT}]},
+            {"role": "user", "content": OpenAIClient._build_user_content(prompt, images)},
+        ]
+
+    def _parse_structured_response(
+        self, prompt: str, images: List[str], schema_model: type[_Model]
+    ) -> _Model:
+        """Request schema-constrained output and return the SDK's already-validated model."""
+        request_input = cast(Any, self._build_input(prompt, images))
+        response = _with_retries(
+            lambda: self._client.responses.parse(
+                model=self.text_model, input=request_input, text_format=schema_model
+            )
         )
-
-    @staticmethod
-    def _save_image_base64(image_base64: str, output_folder: str, filename_prefix: str) -> str:
-        image_bytes = base64.b64decode(image_base64)
-        timestamp = datetime.now().strftime("%Y_%m_%d_%H_%M_%S")
-        img_fpath = os.path.join(output_folder, f"{filename_prefix}_{timestamp}.png")
-        with open(img_fpath, "wb") as f:
-            f.write(image_bytes)
-        return img_fpath
+        parsed = response.output_parsed
+        if parsed is None:
+            raise RuntimeError("OpenAI returned no structured output.")
+        return parsed
 
     def _generate_or_edit_image(
         self,
@@ -414,115 +835,107 @@ class OpenAIClient(BaseAIClient):
         filename_prefix: str,
         image_paths: Optional[List[str]] = None,
     ) -> str:
-        os.makedirs(output_folder, exist_ok=True)
-        image_paths = image_paths or []
-        files = []
-        try:
-            if image_paths:
-                files = [open(path, "rb") for path in image_paths]
-                result = openai.images.edit(
-                    model=self.image_model,
-                    prompt=prompt,
-                    image=cast(Any, files),
-                    n=1,
-                    size="1024x1024",
+        image_bytes = self._generate_or_edit_image_bytes(prompt, image_paths or [])
+        return _persist_image(image_bytes, output_folder, filename_prefix)
+
+    def _generate_or_edit_image_bytes(
+        self,
+        prompt: str,
+        image_paths: List[str],
+    ) -> bytes:
+        """Run an image generate/edit request and return the decoded PNG without touching disk."""
+        # Reject oversized inputs before uploading anything the API would refuse.
+        for path in image_paths:
+            if os.path.getsize(path) > OPENAI_IMAGE_EDIT_MAX_BYTES:
+                raise ValueError(
+                    f"'{os.path.basename(path)}' is larger than the "
+                    f"{OPENAI_IMAGE_EDIT_MAX_BYTES // (1024 * 1024)} MB image edit limit."
                 )
-            else:
-                result = openai.images.generate(
+
+        def request():
+            # Files are reopened per attempt so a retry never uploads from a consumed handle.
+            with contextlib.ExitStack() as stack:
+                if image_paths:
+                    files = [stack.enter_context(open(path, "rb")) for path in image_paths]
+                    return self._client.images.edit(
+                        model=self.image_model,
+                        prompt=prompt,
+                        image=cast(Any, files),
+                        n=1,
+                        size="1024x1024",
+                    )
+                return self._client.images.generate(
                     model=self.image_model,
                     prompt=prompt,
                     n=1,
                     size="1024x1024",
                 )
-            if not result.data or not result.data[0].b64_json:
-                raise RuntimeError("OpenAI image generation returned no image data.")
-            return self._save_image_base64(result.data[0].b64_json, output_folder, filename_prefix)
-        finally:
-            for file in files:
-                file.close()
 
+        result = _with_retries(request)
+        if not result.data or not result.data[0].b64_json:
+            raise RuntimeError("OpenAI image generation returned no image data.")
+        return cast(bytes, _b64decode(result.data[0].b64_json))
+
+    @cached_response
     def generate_description(self, input: GenerateDescriptionInput) -> Optional[str]:
         # Prepare prompt with optional guidance.
         prompt = input.to_prompt()
         try:
-            response = self._create_structured_response(
-                prompt, input.images, GameDescriptionOutput, "game_description"
-            )
-            parsed = GameDescriptionOutput.model_validate_json(response.output_text)
+            parsed = self._parse_structured_response(prompt, input.images, GameDescriptionOutput)
             return parsed.description
         except Exception as e:
             print(f"Error calling OpenAI for description: {e}")
             return None
 
+    @cached_response
     def generate_keywords(self, input: GenerateKeywordsInput) -> Optional[str]:
         prompt = input.to_prompt()
         try:
-            response = self._create_structured_response(
-                prompt, input.images, GameKeywordsOutput, "game_keywords"
-            )
-            parsed = GameKeywordsOutput.model_validate_json(response.output_text)
+            parsed = self._parse_structured_response(prompt, input.images, GameKeywordsOutput)
             return parsed.keywords
         except Exception as e:
             print(f"Error calling OpenAI for keywords: {e}")
             return None
 
-    def generate_reference_image(self, input: GenerateReferenceImageInput) -> Optional[str]:
-        prompt = input.to_prompt()
+    def _run_image_edit(
+        self, input: BaseInferenceInput, image_paths: List[str], stem: str, what: str
+    ) -> Optional[str]:
+        """Shared body of the generate_*_image methods: one request, one saved file."""
         try:
+            output_folder = cast(Any, input).output_folder
             return self._generate_or_edit_image(
-                prompt, input.output_folder, "reference", input.images
+                input.to_full_prompt(), output_folder, stem, image_paths
             )
-
         except Exception as e:
-            print(f"Error generating reference image: {e}")
+            print(f"Error generating {what}: {e}")
             return None
 
-    def generate_base_sprite_image(self, input: GenerateBaseSpriteImageInput) -> Optional[str]:
-        prompt = input.to_prompt()
-        try:
-            return self._generate_or_edit_image(
-                prompt, input.output_folder, "base_sprite", input.images
-            )
+    def generate_reference_image(self, input: GenerateReferenceImageInput) -> Optional[str]:
+        return self._run_image_edit(input, input.images, "reference", "reference image")
 
-        except Exception as e:
-            print(f"Error generating base sprite image: {e}")
-            return None
+    def generate_base_sprite_image(self, input: GenerateBaseSpriteImageInput) -> Optional[str]:
+        return self._run_image_edit(input, input.images or [], "base_sprite", "base sprite image")
 
     def generate_next_sprite_image(self, input: GenerateNextSpriteImageInput) -> Optional[str]:
-        prompt = input.to_prompt()
-        try:
-            safe_anim = "".join(c if c.isalnum() else "_" for c in input.animation_name[:20])
-            return self._generate_or_edit_image(
-                prompt, input.output_folder, f"next_sprite_{safe_anim}", [input.image]
-            )
-
-        except Exception as e:
-            print(f"Error generating next sprite image: {e}")
-            return None
+        stem = f"next_sprite_{_safe_name(input.animation_name)}"
+        return self._run_image_edit(input, [input.image], stem, "next sprite image")
 
     def generate_sprite_between_images(
         self, input: GenerateSpriteBetweenImagesInput
     ) -> Optional[str]:
-        prompt = input.to_prompt()
-        try:
-            safe_anim = "".join(c if c.isalnum() else "_" for c in input.animation_name[:20])
-            return self._generate_or_edit_image(
-                prompt, input.output_folder, f"between_{safe_anim}", input.images
-            )
-
-        except Exception as e:
-            print(f"Error generating sprite between images: {e}")
-            return None
+        stem = f"between_{_safe_name(input.animation_name)}"
+        return self._run_image_edit(input, input.images, stem, "sprite between images")
 
+    @cached_response
+    @semantic_cached_suggestion
     def generate_sprite_animation_suggestion(
         self, input: GenerateSpriteAnimationSuggestion
     ) -> Optional[str]:
         prompt = input.to_prompt()
-        user_content = self._build_user_content(prompt, [])
         try:
-            response = openai.responses.create(
-                model=self.text_model,
-                input=cast(Any, [{"role": "user", "content": user_content}]),
+            request_input = cast(Any, self._build_input(prompt, []))
+            response = _with_retries(
+                lambda: self._client.responses.create(model=self.text_model, input=request_input)
             )
             suggestion = response.output_text.strip()
             return suggestion
@@ -534,9 +947,62 @@ class OpenAIClient(BaseAIClient):
 # ---------------------------
 # GoogleAI Client Implementation
 # ---------------------------
+def _genai_types():
+    from google.genai import types
+
+    return types
+
+
+def _open_pil_image(source):
+    from PIL import Image
+
+    return Image.open(source)
+
+
+# Decoded reference images kept per client; style sheets and base sprites recur across calls.
+PIL_IMAGE_CACHE_SIZE = 32
+
+
 class GoogleAIClient(BaseAIClient):
+    embedding_model = "text-embedding-004"
+
     def __init__(self, api_key, text_model="", image_model=""):
         super().__init__(text_model, image_model, api_key)
+        self._image_cache: "OrderedDict[tuple[str, int], Any]" = OrderedDict()
+        self._image_cache_lock = threading.Lock()
+
+    def _open_cached(self, path: str):
+        """Open and fully decode an image file, reusing the decode while its mtime is unchanged."""
+        key = (path, os.stat(path).st_mtime_ns)
+        with self._image_cache_lock:
+            image = self._image_cache.pop(key, None)
+        if image is None:
+            image = _open_pil_image(path)
+            image.load()
+        with self._image_cache_lock:
+            self._image_cache[key] = image
+            while len(self._image_cache) > PIL_IMAGE_CACHE_SIZE:
+                self._image_cache.popitem(last=False)
+        return image
+
+    @functools.cached_property
+    def _client(self) -> "genai.Client":
+        # Built on first use and kept, so consecutive requests share one connection pool.
+        import google.genai as genai
+
+        return genai.Client(api_key=self.api_key)
+
+    def _embed_text(self, text: str) -> Optional[List[float]]:
+        try:
+            response = self._client.models.embed_content(model=self.embedding_model, contents=text)
+            embeddings = response.embeddings or []
+            return list(embeddings[0].values or []) if embeddings else None
+        except Exception as e:
+            print(f"Warning: Could not embed prompt for the semantic cache: {e}")
+            return None
+
+    def _generate_content(self, **kwargs):
+        return _with_retries(lambda: self._client.models.generate_content(**kwargs))
 
     @staticmethod
     def _response_parts(response) -> list[Any]:
@@ -558,14 +1024,14 @@ class GoogleAIClient(BaseAIClient):
         data = getattr(inline_data, "data", None)
         return cast(bytes | None, data)
 
+    @cached_response
     def generate_description(self, input: GenerateDescriptionInput) -> Optional[str]:
         prompt = input.to_prompt()
         try:
-            client = genai.Client(api_key=self.api_key)
-            image_context = [Image.open(img) for img in input.images if os.path.exists(img)]
-            response = client.models.generate_content(
+            image_context = [self._open_cached(img) for img in input.images if os.path.exists(img)]
+            response = self._generate_content(
                 model=self.text_model,
-                contents=image_context + [prompt],
+                contents=[GAME_ASSET_CONTEXT, *image_context, prompt],
                 config={
                     "response_mime_type": "application/json",
                     "response_schema": GameDescriptionOutput,
@@ -577,14 +1043,14 @@ class GoogleAIClient(BaseAIClient):
             print(f"Error calling GoogleAI for description: {e}")
             return None
 
+    @cached_response
     def generate_keywords(self, input: GenerateKeywordsInput) -> Optional[str]:
         prompt = input.to_prompt()
         try:
-            client = genai.Client(api_key=self.api_key)
-            image_context = [Image.open(img) for img in input.images if os.path.exists(img)]
-            response = client.models.generate_content(
+            image_context = [self._open_cached(img) for img in input.images if os.path.exists(img)]
+            response = self._generate_content(
                 model=self.text_model,
-                contents=image_context + [prompt],
+                contents=[GAME_ASSET_CONTEXT, *image_context, prompt],
                 config={
                     "response_mime_type": "application/json",
                     "response_schema": GameKeywordsOutput,
@@ -596,166 +1062,87 @@ class GoogleAIClient(BaseAIClient):
             print(f"Error calling GoogleAI for keywords: {e}")
             return None
 
-    def generate_reference_image(self, input: GenerateReferenceImageInput) -> Optional[str]:
-        prompt = input.to_prompt()
+    def _open_images(self, sources: List[str], image_kind: str) -> list[Any]:
+        """Decode input images for the request, skipping missing or unreadable files."""
+        image_context = []
+        for source in sources:
+            if os.path.exists(source):
+                try:
+                    image_context.append(self._open_cached(source))
+                except Exception as e:
+                    print(f"Error opening {image_kind} image '{source}': {e}. Skipping.")
+        return image_context
+
+    def _generate_image_bytes(
+        self, input: BaseInferenceInput, sources: List[str], image_kind: str
+    ) -> Optional[bytes]:
+        image_context = self._open_images(sources, image_kind)
+        response = self._generate_content(
+            model=self.image_model,
+            contents=[GAME_ASSET_CONTEXT, *image_context, input.to_prompt()],
+            config=_genai_types().GenerateContentConfig(response_modalities=["Text", "Image"]),
+        )
+        for part in self._response_parts(response):
+            image_bytes = self._inline_image_bytes(part)
+            if image_bytes is not None:
+                return image_bytes
+        return None
+
+    def _run_genai_image(
+        self,
+        input: BaseInferenceInput,
+        sources: List[str],
+        image_kind: str,
+        stem: str,
+        what: str,
+    ) -> Optional[str]:
+        """Shared body of the generate_*_image methods: one request, one saved file."""
         try:
-            client = genai.Client(api_key=self.api_key)
-            image_context = [Image.open(img) for img in input.images if os.path.exists(img)]
-            response = client.models.generate_content(
-                model=self.image_model,
-                contents=image_context + [prompt],
-                config=genai.types.GenerateContentConfig(response_modalities=["Text", "Image"]),
-            )
-            img_fpath = None
-            for part in self._response_parts(response):
-                image_bytes = self._inline_image_bytes(part)
-                if image_bytes is not None:
-                    timestamp = datetime.now().strftime("%Y_%m_%d_%H_%M_%S")
-                    img_fpath = os.path.join(input.output_folder, f"image_{timestamp}.png")
-                    image_obj = Image.open(BytesIO(image_bytes))
-                    image_obj.save(img_fpath)
-            if not img_fpath:
-                print("Image generation failed")
+            image_bytes = self._generate_image_bytes(input, sources, image_kind)
+            if image_bytes is None:
+                print(f"Google AI image generation failed or no image data received for {what}.")
+                return None
+            img_fpath = _persist_image(image_bytes, cast(Any, input).output_folder, stem)
+            print(f"Saved {what} to: {img_fpath}")
             return img_fpath
         except Exception as e:
-            print(f"Error calling GoogleAI for reference image: {e}")
+            print(f"Error calling GoogleAI for {what} generation: {e}")
             return None
 
+    def generate_reference_image(self, input: GenerateReferenceImageInput) -> Optional[str]:
+        return self._run_genai_image(
+            input, list(input.images), "reference", "image", "reference image"
+        )
+
     def generate_base_sprite_image(self, input: GenerateBaseSpriteImageInput) -> Optional[str]:
-        prompt = input.to_prompt()
-        try:
-            client = genai.Client(api_key=self.api_key)
-            image_context = []
-            if input.images:
-                for img in input.images:
-                    if os.path.exists(img):
-                        try:
-                            image_context.append(Image.open(img))
-                        except Exception as e:
-                            print(f"Error opening reference image '{img}': {e}. Skipping.")
-            print("Constructed Prompt for Google AI Base Sprite Image Generation:")
-            print(prompt)
-            response = client.models.generate_content(
-                model=self.image_model,
-                contents=image_context + [prompt],
-                config=genai.types.GenerateContentConfig(response_modalities=["Text", "Image"]),
-            )
-            img_fpath = None
-            for part in self._response_parts(response):
-                image_bytes = self._inline_image_bytes(part)
-                if image_bytes is not None:
-                    timestamp = datetime.now().strftime("%Y_%m_%d_%H_%M_%S")
-                    safe_desc = "".join(
-                        c if c.isalnum() else "_" for c in input.sprite_description[:20]
-                    )
-                    img_fpath = os.path.join(
-                        input.output_folder, f"sprite_{safe_desc}_{timestamp}.png"
-                    )
-                    os.makedirs(input.output_folder, exist_ok=True)
-                    image_obj = Image.open(BytesIO(image_bytes))
-                    image_obj.save(img_fpath)
-                    print(f"Base sprite image saved to: {img_fpath}")
-                    break
-            if not img_fpath:
-                print("Google AI image generation failed or no image data received.")
-            return img_fpath
-        except Exception as e:
-            print(f"Error calling GoogleAI for base sprite image generation: {e}")
-            return None
+        stem = f"sprite_{_safe_name(input.sprite_description)}"
+        return self._run_genai_image(
+            input, list(input.images or []), "reference", stem, "base sprite image"
+        )
 
     def generate_next_sprite_image(self, input: GenerateNextSpriteImageInput) -> Optional[str]:
-        prompt = input.to_prompt()
-        try:
-            client = genai.Client(api_key=self.api_key)
-            image_context = []
-            if os.path.exists(input.image):
-                try:
-                    image_context.append(Image.open(input.image))
-                except Exception as e:
-                    print(f"Error opening sprite image '{input.image}': {e}. Skipping.")
-            response = client.models.generate_content(
-                model=self.image_model,
-                contents=image_context + [prompt],
-                config=genai.types.GenerateContentConfig(response_modalities=["Text", "Image"]),
-            )
-            img_fpath = None
-            for part in self._response_parts(response):
-                image_bytes = self._inline_image_bytes(part)
-                if image_bytes is not None:
-                    timestamp = datetime.now().strftime("%Y_%m_%d_%H_%M_%S")
-                    safe_anim = "".join(
-                        c if c.isalnum() else "_" for c in input.animation_name[:20]
-                    )
-                    img_fpath = os.path.join(
-                        input.output_folder, f"next_sprite_{safe_anim}_{timestamp}.png"
-                    )
-                    os.makedirs(input.output_folder, exist_ok=True)
-                    image_obj = Image.open(BytesIO(image_bytes))
-                    image_obj.save(img_fpath)
-                    print(f"Next sprite image saved to: {img_fpath}")
-                    break
-            if not img_fpath:
-                print(
-                    "Google AI image generation failed or no image data received for next sprite image."
-                )
-            return img_fpath
-        except Exception as e:
-            print(f"Error calling GoogleAI for next sprite image generation: {e}")
-            return None
+        stem = f"next_sprite_{_safe_name(input.animation_name)}"
+        return self._run_genai_image(input, [input.image], "sprite", stem, "next sprite image")
 
     def generate_sprite_between_images(
         self, input: GenerateSpriteBetweenImagesInput
     ) -> Optional[str]:
-        prompt = input.to_prompt()
-        try:
-            client = genai.Client(api_key=self.api_key)
-            image_context = []
-            for img in input.images:
-                if os.path.exists(img):
-                    try:
-                        image_context.append(Image.open(img))
-                    except Exception as e:
-                        print(f"Error opening sprite image '{img}': {e}. Skipping.")
-            response = client.models.generate_content(
-                model=self.image_model,
-                contents=image_context + [prompt],
-                config=genai.types.GenerateContentConfig(response_modalities=["Text", "Image"]),
-            )
-            img_fpath = None
-            for part in self._response_parts(response):
-                image_bytes = self._inline_image_bytes(part)
-                if image_bytes is not None:
-                    timestamp = datetime.now().strftime("%Y_%m_%d_%H_%M_%S")
-                    safe_anim = "".join(
-                        c if c.isalnum() else "_" for c in input.animation_name[:20]
-                    )
-                    img_fpath = os.path.join(
-                        input.output_folder, f"between_sprite_{safe_anim}_{timestamp}.png"
-                    )
-                    os.makedirs(input.output_folder, exist_ok=True)
-                    image_obj = Image.open(BytesIO(image_bytes))
-                    image_obj.save(img_fpath)
-                    print(f"Sprite between images saved to: {img_fpath}")
-                    break
-            if not img_fpath:
-                print(
-                    "Google AI image generation failed or no image data received for sprite between images."
-                )
-            return img_fpath
-        except Exception as e:
-            print(f"Error calling GoogleAI for sprite between images generation: {e}")
-            return None
+        stem = f"between_sprite_{_safe_name(input.animation_name)}"
+        return self._run_genai_image(
+            input, list(input.images), "sprite", stem, "sprite between images"
+        )
 
+    @cached_response
+    @semantic_cached_suggestion
     def generate_sprite_animation_suggestion(
         self, input: GenerateSpriteAnimationSuggestion
     ) -> Optional[str]:
         prompt = input.to_prompt()
         try:
-            client = genai.Client(api_key=self.api_key)
-            response = client.models.generate_content(
+            response = self._generate_content(
                 model=self.text_model,
-                contents=[prompt],
-                config=genai.types.GenerateContentConfig(response_modalities=["Text"]),
+                contents=[GAME_ASSET_CONTEXT, prompt],
+                config=_genai_types().GenerateContentConfig(response_modalities=["Text"]),
             )
             suggestion = None
             for part in self._response_parts(response):
@@ -789,16 +1176,16 @@ class TestingClient(BaseAIClient):
 
     def generate_base_sprite_image(self, input: GenerateBaseSpriteImageInput) -> Optional[str]:
         print(f"Generating fake base sprite for: {input.sprite_description}")
-        timestamp = datetime.now().strftime("%Y_%m_%d_%H_%M_%S")
-        safe_desc = "".join(c if c.isalnum() else "_" for c in input.sprite_description[:20])
+        timestamp = _timestamp()
+        safe_desc = _safe_name(input.sprite_description)
         dummy_path = os.path.join(input.output_folder, f"TEST_sprite_{safe_desc}_{timestamp}.png")
         print(f"Returning dummy path: {dummy_path}")
         return dummy_path
 
     def generate_next_sprite_image(self, input: GenerateNextSpriteImageInput) -> Optional[str]:
         print(f"Generating fake next sprite image for animation: {input.animation_name}")
-        timestamp = datetime.now().strftime("%Y_%m_%d_%H_%M_%S")
-        safe_anim = "".join(c if c.isalnum() else "_" for c in input.animation_name[:20])
+        timestamp = _timestamp()
+        safe_anim = _safe_name(input.animation_name)
         dummy_path = os.path.join(
             input.output_folder, f"TEST_next_sprite_{safe_anim}_{timestamp}.png"
         )
@@ -811,8 +1198,8 @@ class TestingClient(BaseAIClient):
         print(
             f"Generating fake sprite between images for animation: {input.animation_name} with images {input.images}"
         )
-        timestamp = datetime.now().strftime("%Y_%m_%d_%H_%M_%S")
-        safe_anim = "".join(c if c.isalnum() else "_" for c in input.animation_name[:20])
+        timestamp = _timestamp()
+        safe_anim = _safe_name(input.animation_name)
         dummy_path = os.path.join(
             input.output_folder, f"TEST_between_sprite_{safe_anim}_{timestamp}.png"
         )
@@ -838,6 +1225,9 @@ class AIModel(Enum):
     TESTING = "TESTING"
 
 
+_AI_MODEL_VALUES = frozenset(model.value for model in AIModel)
+
+
 class MissingInputException(Exception):
     """Custom exception for missing required input."""
 
@@ -853,16 +1243,39 @@ class MissingConfigurationException(Exception):
 # ---------------------------
 # Manager: Chooses the Correct Client
 # ---------------------------
+@functools.lru_cache(maxsize=4)
+def _parse_settings(path: str, mtime_ns: int, size: int) -> dict:
+    with open(path, "rb") as f:
+        return _json_loads(f.read())
+
+
+def _read_settings() -> dict:
+    """Return the parsed settings file, re-reading it only when it changes on disk.
+
+    The result is shared between callers and must not be mutated.
+    """
+    stat = os.stat(SETTINGS_FILE_NAME)
+    if stat.st_size > SETTINGS_FILE_MAX_BYTES:
+        raise OSError(f"Settings file {SETTINGS_FILE_NAME} is too large ({stat.st_size} bytes)")
+    return _parse_settings(SETTINGS_FILE_NAME, stat.st_mtime_ns, stat.st_size)
+
+
 class AIModelManager:
+    # Shared by every manager: the UI builds one per action, and clients keep SDK connection
+    # pools and decode caches that are worth carrying between actions.
+    _clients: dict[AIModel, BaseAIClient] = {}
+    # Vendors whose settings are incomplete, with the reason, until the settings file changes.
+    _unconfigured: dict[AIModel, str] = {}
+    _clients_settings: Optional[dict] = None
+    _clients_lock = threading.Lock()
+
     def __init__(self):
-        with open(SETTINGS_FILE_NAME) as f:
-            data = json.load(f)
+        data = dict(_read_settings())
         # Warn if keys are missing.
         if not data.get("OPENAI_API_KEY"):
             print("Warning: OPENAI_API_KEY not set in settings")
         if not data.get("GOOGLE_AI_STUDIO_API_KEY"):
             print("Warning: GOOGLE_AI_STUDIO_API_KEY not set in settings")
-        openai.api_key = data.get("OPENAI_API_KEY")
         self.google_api_key = data.get("GOOGLE_AI_STUDIO_API_KEY")
         self.config_data = data
 
@@ -876,22 +1289,47 @@ class AIModelManager:
 
     @staticmethod
     def get_active_vendor() -> AIModel:
-        with open(SETTINGS_FILE_NAME) as f:
-            data = json.load(f)
-        requested = data.get("Selected Inference Provider")
-        for model in AIModel:
-            if model == AIModel.TESTING and not TESTING_PROVIDER_ENABLED:
-                continue
-            if model.value == requested:
-                return model
-        if requested == AIModel.TESTING.value and not TESTING_PROVIDER_ENABLED:
+        return AIModelManager._vendor_from_settings(_read_settings())
+
+    @staticmethod
+    def _vendor_from_settings(settings: dict) -> AIModel:
+        requested = settings.get("Selected Inference Provider")
+        if not isinstance(requested, str) or requested not in _AI_MODEL_VALUES:
+            raise ValueError(f"AI Model {requested} not supported")
+        model = AIModel(requested)  # Enum keeps a value -> member dict for this lookup
+        if model == AIModel.TESTING and not TESTING_PROVIDER_ENABLED:
             raise MissingConfigurationException(
                 "The TESTING inference provider is disabled for this build."
             )
-        raise ValueError(f"AI Model {requested} not supported")
+        return model
 
     def get_client(self) -> BaseAIClient:
-        vendor = self.get_active_vendor()
+        settings = _read_settings()
+        vendor = self._vendor_from_settings(settings)
+        with AIModelManager._clients_lock:
+            if settings is not AIModelManager._clients_settings:
+                # Settings changed on disk: rebuild clients so new keys and models take effect.
+                for stale in AIModelManager._clients.values():
+                    stale.close()
+                AIModelManager._clients = {}
+                AIModelManager._unconfigured = {}
+                AIModelManager._clients_settings = settings
+            client = AIModelManager._clients.get(vendor)
+            if client is not None:
+                return client
+            reason = AIModelManager._unconfigured.get(vendor)
+            if reason is not None:
+                raise MissingConfigurationException(reason)
+            self.config_data = dict(settings)
+            try:
+                client = self._build_client(vendor)
+            except MissingConfigurationException as e:
+                AIModelManager._unconfigured[vendor] = str(e)
+                raise
+            AIModelManager._clients[vendor] = client
+            return client
+
+    def _build_client(self, vendor: AIModel) -> BaseAIClient:
         if vendor == AIModel.OPENAI:
             api_key = self._required_setting("OPENAI_API_KEY", "OPENAI_API_KEY")
             return OpenAIClient(
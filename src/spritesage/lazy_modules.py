@@ -0,0 +1,28 @@
+"""
+SPDX-License-Identifier: GPL-3.0-only
+Copyright (C) 2025 Keystone Intelligence LLC
+Licensed under GPL v3 (see LICENSE file for details)
+"""
+
+import importlib
+from typing import Any, Callable
+
+
+def lazy_module_getattr(
+    module_globals: dict[str, Any], modules: dict[str, str]
+) -> Callable[[str], Any]:
+    """
+    Build a module-level ``__getattr__`` that imports each of `modules` (attribute name ->
+    import path) on first access and stores it in `module_globals`, so later lookups are
+    plain global reads.
+    """
+
+    def __getattr__(name: str) -> Any:
+        module_name = modules.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {module_globals['__name__']!r} has no attribute {name!r}")
+        module = importlib.import_module(module_name)
+        module_globals[name] = module
+        return module
+
+    return __getattr__
@@ -8,14 +8,25 @@ import os
 from PySide6 import QtWidgets, QtCore, QtGui
 
 from .config import MIN_PANEL_WIDTH, MIN_IMAGE_HEIGHT
+from .image_loader import DebouncedRescaleMixin, cached_pixmap
 
+# Smooth scales kept per widget; a few sizes cover toggling between splitter layouts.
+SCALED_LOGO_CACHE_SIZE = 4
+# Longest edge of the pre-shrunk copy that is fast-scaled while a resize is in progress.
+LOGO_PREVIEW_EDGE = 512
+
+
+class LogoWidget(DebouncedRescaleMixin, QtWidgets.QWidget):
+    _scaled_cache_size = SCALED_LOGO_CACHE_SIZE
 
-class LogoWidget(QtWidgets.QWidget):
     def __init__(self, palette, logo_path, parent=None):
         super().__init__(parent)
         self.app_palette = palette
         self.logo_path = logo_path
         self.original_pixmap = None
+        self._preview_pixmap = None
+        self._init_rescale(self._display_smooth_pixmap)
+
         self.setMinimumSize(MIN_PANEL_WIDTH, MIN_IMAGE_HEIGHT)
         self._setup_ui()
         self._load_logo()
@@ -30,12 +41,14 @@ class LogoWidget(QtWidgets.QWidget):
 
     def _load_logo(self):
         if self.logo_path and os.path.exists(self.logo_path):
-            self.original_pixmap = QtGui.QPixmap(self.logo_path)
+            # Shared through QPixmapCache with the startup screen and any other logo widget
+            self.original_pixmap = cached_pixmap(os.path.abspath(self.logo_path))
             if self.original_pixmap.isNull():
                 print(f"Warning: Failed to load logo image: {self.logo_path}")
                 self.logo_label.setText(f"Error loading\n{os.path.basename(self.logo_path)}")
                 self.original_pixmap = None
             else:
+                self._preview_pixmap = self._make_preview(self.original_pixmap)
                 self.logo_label.setPixmap(
                     self.original_pixmap.scaled(
                         self.size(),
@@ -47,17 +60,46 @@ class LogoWidget(QtWidgets.QWidget):
             print(f"Warning: Logo file not found: {self.logo_path}")
             self.logo_label.setText("Logo not found")
 
+    @staticmethod
+    def _make_preview(pixmap: QtGui.QPixmap) -> QtGui.QPixmap:
+        if max(pixmap.width(), pixmap.height()) <= LOGO_PREVIEW_EDGE:
+            return pixmap
+        return pixmap.scaled(
+            LOGO_PREVIEW_EDGE,
+            LOGO_PREVIEW_EDGE,
+            QtCore.Qt.AspectRatioMode.KeepAspectRatio,
+            QtCore.Qt.TransformationMode.SmoothTransformation,
+        )
+
+    def _available_size(self) -> QtCore.QSize:
+        # Subtract margins from available size for scaling
+        return self.size() - QtCore.QSize(10, 10)  # 5px margin on each side
+
+    def _display_smooth_pixmap(self):
+        """Shows a high-quality scale for the current size, reusing recent results."""
+        if not self.original_pixmap:
+            self._rescale_timer.stop()
+            return
+        self.logo_label.setPixmap(
+            self._smooth_scaled(
+                self.original_pixmap, self._available_size(), self.devicePixelRatioF()
+            )
+        )
+
     def resizeEvent(self, event: QtGui.QResizeEvent):
         super().resizeEvent(event)
-        if self.original_pixmap:
-            # Subtract margins from available size for scaling
-            available_size = self.size() - QtCore.QSize(10, 10)  # 5px margin on each side
-            scaled_pixmap = self.original_pixmap.scaled(
-                available_size,
-                QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-                QtCore.Qt.TransformationMode.SmoothTransformation,
+        if not self.original_pixmap:
+            return
+        # Cheap nearest-neighbour pass from the small preview while the drag continues
+        self.logo_label.setPixmap(
+            self._fast_scaled(
+                self.original_pixmap,
+                self._available_size(),
+                self.devicePixelRatioF(),
+                self._preview_pixmap,
             )
-            self.logo_label.setPixmap(scaled_pixmap)
+        )
+        self._rescale_timer.start()  # Smooth rescale once resizing pauses
 
     def _apply_styles(self):
         self.setStyleSheet(f"""
@@ -11,10 +11,16 @@ import traceback
 from datetime import datetime
 from pathlib import Path
 
-from PySide6 import QtWidgets, QtGui
+from PySide6 import QtGui, QtWidgets
 
 # Import configuration variables
-from spritesage.config import APP_PALETTE, LOGO_FILENAME, build_application_stylesheet
+from spritesage.config import (
+    APP_PALETTE,
+    LOGO_FILENAME,
+    PIXMAP_CACHE_LIMIT_KB,
+    build_application_stylesheet,
+    get_icon,
+)
 from spritesage.startup_screen import StartupScreen
 
 # Optional: Set AppUserModelID for Windows taskbar icon grouping
@@ -118,6 +124,7 @@ def main():
     if callable(getattr(app, "setApplicationName", None)):
         app.setApplicationName("Sprite Sage")
     _apply_application_style(app)
+    QtGui.QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT_KB)
     _install_exception_hook()
     startup_screen = NullStartupScreen()
 
@@ -127,7 +134,7 @@ def main():
         # Set application icon
         startup_screen.set_status("Loading application icon...", 12)
         if os.path.exists(LOGO_FILENAME):
-            app.setWindowIcon(QtGui.QIcon(LOGO_FILENAME))
+            app.setWindowIcon(get_icon(LOGO_FILENAME))
         else:
             print(f"Warning: Application icon not set. Logo file not found: {LOGO_FILENAME}")
 
@@ -10,14 +10,24 @@ import time
 from PySide6 import QtCore, QtGui
 from PySide6.QtWidgets import QMainWindow, QSplitter, QFileDialog, QMessageBox
 
+# orjson parses settings and project metadata faster when installed; its decode errors
+# subclass json.JSONDecodeError, so the handlers below catch either.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 # Import config
 from .config import (
-    EMPTY_SAGE_TEMPLATE,
     APP_PALETTE,
     SAGE_FILE_EXTENSION,
     SETTINGS_FILE_NAME,
+    SETTINGS_FILE_MAX_BYTES,
     DEFAULT_SETTINGS,
     RECENT_PROJECTS_KEY,
+    get_icon,
+    new_sage_template,
+    palette_qcolor,
 )
 
 # Import Menu Bar
@@ -35,14 +45,23 @@ from .recent_projects import (
 from .sidebar import SidebarWidget
 from .editor import EditorWidget
 from .sage_file import SageFile
+from .file_stat_cache import FileStatCache
 from .logo import LogoWidget
 from .console import ConsoleWidget
+from .utils import (
+    FileWriteSignals,
+    flush_pending_writes,
+    write_text_atomic,
+    write_text_in_background,
+)
 
 
 class MainWindow(QMainWindow):
     def __init__(self, logo_path=None, startup_progress=None):
         super().__init__()
         self._startup_progress = startup_progress or self._noop_startup_progress
+        self._write_signals = FileWriteSignals(self)
+        self._write_signals.failed.connect(self._on_write_failed)
 
         # --- Load or Create Settings File ---
         # Determine the path relative to the script file
@@ -65,7 +84,7 @@ class MainWindow(QMainWindow):
         self.setGeometry(100, 100, 1000, 750)
 
         if self.logo_path and os.path.exists(self.logo_path):
-            self.setWindowIcon(QtGui.QIcon(self.logo_path))
+            self.setWindowIcon(get_icon(self.logo_path))
         else:
             print(f"Warning: Window icon not set. Logo file not found: {self.logo_path}")
 
@@ -74,7 +93,9 @@ class MainWindow(QMainWindow):
         self._notify_startup("Creating editor panels...", 68)
         self.console_widget = ConsoleWidget(palette=self.active_palette, parent=self)
         self.sidebar_widget = SidebarWidget(palette=self.active_palette, parent=self)
-        self.editor_widget = EditorWidget(palette=self.active_palette, parent=self)
+        self.editor_widget = EditorWidget(
+            palette=self.active_palette, parent=self, console=self.console_widget
+        )
         self.logo_widget = LogoWidget(
             palette=self.active_palette, logo_path=self.logo_path, parent=self
         )
@@ -118,6 +139,9 @@ class MainWindow(QMainWindow):
         # --- Apply Initial Sizes/Stretch Factors & Sync ---
         self._set_initial_sizes()
         self._apply_main_styles()
+        # splitterMoved fires for every pixel of a drag; mirror sizes at most once per frame
+        self._bottom_sync_timer = self._create_sync_timer(self._sync_bottom_now)
+        self._top_sync_timer = self._create_sync_timer(self._sync_top_now)
         self.inner_splitter.splitterMoved.connect(self.sync_bottom_splitter_size)
         self.bottom_splitter.splitterMoved.connect(self.sync_top_splitter_size)
 
@@ -137,20 +161,17 @@ class MainWindow(QMainWindow):
     def _load_or_create_settings(self) -> dict:
         """Loads settings from .sagesettings or creates it with defaults."""
         settings = DEFAULT_SETTINGS.copy()  # Start with defaults
-        if os.path.exists(self.settings_file_path):
-            try:
-                with open(self.settings_file_path, "r", encoding="utf-8") as f:
-                    loaded_settings = json.load(f)
-                # Update defaults with loaded settings (preserves defaults if keys missing)
-                settings.update(loaded_settings)
-                settings[RECENT_PROJECTS_KEY] = recent_projects_from_settings(settings)
-                print(f"Loaded settings from: {self.settings_file_path}")
-            except (json.JSONDecodeError, OSError) as e:
-                print(
-                    f"Error loading settings file '{self.settings_file_path}': {e}. Using defaults."
-                )
-                # If loading fails, we just stick with the defaults defined above
-        else:
+        try:
+            with open(self.settings_file_path, "r", encoding="utf-8") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size > SETTINGS_FILE_MAX_BYTES:
+                    raise OSError(f"settings file is too large ({size} bytes)")
+                loaded_settings = _json_loads(f.read())
+            # Update defaults with loaded settings (preserves defaults if keys missing)
+            settings.update(loaded_settings)
+            settings[RECENT_PROJECTS_KEY] = recent_projects_from_settings(settings)
+            print(f"Loaded settings from: {self.settings_file_path}")
+        except FileNotFoundError:
             print(f"Settings file not found. Creating '{self.settings_file_path}' with defaults.")
             try:
                 with open(self.settings_file_path, "w", encoding="utf-8") as f:
@@ -160,14 +181,19 @@ class MainWindow(QMainWindow):
                     f"Error creating settings file '{self.settings_file_path}': {e}. Using in-memory defaults."
                 )
                 # If creation fails, keep using the in-memory defaults
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"Error loading settings file '{self.settings_file_path}': {e}. Using defaults.")
+            # If loading fails, we just stick with the defaults defined above
         return settings
 
     def _save_settings(self):
-        try:
-            with open(self.settings_file_path, "w", encoding="utf-8") as f:
-                json.dump(self.settings, f, indent=4)
-        except OSError as e:
-            self.console_widget.log_message(f"Error saving settings file: {e}")
+        # Serialize now so later edits to self.settings can't race the write; the disk I/O
+        # itself runs off the GUI thread.
+        text = json.dumps(self.settings, indent=4)
+        write_text_in_background(self.settings_file_path, text, self._write_signals)
+
+    def _on_write_failed(self, path: str, message: str):
+        self.console_widget.log_message(f"Error saving settings file: {message}")
 
     def _setup_layout(self):
         self.outer_splitter = QSplitter(QtCore.Qt.Orientation.Vertical, self)
@@ -237,7 +263,7 @@ class MainWindow(QMainWindow):
         # Note: Project file still contains these keys, but they might be overridden
         # or ignored in favour of the global .sagesettings values depending on logic.
         # Consider if these should be removed from project metadata eventually.
-        default_metadata = EMPTY_SAGE_TEMPLATE.copy()
+        default_metadata = new_sage_template()
         default_metadata["Project Name"] = project_name
         default_metadata["createdAt"] = time.strftime("%Y-%m-%dT%H:%M:%S")
 
@@ -297,19 +323,20 @@ class MainWindow(QMainWindow):
         self.editor_widget.save()
         self.console_widget.log_message(f"Saving project metadata to: {self.current_project_file}")
         try:
+            # Re-read rather than reuse what _load_project parsed: editor_widget.save() may
+            # have just rewritten this file.
             metadata = {}
-            if os.path.exists(self.current_project_file):
+            try:
                 with open(self.current_project_file, "r", encoding="utf-8") as f:
-                    try:
-                        metadata = json.load(f)
-                    except json.JSONDecodeError:
-                        self.console_widget.log_message(
-                            f"Warning: Could not parse {self.current_project_file}. Overwriting."
-                        )
-                        metadata = {}
+                    metadata = _json_loads(f.read())
+            except FileNotFoundError:
+                pass
+            except json.JSONDecodeError:
+                self.console_widget.log_message(
+                    f"Warning: Could not parse {self.current_project_file}. Overwriting."
+                )
             metadata["lastSaved"] = time.strftime("%Y-%m-%dT%H:%M:%S")
-            with open(self.current_project_file, "w", encoding="utf-8") as f:
-                json.dump(metadata, f, indent=4)
+            write_text_atomic(self.current_project_file, json.dumps(metadata, indent=4))
             self.console_widget.log_message("Project metadata saved successfully.")
         except (OSError, json.JSONDecodeError) as e:
             error_msg = f"Error saving project file: {e}"
@@ -321,19 +348,14 @@ class MainWindow(QMainWindow):
         self.console_widget.log_message(f"Loading project from: {project_dir}")
         project_metadata = {}  # Default to empty if load fails
         try:
-            # Check if file exists and is readable before opening
-            if not os.access(project_dir, os.R_OK):
-                raise OSError(f"Cannot read project directory: {project_dir}")
-            if not os.access(sage_file, os.R_OK):
-                raise OSError(f"Cannot read project file: {sage_file}")
-
+            # A missing or unreadable file surfaces as OSError from open() itself
             with open(sage_file, "r", encoding="utf-8") as f:
-                project_metadata = json.load(f)
+                project_metadata = _json_loads(f.read())
             project_name = project_metadata.get(
                 "Project Name", os.path.basename(project_dir)
             )  # Use metadata name if available
             self.console_widget.log_message(f"Project '{project_name}' metadata loaded.")
-        except (OSError, json.JSONDecodeError, FileNotFoundError) as e:
+        except (OSError, json.JSONDecodeError) as e:
             error_msg = (
                 f"Error reading project file {sage_file}: {e}. Proceeding with directory view."
             )
@@ -385,11 +407,14 @@ class MainWindow(QMainWindow):
         self.editor_widget.load_file(file_path)
 
     def _on_sidebar_file_renamed(self, old_path: str, new_path: str):
+        # Don't wait for the watcher; the handlers below reload files immediately.
+        FileStatCache.instance().invalidate()
         self._remap_open_paths(old_path, new_path)
         self._refresh_editor_after_file_change(new_path)
         self.console_widget.log_message(f"Renamed: {old_path} -> {new_path}")
 
     def _on_sidebar_file_deleted(self, deleted_path: str):
+        FileStatCache.instance().invalidate()
         if deleted_path.lower().endswith(".sprite") and os.path.isfile(deleted_path):
             self._hide_sprite_file_from_project(deleted_path)
             if self._path_contains(deleted_path, self.editor_widget.current_file_path):
@@ -451,7 +476,7 @@ class MainWindow(QMainWindow):
                 project_metadata = {}
                 try:
                     with open(remapped_project_file, "r", encoding="utf-8") as f:
-                        project_metadata = json.load(f)
+                        project_metadata = _json_loads(f.read())
                 except (OSError, json.JSONDecodeError):
                     project_metadata = {}
                 self._remember_recent_project(
@@ -543,7 +568,7 @@ class MainWindow(QMainWindow):
                 margin: 2px 0px; /* Optional spacing */
             }}
             QSplitter::handle:pressed {{
-                background-color: {QtGui.QColor(self.active_palette['splitter_handle']).lighter(120).name()};
+                background-color: {palette_qcolor(self.active_palette, 'splitter_handle').lighter(120).name()};
             }}
         """
         self.outer_splitter.setStyleSheet(splitter_style)
@@ -569,37 +594,47 @@ class MainWindow(QMainWindow):
 
     def initial_sync(self):
         # Sync bottom splitter to match inner splitter's initial state *after* layout is shown
-        sizes = self.inner_splitter.sizes()
-        if sizes and len(sizes) == 2 and sum(sizes) > 0:
-            self.bottom_splitter.blockSignals(True)
-            self.bottom_splitter.setSizes(sizes)
-            self.bottom_splitter.blockSignals(False)
+        if self._mirror_splitter_sizes(self.inner_splitter, self.bottom_splitter):
             # Force logo resize calculation after splitter is set
             self.logo_widget.resizeEvent(
                 QtGui.QResizeEvent(self.logo_widget.size(), self.logo_widget.size())
             )
 
+    def _create_sync_timer(self, callback) -> QtCore.QTimer:
+        timer = QtCore.QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(16)
+        timer.timeout.connect(callback)
+        return timer
+
+    @staticmethod
+    def _mirror_splitter_sizes(source: QSplitter, target: QSplitter) -> bool:
+        sizes = source.sizes()
+        if not (sizes and len(sizes) == 2 and sum(sizes) > 0):
+            return False
+        target.blockSignals(True)
+        target.setSizes(sizes)
+        target.blockSignals(False)
+        return True
+
     def sync_bottom_splitter_size(self, pos, index):
         # When inner_splitter (sidebar/editor) is resized, sync bottom_splitter (logo/console)
         # Check if the splitter causing the signal is the one we expect
-        if self.sender() is self.inner_splitter:
-            sizes = self.inner_splitter.sizes()
-            if sizes and len(sizes) == 2 and sum(sizes) > 0:
-                self.bottom_splitter.blockSignals(True)
-                self.bottom_splitter.setSizes(sizes)
-                self.bottom_splitter.blockSignals(False)
+        if self.sender() is self.inner_splitter and not self._bottom_sync_timer.isActive():
+            self._bottom_sync_timer.start()  # Not restarted, so the drag keeps being followed
+
+    def _sync_bottom_now(self):
+        self._mirror_splitter_sizes(self.inner_splitter, self.bottom_splitter)
 
     def sync_top_splitter_size(self, pos, index):
         # When bottom_splitter (logo/console) is resized, sync inner_splitter (sidebar/editor)
-        if self.sender() is self.bottom_splitter:
-            sizes = self.bottom_splitter.sizes()
-            if sizes and len(sizes) == 2 and sum(sizes) > 0:
-                self.inner_splitter.blockSignals(True)
-                self.inner_splitter.setSizes(sizes)
-                self.inner_splitter.blockSignals(False)
+        if self.sender() is self.bottom_splitter and not self._top_sync_timer.isActive():
+            self._top_sync_timer.start()
+
+    def _sync_top_now(self):
+        self._mirror_splitter_sizes(self.bottom_splitter, self.inner_splitter)
 
     def closeEvent(self, event: QtGui.QCloseEvent):
-        # Add any cleanup or save prompts here if needed
-        # For example, you might want to save the current settings back to the file
-        # self._save_settings() # Optional: Implement this if settings can change run-time
+        # Let queued settings writes finish so nothing is lost on exit.
+        flush_pending_writes()
         event.accept()
@@ -5,12 +5,29 @@ Licensed under GPL v3 (see LICENSE file for details)
 """
 
 import json
+import os
+import shiboken6
 from PySide6 import QtWidgets, QtGui
 from PySide6.QtCore import Signal
 
+# orjson reads and writes the settings file faster when installed; the fallback produces
+# equivalent JSON text.
+try:
+    from orjson import dumps as _orjson_dumps
+    from orjson import loads as _json_loads
+
+    def _json_dumps(value) -> str:
+        return _orjson_dumps(value).decode("utf-8")
+
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+
 from .inference import AIModel
-from .config import SETTINGS_FILE_NAME, TESTING_PROVIDER_ENABLED
+from .config import SETTINGS_FILE_MAX_BYTES, SETTINGS_FILE_NAME, TESTING_PROVIDER_ENABLED
 from .recent_projects import RecentProject, recent_project_label
+from .utils import flush_pending_writes, write_text_atomic
 from .ai_models import (
     CAPABILITY_IMAGE,
     CAPABILITY_TEXT,
@@ -25,6 +42,10 @@ from .ai_models import (
     refresh_model_cache,
 )
 
+# Fixed at import time; every dialog builds its provider radio buttons from this table.
+# The index doubles as the button group id, so ids stay stable when TESTING is hidden.
+_AI_MODEL_ENTRIES = tuple((idx, model, model.name.upper()) for idx, model in enumerate(AIModel))
+
 
 class SettingsDialog(QtWidgets.QDialog):
     """
@@ -65,6 +86,7 @@ class SettingsDialog(QtWidgets.QDialog):
         self.inference_label = QtWidgets.QLabel("Selected Inference")
         self.inference_button_group = QtWidgets.QButtonGroup(self)
         self.inference_radio_buttons = {}  # Store radio buttons for easy access
+        self._id_to_model = {}  # Button group id -> AIModel, used when saving
 
         self.save_button = QtWidgets.QPushButton("Save")
         self.cancel_button = QtWidgets.QPushButton("Cancel")
@@ -94,11 +116,16 @@ class SettingsDialog(QtWidgets.QDialog):
         inference_layout.addWidget(self.inference_label)
         inference_layout.addStretch()  # Add space before buttons
 
-        for idx, model in enumerate(self._available_models()):
-            radio_button = QtWidgets.QRadioButton(model.name.upper())
+        for idx, model, label in self._available_model_entries():
+            radio_button = QtWidgets.QRadioButton(label)
             self.inference_radio_buttons[model] = radio_button
+            self._id_to_model[idx] = model
             self.inference_button_group.addButton(radio_button, idx)  # Associate enum value
             inference_layout.addWidget(radio_button)
+        # Saved settings store the provider by name
+        self._name_to_button = {
+            model.name: button for model, button in self.inference_radio_buttons.items()
+        }
 
         main_layout.addLayout(inference_layout)
         main_layout.addStretch(1)  # Add stretchable space before buttons
@@ -132,8 +159,10 @@ class SettingsDialog(QtWidgets.QDialog):
         return row
 
     @staticmethod
-    def _available_models():
-        return [model for model in AIModel if model != AIModel.TESTING or TESTING_PROVIDER_ENABLED]
+    def _available_model_entries():
+        if TESTING_PROVIDER_ENABLED:
+            return _AI_MODEL_ENTRIES
+        return tuple(entry for entry in _AI_MODEL_ENTRIES if entry[1] != AIModel.TESTING)
 
     @staticmethod
     def _create_model_combo() -> QtWidgets.QComboBox:
@@ -183,7 +212,7 @@ class SettingsDialog(QtWidgets.QDialog):
             self.inference_radio_buttons[model].setEnabled(available)
 
     def _first_enabled_model(self):
-        for model in AIModel:
+        for _idx, model, _label in _AI_MODEL_ENTRIES:
             button = self.inference_radio_buttons.get(model)
             if button and button.isEnabled():
                 return model
@@ -287,24 +316,17 @@ class SettingsDialog(QtWidgets.QDialog):
         selected_model_name = self.current_settings.get(
             "Selected Inference Provider", AIModel.TESTING.name
         )
-        try:
-            selected_model = AIModel[selected_model_name]
-            if (
-                selected_model in self.inference_radio_buttons
-                and self.inference_radio_buttons[selected_model].isEnabled()
-            ):
-                self.inference_radio_buttons[selected_model].setChecked(True)
-            else:
-                # Handle case where saved model isn't in current enum (e.g., outdated settings)
-                # Default to the first enabled radio button
-                fallback_model = self._first_enabled_model()
-                if fallback_model is not None:
-                    self.inference_radio_buttons[fallback_model].setChecked(True)
-        except KeyError:
-            # Handle case where saved model name is invalid
+        selected_button = self._name_to_button.get(selected_model_name)
+        if selected_button is None or not selected_button.isEnabled():
+            # Saved name is invalid, outdated, or its provider is unavailable:
+            # default to the first enabled radio button
             fallback_model = self._first_enabled_model()
             if fallback_model is not None:
-                self.inference_radio_buttons[fallback_model].setChecked(True)
+                selected_button = self.inference_radio_buttons[fallback_model]
+            else:
+                selected_button = None
+        if selected_button is not None:
+            selected_button.setChecked(True)
 
     def save_settings(self):
         """Gathers the settings from the widgets and emits the settings_saved signal."""
@@ -318,13 +340,10 @@ class SettingsDialog(QtWidgets.QDialog):
             elif self.current_settings.get(key):
                 new_settings[key] = self.current_settings[key]
 
-        selected_button = self.inference_button_group.checkedButton()
-        if selected_button and selected_button.isEnabled():
-            # Find the AIModel enum member corresponding to the selected button
-            for model, button in self.inference_radio_buttons.items():
-                if button == selected_button:
-                    new_settings["Selected Inference Provider"] = model.name
-                    break
+        # checkedId() is -1 when nothing is selected, which maps to no model
+        selected_model = self._id_to_model.get(self.inference_button_group.checkedId())
+        if selected_model is not None and self.inference_radio_buttons[selected_model].isEnabled():
+            new_settings["Selected Inference Provider"] = selected_model.name
         else:
             # Handle case where no button is selected (shouldn't happen with defaults)
             # Optionally default to the first model or log an error
@@ -377,6 +396,7 @@ class AppMenuBar(QtWidgets.QMenuBar):
         self.close_action = None  # Initialize
         self.undo_menu_action = None
         self.redo_menu_action = None
+        self._settings_dialog = None  # Built on first open, then reused
 
         self._create_file_menu()
         self._create_edit_menu()
@@ -393,47 +413,60 @@ class AppMenuBar(QtWidgets.QMenuBar):
 
     def _load_initial_settings(self):
         """
-        Placeholder for loading settings from .sagesettings.
+        Loads settings from .sagesettings.
         Returns a dictionary of settings.
         """
-        # In a real app, load from file here
-        with open(self.settings_file_path) as f:
-            data = json.load(f)
-        return data
+        with open(self.settings_file_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size > SETTINGS_FILE_MAX_BYTES:
+                raise OSError(f"Settings file {self.settings_file_path} is too large ({size} bytes)")
+            return _json_loads(f.read())
+
+    def _add_action(self, menu, label, shortcut, signal, enabled=True) -> QtGui.QAction:
+        """Adds an action to `menu` that emits `signal` when triggered."""
+        action = QtGui.QAction(label, self.parent_window)
+        if shortcut is not None:
+            action.setShortcut(shortcut)
+        action.triggered.connect(signal)
+        action.setEnabled(enabled)
+        menu.addAction(action)
+        return action
 
     def _create_file_menu(self):
         file_menu = self.addMenu("&File")
         self.file_menu = file_menu
 
-        new_action = QtGui.QAction("&New Project...", self.parent_window)
-        new_action.setShortcut(QtGui.QKeySequence.StandardKey.New)
-        new_action.triggered.connect(self.new_project_requested)
-        file_menu.addAction(new_action)
-
-        open_action = QtGui.QAction("&Open Project...", self.parent_window)
-        open_action.setShortcut(QtGui.QKeySequence.StandardKey.Open)
-        open_action.triggered.connect(self.open_project_requested)
-        file_menu.addAction(open_action)
+        self._add_action(
+            file_menu,
+            "&New Project...",
+            QtGui.QKeySequence.StandardKey.New,
+            self.new_project_requested,
+        )
+        self._add_action(
+            file_menu,
+            "&Open Project...",
+            QtGui.QKeySequence.StandardKey.Open,
+            self.open_project_requested,
+        )
 
         self.open_recent_menu = file_menu.addMenu("Open &Recent")
         self.update_recent_projects([])
 
-        self.save_action = QtGui.QAction("&Save Project", self.parent_window)
-        self.save_action.setShortcut(QtGui.QKeySequence.StandardKey.Save)
-        self.save_action.triggered.connect(self.save_project_requested)
-        self.save_action.setEnabled(False)  # Disabled until project loaded
-        file_menu.addAction(self.save_action)
-
+        # Save and export stay disabled until a project is loaded
+        self.save_action = self._add_action(
+            file_menu,
+            "&Save Project",
+            QtGui.QKeySequence.StandardKey.Save,
+            self.save_project_requested,
+            enabled=False,
+        )
         export_menu = file_menu.addMenu("&Export")
-        self.export_project_action = QtGui.QAction("&Project...", self.parent_window)
-        self.export_project_action.triggered.connect(self.export_project_requested)
-        self.export_project_action.setEnabled(False)
-        export_menu.addAction(self.export_project_action)
-
-        self.export_sprite_action = QtGui.QAction("&Sprite...", self.parent_window)
-        self.export_sprite_action.triggered.connect(self.export_sprite_requested)
-        self.export_sprite_action.setEnabled(False)
-        export_menu.addAction(self.export_sprite_action)
+        self.export_project_action = self._add_action(
+            export_menu, "&Project...", None, self.export_project_requested, enabled=False
+        )
+        self.export_sprite_action = self._add_action(
+            export_menu, "&Sprite...", None, self.export_sprite_requested, enabled=False
+        )
 
         # Optional: Add Close Project Action
         # self.close_action = QtGui.QAction("&Close Project", self.parent_window)
@@ -472,17 +505,12 @@ class AppMenuBar(QtWidgets.QMenuBar):
 
     def _create_edit_menu(self):
         edit_menu = self.addMenu("&Edit")
-        self.undo_menu_action = QtGui.QAction("&Undo", self.parent_window)
-        self.undo_menu_action.setShortcut(QtGui.QKeySequence.StandardKey.Undo)
-        self.undo_menu_action.triggered.connect(self.undo_action)
-        self.undo_menu_action.setEnabled(False)
-        edit_menu.addAction(self.undo_menu_action)
-
-        self.redo_menu_action = QtGui.QAction("&Redo", self.parent_window)
-        self.redo_menu_action.setShortcut(QtGui.QKeySequence.StandardKey.Redo)
-        self.redo_menu_action.triggered.connect(self.redo_action)
-        self.redo_menu_action.setEnabled(False)
-        edit_menu.addAction(self.redo_menu_action)
+        self.undo_menu_action = self._add_action(
+            edit_menu, "&Undo", QtGui.QKeySequence.StandardKey.Undo, self.undo_action, enabled=False
+        )
+        self.redo_menu_action = self._add_action(
+            edit_menu, "&Redo", QtGui.QKeySequence.StandardKey.Redo, self.redo_action, enabled=False
+        )
 
     def set_undo_redo_state(self, state):
         if self.undo_menu_action is None or self.redo_menu_action is None:
@@ -536,11 +564,18 @@ class AppMenuBar(QtWidgets.QMenuBar):
             print(f"Action '{action_text}' triggered (placeholder) - Console not found.")
 
     def _open_settings_dialog(self):
-        """Creates and shows the SettingsDialog."""
-        # Pass the current settings to the dialog
-        dialog = SettingsDialog(self.current_app_settings, self.parent_window)
-        # Connect the dialog's save signal to update our internal settings
-        dialog.settings_saved.connect(self._handle_settings_saved)
+        """Shows the SettingsDialog, building it on first use and reloading it afterwards."""
+        dialog = self._settings_dialog
+        # The parent window owns the dialog, so Qt may have deleted it under us.
+        if dialog is None or not shiboken6.isValid(dialog):
+            # Pass the current settings to the dialog
+            dialog = SettingsDialog(self.current_app_settings, self.parent_window)
+            # Connect the dialog's save signal to update our internal settings
+            dialog.settings_saved.connect(self._handle_settings_saved)
+            self._settings_dialog = dialog
+        else:
+            dialog.current_settings = self.current_app_settings
+            dialog._load_settings()
         dialog.exec()  # Show the dialog modally
 
     def _handle_settings_saved(self, new_settings: dict):
@@ -549,13 +584,32 @@ class AppMenuBar(QtWidgets.QMenuBar):
         and emit a signal for the main application.
         """
         print("MenuBar: Received saved settings:", new_settings)
-        self.current_app_settings = {**self.current_app_settings, **new_settings}
+        merged_settings = {**self.current_app_settings, **new_settings}
+        if merged_settings == self.current_app_settings:
+            # Nothing changed: listeners and the settings file are already up to date.
+            print("MenuBar: Settings unchanged; skipping update.")
+            return
+        self.current_app_settings = merged_settings
+        # Inference reads settings from disk, so the file must be current before anyone
+        # reacts to the signal below.
+        self._write_settings_file()
         # Emit signal so the main application can react (e.g., update inference backend)
         self.settings_updated.emit(self.current_app_settings)
-        # In a real application, you might trigger the actual saving to .sagesettings here
-        # or the main window might do it upon receiving the settings_updated signal.
         if hasattr(self.parent_window, "settings"):
             self.parent_window.settings = self.current_app_settings
-        with open(self.settings_file_path, "w") as f:
-            json.dump(self.current_app_settings, f)
         print("MenuBar: Settings updated internally.")
+
+    def _write_settings_file(self) -> bool:
+        # A queued write of older settings must not land after this one.
+        flush_pending_writes()
+        try:
+            write_text_atomic(self.settings_file_path, _json_dumps(self.current_app_settings))
+        except OSError as e:
+            message = f"Error saving settings file '{self.settings_file_path}': {e}"
+            console = getattr(self.parent_window, "console_widget", None)
+            if console is not None and hasattr(console, "log_message"):
+                console.log_message(message)
+            else:
+                print(message)
+            return False
+        return True
@@ -41,7 +41,7 @@ from .art_importer import (
 from .model_baker import ModelBakeResult, bake_model_to_sprite_project
 from .model_baker.dialog import ModelBakeDialog
 from .sprite_file import SpriteFile
-from .config import EMPTY_SPRITE_TEMPLATE
+from .config import new_sprite_template
 from .undo_redo import UndoRedoManager
 from .utils import (
     TextInputDialog,
@@ -368,7 +368,7 @@ class SageEditorView(GodotExportUiMixin, QtWidgets.QWidget):
             if self.sage_file and os.path.isdir(self.sage_file.directory):
                 full_path = os.path.join(self.sage_file.directory, sprite_file)
                 try:
-                    sprite_content = EMPTY_SPRITE_TEMPLATE.copy()
+                    sprite_content = new_sprite_template()
                     sprite_content["uuid"] = str(uuid.uuid4())
                     # Create an empty sprite file
                     with open(full_path, "w") as f:
@@ -39,6 +39,8 @@ from .config import (
     UNKNOWN_ICON_PATH,
     MIN_PANEL_WIDTH,
     SIDEBAR_ICON_SIZE,
+    get_icon,
+    palette_qcolor,
 )
 from .recent_projects import RecentProject, recent_project_label
 
@@ -61,11 +63,11 @@ class SidebarItemDelegate(QStyledItemDelegate):
 
     def _load_icons(self):
         """Load icons once for efficiency."""
-        self.folder_icon = QIcon(FOLDER_ICON_PATH)
-        self.image_icon = QIcon(IMAGE_ICON_PATH)
-        self.sprite_icon = QIcon(SPRITE_ICON_PATH)
-        self.spritesheet_icon = QIcon(SPRITESHEET_ICON_PATH)
-        self.unknown_icon = QIcon(UNKNOWN_ICON_PATH)
+        self.folder_icon = get_icon(FOLDER_ICON_PATH)
+        self.image_icon = get_icon(IMAGE_ICON_PATH)
+        self.sprite_icon = get_icon(SPRITE_ICON_PATH)
+        self.spritesheet_icon = get_icon(SPRITESHEET_ICON_PATH)
+        self.unknown_icon = get_icon(UNKNOWN_ICON_PATH)
 
         # Optional: Check if icons loaded correctly (useful for debugging paths)
         if self.folder_icon.isNull():
@@ -338,10 +340,10 @@ class SidebarWidget(QtWidgets.QWidget):
                 border-radius: 3px;
             }}
             QPushButton:hover {{
-                background-color: {QtGui.QColor(self.app_palette['button_bg']).lighter(115).name()};
+                background-color: {palette_qcolor(self.app_palette, 'button_bg').lighter(115).name()};
             }}
             QPushButton:pressed {{
-                background-color: {QtGui.QColor(self.app_palette['button_bg']).darker(110).name()};
+                background-color: {palette_qcolor(self.app_palette, 'button_bg').darker(110).name()};
             }}
         """
         if self.new_project_button:
@@ -364,7 +366,7 @@ class SidebarWidget(QtWidgets.QWidget):
                     color: {self.app_palette['tree_item_selected_text']};
                 }}
                 QListWidget#RecentProjectsList::item:hover {{
-                    background-color: {QtGui.QColor(self.app_palette.get('tree_item_selected_bg', '#A0C8F0')).lighter(115).name()};
+                    background-color: {palette_qcolor(self.app_palette, 'tree_item_selected_bg', '#A0C8F0').lighter(115).name()};
                 }}
             """)
 
@@ -386,7 +388,7 @@ class SidebarWidget(QtWidgets.QWidget):
                     color: {self.app_palette['tree_item_selected_text']};
                 }}
                 QTreeView::item:hover {{
-                    background-color: {QtGui.QColor(self.app_palette.get('tree_item_selected_bg', '#A0C8F0')).lighter(115).name()};
+                    background-color: {palette_qcolor(self.app_palette, 'tree_item_selected_bg', '#A0C8F0').lighter(115).name()};
                 }}
                 QTreeView::branch {{
                     background: transparent;
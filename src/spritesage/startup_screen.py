@@ -4,7 +4,11 @@ Copyright (C) 2025 Keystone Intelligence LLC
 Licensed under GPL v3 (see LICENSE file for details)
 """
 
-from PySide6 import QtCore, QtGui, QtWidgets
+import os
+
+from PySide6 import QtCore, QtWidgets
+
+from .image_loader import cached_pixmap
 
 
 class StartupScreen(QtWidgets.QWidget):
@@ -33,7 +37,8 @@ class StartupScreen(QtWidgets.QWidget):
         self.logo_label.setFixedSize(56, 56)
         self.logo_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
         if logo_path:
-            pixmap = QtGui.QPixmap(logo_path)
+            # Cached so the main window's logo widget reuses this decode
+            pixmap = cached_pixmap(os.path.abspath(logo_path))
             if not pixmap.isNull():
                 self.logo_label.setPixmap(
                     pixmap.scaled(
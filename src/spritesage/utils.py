@@ -4,9 +4,22 @@ Copyright © 2025 Keystone Intelligence LLC
 Licensed under GPL v3 (see LICENSE file for details)
 """
 
+import functools
+import os
 from os import PathLike
 
-from PySide6.QtCore import Qt, QSize, QThread, QEventLoop, QObject, Signal, Slot, QTimer
+from PySide6.QtCore import (
+    Qt,
+    QSize,
+    QThread,
+    QThreadPool,
+    QRunnable,
+    QEventLoop,
+    QObject,
+    Signal,
+    Slot,
+    QTimer,
+)
 from PySide6.QtWidgets import (
     QDialog,
     QLabel,
@@ -374,6 +387,58 @@ def call_with_progress(
     return result_container.get("result")
 
 
+def write_text_atomic(path: str, text: str):
+    """Write through a temp file and rename it over `path`, so a crash never leaves half a file."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+class FileWriteSignals(QObject):
+    failed = Signal(str, str)  # path, error message
+
+
+class _TextWriteJob(QRunnable):
+    """Writes already-serialized text to disk on a QThreadPool worker thread."""
+
+    def __init__(self, path, text, signals):
+        super().__init__()
+        self.path = path
+        self.text = text
+        self.signals = signals
+
+    def run(self):
+        try:
+            write_text_atomic(self.path, self.text)
+        except OSError as e:
+            if self.signals is None:
+                print(f"Error writing '{self.path}': {e}")
+                return
+            try:
+                self.signals.failed.emit(self.path, str(e))
+            except RuntimeError:
+                pass  # The receiver was destroyed while the file was being written
+
+
+@functools.cache
+def _file_write_pool() -> QThreadPool:
+    # A single worker, so queued writes to the same file land in the order they were made.
+    pool = QThreadPool()
+    pool.setMaxThreadCount(1)
+    return pool
+
+
+def write_text_in_background(path: str, text: str, signals: FileWriteSignals | None = None):
+    """Queue a file write off the GUI thread; failures are reported through `signals`."""
+    _file_write_pool().start(_TextWriteJob(path, text, signals))
+
+
+def flush_pending_writes():
+    """Block until every queued background write has reached disk."""
+    _file_write_pool().waitForDone()
+
+
 def prompt_for_llm_settings(parent: QWidget | None, message: str = "") -> bool:
     """Open LLM settings from the main window when inference configuration is missing."""
     window = parent.window() if parent is not None and hasattr(parent, "window") else None
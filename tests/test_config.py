@@ -79,6 +79,18 @@ def test_application_stylesheet_styles_dialog_text_panels():
     assert "QDialog#SpriteSagePopupDialog QProgressBar" in stylesheet
 
 
+def test_application_stylesheet_styles_main_panels():
+    palette = config.APP_PALETTE
+    stylesheet = config.build_application_stylesheet(palette)
+
+    assert "QPlainTextEdit#console {" in stylesheet
+    assert f"background-color: {palette['console_bg']};" in stylesheet
+    assert "QPlainTextEdit#mainEditor {" in stylesheet
+    assert "QWidget#editorWidget QWidget {" in stylesheet
+    assert f"background-color: {palette['widget_bg']};" in stylesheet
+    assert "font-family: Consolas" in stylesheet
+
+
 def test_sidebar_depth_colors_qcolor():
     qtgui = pytest.importorskip("PySide6.QtGui")
     expected_codes = [
@@ -91,7 +103,7 @@ def test_sidebar_depth_colors_qcolor():
         "#1abc9c",
         "#7f8c8d",
     ]
-    assert isinstance(config.SIDEBAR_DEPTH_COLORS, list)
+    assert isinstance(config.SIDEBAR_DEPTH_COLORS, tuple)
     assert len(config.SIDEBAR_DEPTH_COLORS) == len(expected_codes)
     for qc, expected in zip(config.SIDEBAR_DEPTH_COLORS, expected_codes, strict=True):
         assert isinstance(qc, qtgui.QColor)
@@ -105,3 +117,74 @@ def test_icon_paths_are_strings():
         assert isinstance(value, str)
         ext = os.path.splitext(value)[1].lower()
         assert ext in {".png", ".ico", ".svg", ".bmp"}
+
+
+def test_application_stylesheet_is_cached_per_palette():
+    palette = dict(config.APP_PALETTE)
+    first = config.build_application_stylesheet(palette)
+    assert config.build_application_stylesheet(dict(palette)) is first
+
+    palette["dialog_bg"] = "#010203"
+    changed = config.build_application_stylesheet(palette)
+    assert changed is not first
+    assert "#010203" in changed
+
+
+def test_palette_qcolor_reuses_preparsed_colors():
+    qtgui = pytest.importorskip("PySide6.QtGui")
+    assert set(config.APP_PALETTE_QCOLORS) == set(config.APP_PALETTE)
+    color = config.palette_qcolor(config.APP_PALETTE, "button_bg")
+    assert color is config.APP_PALETTE_QCOLORS["button_bg"]
+
+    custom = config.palette_qcolor({"button_bg": "#123456"}, "button_bg")
+    assert isinstance(custom, qtgui.QColor)
+    assert custom.name() == "#123456"
+    assert config.palette_qcolor({}, "missing", "#A0C8F0").name() == "#a0c8f0"
+
+
+def test_get_icon_is_built_once_per_path():
+    qtgui = pytest.importorskip("PySide6.QtGui")
+    icon = config.get_icon(config.FOLDER_ICON_PATH)
+    assert isinstance(icon, qtgui.QIcon)
+    assert config.get_icon(config.FOLDER_ICON_PATH) is icon
+    assert config.get_icon(config.UNKNOWN_ICON_PATH) is not icon
+
+
+def test_icon_path_prefers_compiled_resources(monkeypatch):
+    monkeypatch.setattr(config, "HAS_QT_RESOURCES", False)
+    assert config.icon_path("folder.png") == os.path.join(config.GRAPHICS_DIR, "folder.png")
+    monkeypatch.setattr(config, "HAS_QT_RESOURCES", True)
+    assert config.icon_path("folder.png") == ":/graphics/folder.png"
+
+
+def test_new_templates_do_not_share_mutable_values():
+    first, second = config.new_sprite_template(), config.new_sprite_template()
+    assert first == second
+    first["animations"]["idle"] = {}
+    assert second["animations"] == {}
+
+    sage = config.new_sage_template()
+    sage["Reference Images"][0] = "ref.png"
+    assert config.new_sage_template()["Reference Images"] == ["", "", "", ""]
+
+
+def test_base_dir_prefers_pyinstaller_bundle(monkeypatch, tmp_path):
+    config.base_dir.cache_clear()
+    monkeypatch.setattr(config.sys, "frozen", True, raising=False)
+    monkeypatch.setattr(config.sys, "_MEIPASS", str(tmp_path), raising=False)
+    try:
+        assert config.base_dir() == str(tmp_path)
+        monkeypatch.setattr(config.sys, "_MEIPASS", "elsewhere", raising=False)
+        assert config.base_dir() == str(tmp_path)
+    finally:
+        config.base_dir.cache_clear()
+
+
+def test_base_dir_ignores_meipass_when_not_frozen(monkeypatch, tmp_path):
+    config.base_dir.cache_clear()
+    monkeypatch.delattr(config.sys, "frozen", raising=False)
+    monkeypatch.setattr(config.sys, "_MEIPASS", str(tmp_path), raising=False)
+    try:
+        assert config.base_dir() == os.path.abspath(".")
+    finally:
+        config.base_dir.cache_clear()
@@ -30,11 +30,8 @@ def test_init_properties(qapp, monkeypatch):
     assert widget.placeholderText() == "Console / Log Area"
     assert widget.minimumWidth() == config.MIN_EDITOR_CONSOLE_WIDTH
     assert widget.minimumHeight() == config.MIN_EDITOR_CONSOLE_HEIGHT
-    ss = widget.styleSheet()
-    assert f"background-color: {palette['console_bg']}" in ss
-    assert f"color: {palette['text_color']}" in ss
-    assert f"border: 1px solid {palette['placeholder_border']}" in ss
-    assert "font-family: Consolas" in ss
+    assert widget.objectName() == "console"
+    assert widget.styleSheet() == ""
     text = widget.toPlainText().strip()
     assert text == "[12:34:56] Console Initialized. Create or load a project."
 
@@ -50,3 +47,25 @@ def test_log_message_appends_and_scrolls(qapp, monkeypatch):
     assert lines[-1] == "[01:02:03] Test message"
     vsb = widget.verticalScrollBar()
     assert vsb.value() == vsb.maximum()
+
+
+def test_log_messages_appends_batch(qapp, monkeypatch):
+    monkeypatch.setattr(console.time, "strftime", lambda fmt: "04:05:06")
+    palette = {"console_bg": "#FFFFFF", "text_color": "#000000", "placeholder_border": "#CCCCCC"}
+    widget = ConsoleWidget(palette)
+    widget.log_messages(["first", "second"])
+    widget.log_messages([])
+    lines = widget.toPlainText().splitlines()
+    assert lines[-2:] == ["[04:05:06] first", "[04:05:06] second"]
+
+
+def test_log_message_keeps_scroll_position_when_user_scrolled_up(qapp):
+    palette = {"console_bg": "#FFFFFF", "text_color": "#000000", "placeholder_border": "#CCCCCC"}
+    widget = ConsoleWidget(palette)
+    widget.resize(200, 60)
+    widget.log_messages([f"line {i}" for i in range(100)])
+    vsb = widget.verticalScrollBar()
+    assert vsb.maximum() > 0
+    vsb.setValue(0)
+    widget.log_message("more output")
+    assert vsb.value() == 0
@@ -46,6 +46,13 @@ def test_read_file_content_success(default_palette, tmp_path):
     assert result == content
 
 
+def test_read_file_content_normalizes_newlines(default_palette, tmp_path):
+    widget = EditorWidget(default_palette)
+    test_file = tmp_path / "mixed.txt"
+    test_file.write_bytes("Windows\r\nMac\rUnix\n\u00e9".encode("utf-8"))
+    assert widget._read_file_content(str(test_file)) == "Windows\nMac\nUnix\n\u00e9"
+
+
 def test_load_text_file_fallback(default_palette, tmp_path):
     # load_file should handle text files and display content in plain_text_editor
     widget = EditorWidget(default_palette)
@@ -73,7 +80,7 @@ def test_load_sage_file_success(default_palette, tmp_path, monkeypatch):
     file = tmp_path / "a.sage"
     file.write_text('{"foo": "bar"}', encoding="utf-8")
     monkeypatch.setattr(editor, "SageFile", type("S", (), {})())
-    editor.SageFile.from_json = staticmethod(lambda p: {"dummy": True})
+    editor.SageFile.from_dict = staticmethod(lambda data, filepath: {"dummy": True})
 
     class P(qtwidgets.QWidget):
         def __init__(self):
@@ -85,7 +92,7 @@ def test_load_sage_file_success(default_palette, tmp_path, monkeypatch):
             self.logs.append(m)
 
     parent = P()
-    widget = EditorWidget(default_palette, parent=parent)
+    widget = EditorWidget(default_palette, parent=parent, console=parent)
     # stub load_data to avoid real SageEditorView logic
     loaded = []
     widget.sage_editor.load_data = lambda sf: loaded.append(sf)
@@ -116,7 +123,7 @@ def test_load_sprite_file_success(default_palette, tmp_path, monkeypatch):
             self.logs.append(m)
 
     parent = P()
-    widget = EditorWidget(default_palette, parent=parent)
+    widget = EditorWidget(default_palette, parent=parent, console=parent)
     widget.sage_editor.sage_file = {"x": 1}
     calls = []
     widget.sprite_editor.load_sprite_data = lambda path, sf: calls.append((path, sf))
@@ -246,7 +253,7 @@ def test_load_image_file_success(default_palette, tmp_path, monkeypatch):
             self.logs.append(m)
 
     parent = P()
-    widget = EditorWidget(default_palette, parent=parent)
+    widget = EditorWidget(default_palette, parent=parent, console=parent)
     widget.image_viewer.load_image = lambda p: True
     widget.load_file(str(file))
     # verify current_file_path was set
@@ -270,7 +277,7 @@ def test_load_image_file_failure(default_palette, tmp_path, monkeypatch):
             self.logs.append(m)
 
     parent = P()
-    widget = EditorWidget(default_palette, parent=parent)
+    widget = EditorWidget(default_palette, parent=parent, console=parent)
     widget.image_viewer.load_image = lambda p: False
     widget.load_file(str(file))
     pt = widget.plain_text_editor
@@ -290,7 +297,7 @@ def test_log_message_dispatch(default_palette):
             self.logs.append(m)
 
     parent = P()
-    widget = EditorWidget(default_palette, parent=parent)
+    widget = EditorWidget(default_palette, parent=parent, console=parent)
     widget._log_message("xyz")
     assert parent.logs == ["xyz"]
 
@@ -340,3 +347,83 @@ def test_log_message_fallback_print(default_palette, qapp, capsys):
     widget._log_message(message)
     captured = capsys.readouterr()
     assert f"LOG (Editor): {message}" in captured.out
+
+
+def test_editor_uses_application_stylesheet_object_names(default_palette):
+    widget = EditorWidget(default_palette)
+    assert widget.objectName() == "editorWidget"
+    assert widget.plain_text_editor.objectName() == "mainEditor"
+    assert widget.styleSheet() == ""
+    assert widget.plain_text_editor.styleSheet() == ""
+
+
+def test_sub_editors_are_built_on_first_use(default_palette):
+    widget = EditorWidget(default_palette)
+    assert widget._sage_editor is None
+    assert widget._sprite_editor is None
+    assert widget._image_viewer is None
+    assert widget.stacked_layout.count() == 1
+    assert widget.undo_redo_state() == editor.UndoRedoState()
+
+    sage_view = widget.sage_editor
+    assert widget.sage_editor is sage_view
+    assert widget.stacked_layout.indexOf(sage_view) != -1
+    assert widget._sprite_editor is None
+    assert widget.stacked_layout.count() == 2
+
+
+def test_load_sage_reuses_parse_until_file_changes(tmp_path, monkeypatch):
+    sage_path = tmp_path / "cached.sage"
+    sage_path.write_text('{"Project Name": "First"}', encoding="utf-8")
+    calls = []
+    real_load = editor.json.load
+    monkeypatch.setattr(editor.json, "load", lambda f: calls.append(f.name) or real_load(f))
+    editor._read_sage_data.cache_clear()
+
+    first = editor._load_sage(str(sage_path))
+    second = editor._load_sage(str(sage_path))
+    assert len(calls) == 1
+    assert first == second
+    assert first is not second
+    first.reference_images.append("mutated.png")
+    assert editor._load_sage(str(sage_path)).reference_images == []
+
+    sage_path.write_text('{"Project Name": "Second, renamed"}', encoding="utf-8")
+    assert editor._load_sage(str(sage_path)).project_name == "Second, renamed"
+    assert len(calls) == 2
+
+
+def test_load_file_dispatches_on_case_insensitive_extension(default_palette, tmp_path, monkeypatch):
+    widget = EditorWidget(default_palette)
+    calls = []
+    monkeypatch.setitem(
+        editor._EXT_DISPATCH, ".png", lambda self, path: calls.append(("image", path))
+    )
+    monkeypatch.setattr(
+        EditorWidget, "_load_text_file", lambda self, path: calls.append(("text", path))
+    )
+    image_file = tmp_path / "Hero.PNG"
+    image_file.write_bytes(b"")
+    text_file = tmp_path / "notes"
+    text_file.write_text("", encoding="utf-8")
+
+    widget.load_file(str(image_file))
+    widget.load_file(str(text_file))
+
+    assert calls == [("image", str(image_file)), ("text", str(text_file))]
+
+
+def test_save_only_saves_the_active_sub_editor(default_palette, monkeypatch):
+    widget = EditorWidget(default_palette)
+    widget.current_file_path = "project.sage"
+    saved = []
+    monkeypatch.setattr(widget.sage_editor, "save", lambda: saved.append("sage"))
+    monkeypatch.setattr(widget.sprite_editor, "save", lambda: saved.append("sprite"))
+
+    widget.stacked_layout.setCurrentWidget(widget.plain_text_editor)
+    assert widget.save() is False
+    assert saved == []
+
+    widget.stacked_layout.setCurrentWidget(widget.sprite_editor)
+    assert widget.save() is True
+    assert saved == ["sprite"]
@@ -0,0 +1,96 @@
+import os
+
+import pytest
+
+from spritesage.file_stat_cache import FileStatCache
+
+qtwidgets = pytest.importorskip("PySide6.QtWidgets")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def qapp():
+    app = qtwidgets.QApplication.instance()
+    if app is None:
+        app = qtwidgets.QApplication([])
+    return app
+
+
+def test_is_file_caches_existing_files(tmp_path, monkeypatch):
+    cache = FileStatCache()
+    target = tmp_path / "hero.sprite"
+    target.write_text("{}", encoding="utf-8")
+    calls = []
+    real_isfile = os.path.isfile
+
+    def counting_isfile(path):
+        calls.append(path)
+        return real_isfile(path)
+
+    monkeypatch.setattr(os.path, "isfile", counting_isfile)
+
+    assert cache.is_file(str(target))
+    assert cache.is_file(str(target))
+    assert len(calls) == 1
+
+
+def test_is_file_rechecks_missing_paths(tmp_path):
+    cache = FileStatCache()
+    target = tmp_path / "later.sage"
+    assert not cache.is_file(str(target))
+    target.write_text("{}", encoding="utf-8")
+    assert cache.is_file(str(target))
+
+
+def test_invalidate_and_directory_change_drop_entries(tmp_path):
+    cache = FileStatCache()
+    target = tmp_path / "gone.png"
+    target.write_bytes(b"")
+    assert cache.is_file(str(target))
+    target.unlink()
+
+    cache._invalidate_directory(str(tmp_path))
+    assert not cache.is_file(str(target))
+
+    target.write_bytes(b"")
+    assert cache.is_file(str(target))
+    target.unlink()
+    cache.invalidate(str(target))
+    assert not cache.is_file(str(target))
+
+
+def test_is_dir_caches_directories_separately(tmp_path):
+    cache = FileStatCache()
+    folder = tmp_path / "reference_images"
+    assert not cache.is_dir(str(folder))
+    folder.mkdir()
+    assert cache.is_dir(str(folder))
+    assert not cache.is_file(str(folder))
+
+    folder.rmdir()
+    cache._invalidate_directory(str(tmp_path))
+    assert not cache.is_dir(str(folder))
+
+
+def test_instance_is_shared():
+    assert FileStatCache.instance() is FileStatCache.instance()
+
+
+def test_watches_follow_cached_entries(tmp_path):
+    cache = FileStatCache()
+    target = tmp_path / "hero.sprite"
+    target.write_text("{}", encoding="utf-8")
+    assert cache.is_file(str(target))
+    assert cache._watcher.directories() == [str(tmp_path)]
+
+    cache.invalidate(str(target))
+    assert cache._watcher.directories() == []
+
+    # A watch the watcher dropped on its own is restored on the next cached lookup.
+    assert cache.is_file(str(target))
+    cache._watcher.removePath(str(tmp_path))
+    cache.invalidate(str(target))
+    assert cache.is_file(str(target))
+    assert cache._watcher.directories() == [str(tmp_path)]
+
+    cache.invalidate()
+    assert cache._watcher.directories() == []
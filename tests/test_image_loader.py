@@ -3,9 +3,15 @@ import pytest
 
 from PySide6 import QtWidgets, QtCore, QtGui
 from PySide6.QtGui import QResizeEvent
+from PySide6.QtTest import QTest
 
-from spritesage.image_loader import ImageLoaderWidget, ActionIconButton
-from spritesage import config
+from spritesage.image_loader import (
+    ActionIconButton,
+    ImageLoaderWidget,
+    cached_pixmap,
+    scaled_for_display,
+)
+from spritesage import config, image_loader
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -16,6 +22,33 @@ def qapp():
     return app
 
 
+def test_cached_pixmap_reuses_decode_until_file_changes(tmp_path):
+    path = tmp_path / "cached.png"
+    pix = QtGui.QPixmap(4, 4)
+    pix.fill(QtCore.Qt.GlobalColor.red)
+    pix.save(str(path))
+
+    first = cached_pixmap(str(path))
+    assert first.size() == QtCore.QSize(4, 4)
+    assert cached_pixmap(str(path)).cacheKey() == first.cacheKey()
+
+    bigger = QtGui.QPixmap(6, 6)
+    bigger.fill(QtCore.Qt.GlobalColor.blue)
+    bigger.save(str(path))
+    assert cached_pixmap(str(path)).size() == QtCore.QSize(6, 6)
+
+
+def test_scaled_for_display_renders_at_device_resolution():
+    source = QtGui.QPixmap(400, 200)
+    source.fill(QtCore.Qt.GlobalColor.red)
+    scaled = scaled_for_display(
+        source, QtCore.QSize(100, 100), 2.0, QtCore.Qt.TransformationMode.SmoothTransformation
+    )
+    assert scaled.size() == QtCore.QSize(200, 100)
+    assert scaled.devicePixelRatio() == 2.0
+    assert scaled.deviceIndependentSize() == QtCore.QSizeF(100, 50)
+
+
 class TestImageLoaderWidget:
     @pytest.fixture(autouse=True)
     def setup_widget(self, tmp_path):
@@ -33,16 +66,28 @@ class TestImageLoaderWidget:
 
     def test_apply_styles_border(self):
         w = self.w
+        assert w.objectName() == "imageLoader"
+        assert w.styleSheet() == ""
         # No pixmap: dashed
         w._pixmap = None
         w._apply_styles()
-        ss = w.styleSheet()
-        assert "border: 1px dashed" in ss
+        assert w.property("state") == "empty"
         # With pixmap: solid
         w._pixmap = QtGui.QPixmap(5, 5)
         w._apply_styles()
-        ss2 = w.styleSheet()
-        assert "border: 1px solid" in ss2
+        assert w.property("state") == "filled"
+        sheet = config.build_application_stylesheet(config.APP_PALETTE)
+        assert 'QLabel#imageLoader[state="filled"]' in sheet
+        assert "QPushButton#imageLoaderRemoveButton" in sheet
+
+    def test_remove_button_is_built_on_first_image(self):
+        w = self.w
+        assert w.remove_button is None
+        w.load_image(os.path.basename(str(self.img)))
+        button = w.remove_button
+        assert button is not None and not button.isHidden()
+        w.clear_image(emit_signal=False)
+        assert w.remove_button is button and button.isHidden()
 
     def test_display_pixmap_small_size(self):
         w = self.w
@@ -81,7 +126,65 @@ class TestImageLoaderWidget:
         # Using isHidden to avoid parent visibility issues in offscreen tests
         assert not w.remove_button.isHidden()
         # style should be solid border
-        assert "border: 1px solid" in w.styleSheet()
+        assert w.property("state") == "filled"
+
+    def test_load_image_decodes_large_image_at_thumbnail_size(self, tmp_path):
+        big = tmp_path / "big.png"
+        pix = QtGui.QPixmap(400, 200)
+        pix.fill(QtCore.Qt.GlobalColor.green)
+        pix.save(str(big))
+        self.w.load_image("big.png")
+        available = self.w._available_size()
+        assert self.w._pixmap.width() == available.width()
+        assert self.w._pixmap.height() == available.width() // 2
+
+    def test_display_pixmap_rereads_source_when_slot_grows(self, tmp_path):
+        big = tmp_path / "wide.png"
+        pix = QtGui.QPixmap(400, 200)
+        pix.fill(QtCore.Qt.GlobalColor.green)
+        pix.save(str(big))
+        w = self.w
+        w.load_image("wide.png")
+        small_width = w._pixmap.width()
+
+        w.setMaximumSize(300, 300)
+        w.resize(300, 300)
+        w._display_pixmap()
+        assert w._pixmap.width() == w._available_size().width() > small_width
+        assert w._decode_bound == w._available_size()
+
+    def test_load_image_decodes_large_files_off_the_gui_thread(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(image_loader, "_ASYNC_DECODE_MIN_BYTES", 0)
+        path = tmp_path / "async.png"
+        pix = QtGui.QPixmap(30, 30)
+        pix.fill(QtCore.Qt.GlobalColor.blue)
+        pix.save(str(path))
+
+        self.w.load_image("async.png")
+        assert self.w.image_path == "async.png"
+        assert self.w._pixmap is None
+        assert self.w.text() == "Loading..."
+
+        QtCore.QThreadPool.globalInstance().waitForDone()
+        QTest.qWait(10)
+        assert self.w._pixmap is not None and not self.w._pixmap.isNull()
+        assert self.w.text() == ""
+
+    def test_load_image_skips_unchanged_file(self, monkeypatch):
+        w = self.w
+        rel = os.path.basename(str(self.img))
+        w.load_image(rel)
+        shown = []
+        monkeypatch.setattr(w, "_show_loaded_pixmap", lambda *args: shown.append(args))
+        w.load_image(rel)
+        assert shown == []
+
+        pix = QtGui.QPixmap(12, 12)
+        pix.fill(QtCore.Qt.GlobalColor.blue)
+        pix.save(str(self.img))
+        os.utime(self.img, ns=(0, 1_000_000_000))
+        w.load_image(rel)
+        assert len(shown) == 1
 
     def test_load_image_invalid_file(self, capsys):
         w = self.w
@@ -96,7 +199,7 @@ class TestImageLoaderWidget:
         # text indicates invalid image
         assert "Invalid" in w.text()
         # style dashed border
-        assert "dashed" in w.styleSheet()
+        assert w.property("state") == "empty"
 
     def test_load_image_missing_file(self, capsys):
         w = self.w
@@ -107,7 +210,63 @@ class TestImageLoaderWidget:
         assert "Image file not found" in out
         assert "Not Found" in w.text()
         # style dashed
-        assert "dashed" in w.styleSheet()
+        assert w.property("state") == "empty"
+
+    def test_get_relative_path(self, tmp_path, monkeypatch):
+        w = self.w
+        assert w.get_relative_path(str(tmp_path)) is None
+        w.load_image(os.path.basename(str(self.img)))
+        assert w.get_relative_path(self.base_dir) == "test.png"
+
+        calls = []
+        monkeypatch.setattr(
+            image_loader.os.path, "relpath", lambda *args: calls.append(args) or "cached"
+        )
+        assert w.get_relative_path(self.base_dir) == "test.png"
+        assert calls == []
+        assert w.get_relative_path(str(tmp_path / "sub")) == "cached"
+
+    def test_select_image_reuses_one_dialog(self, monkeypatch, tmp_path):
+        (tmp_path / "reference_images").mkdir()
+        opened = []
+
+        def fake_exec(dialog):
+            opened.append((dialog, dialog.directory().absolutePath()))
+            return QtWidgets.QDialog.DialogCode.Rejected
+
+        monkeypatch.setattr(QtWidgets.QFileDialog, "exec", fake_exec)
+        self.w._select_image()
+        other = ImageLoaderWidget(base_dir=self.base_dir, palette=self.palette, index=1)
+        other._select_image()
+
+        assert opened[0][0] is opened[1][0]
+        assert opened[0][1] == str(tmp_path / "reference_images")
+        assert self.w.image_path is None
+
+    def test_select_image_emits_once_per_change(self, monkeypatch, tmp_path):
+        outside = tmp_path.parent / f"{tmp_path.name}_outside.png"
+        pix = QtGui.QPixmap(6, 6)
+        pix.fill(QtCore.Qt.GlobalColor.red)
+        pix.save(str(outside))
+        dialog = ImageLoaderWidget._image_dialog()
+        monkeypatch.setattr(dialog, "exec", lambda: QtWidgets.QDialog.DialogCode.Accepted)
+        emitted = []
+        self.w.image_updated.connect(emitted.append)
+
+        monkeypatch.setattr(dialog, "selectedFiles", lambda: [str(self.img)])
+        self.w._select_image()
+        self.w._select_image()
+        assert emitted == ["test.png"]
+
+        monkeypatch.setattr(dialog, "selectedFiles", lambda: [str(outside)])
+        self.w._select_image()
+        assert emitted == ["test.png", f"reference_images/{outside.name}"]
+        assert (tmp_path / "reference_images" / outside.name).is_file()
+
+        stem = outside.stem
+        (tmp_path / "reference_images" / f"{stem}_1.PNG").write_bytes(b"")
+        self.w._select_image()
+        assert emitted[-1] == f"reference_images/{stem}_2.png"
 
     def test_clear_image_emits(self, capsys):
         w = self.w
@@ -145,18 +304,42 @@ class TestImageLoaderWidget:
         w._on_action_button_clicked("ACT")
         assert got == [7]
 
+    def test_update_button_positions_skips_unchanged_layout(self, monkeypatch):
+        w = self.w
+        w.load_image(os.path.basename(str(self.img)))
+        moves = []
+        monkeypatch.setattr(w.remove_button, "move", lambda *args: moves.append(args))
+        w._update_button_positions()
+        assert moves == []
+
+        w._last_button_layout = None
+        w._update_button_positions()
+        assert len(moves) == 1
+        assert not w.remove_button.isHidden()
+
     def test_resize_event_calls(self):
         w = self.w
         calls = []
-        monkey = lambda: calls.append(True)
-        w._update_button_positions = monkey
-        w._display_pixmap = monkey
+        w._update_button_positions = lambda: calls.append("buttons")
+        w._display_fast_pixmap = lambda: calls.append("fast")
         # create fake event
         old = QtCore.QSize(10, 10)
         new = QtCore.QSize(20, 20)
         ev = QResizeEvent(new, old)
         w.resizeEvent(ev)
-        assert len(calls) == 2
+        assert calls == ["buttons", "fast"]
+        assert w._rescale_timer.isActive()
+
+    def test_resize_burst_schedules_one_smooth_rescale(self):
+        w = self.w
+        w.load_image(os.path.basename(str(self.img)))
+        smooth = []
+        w._rescale_timer.timeout.connect(lambda: smooth.append(True))
+        for _ in range(5):
+            w.resizeEvent(QResizeEvent(w.size(), w.size()))
+        assert not w.pixmap().isNull()
+        QTest.qWait(50)
+        assert smooth == [True]
 
 
 class TestActionIconButton:
@@ -169,3 +352,9 @@ class TestActionIconButton:
         # Simulate click
         btn._on_clicked()
         assert got == ["ACT"]
+
+    def test_buttons_share_one_icon(self):
+        first = ActionIconButton(config.APP_PALETTE, "A")
+        second = ActionIconButton(config.APP_PALETTE, "B")
+        assert first.icon().cacheKey() == second.icon().cacheKey()
+        assert image_loader._get_action_icon() is image_loader._get_action_icon()
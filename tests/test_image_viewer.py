@@ -33,12 +33,16 @@ def test_init_properties(default_palette):
     # Alignment and minimum size
     assert widget.alignment() == QtCore.Qt.AlignmentFlag.AlignCenter
     assert widget.minimumWidth() >= 100 and widget.minimumHeight() >= 100
-    # Style sheet contains background-color and dashed border, and fallback color
-    ss = widget.styleSheet()
-    assert f"background-color: {default_palette['widget_bg']}" in ss
-    assert "dashed" in ss
+    # Styled by the application sheet: dashed border, palette background, fallback color
+    assert widget.objectName() == "imageViewer"
+    assert widget.property("state") == "empty"
+    assert widget.styleSheet() == ""
+    ss = config.build_application_stylesheet(default_palette)
+    viewer_rules = ss[ss.index('QLabel#imageViewer[state="empty"]') :]
+    assert f"background-color: {default_palette['widget_bg']}" in viewer_rules
+    assert "dashed" in viewer_rules
     # Fallback placeholder_text color (#808080)
-    assert "#808080" in ss
+    assert "#808080" in viewer_rules
     # Placeholder text and tooltip
     assert widget.text() == "No Image Loaded"
     assert widget.toolTip() == ""
@@ -52,7 +56,7 @@ def test_load_image_nonexistent(default_palette):
     assert widget._pixmap.isNull()
     assert widget._current_path is None
     assert widget.text() == "Image Not Found or Invalid Path"
-    assert "dashed" in widget.styleSheet()
+    assert widget.property("state") == "empty"
     # Nonexistent file
     widget2 = ImageViewerWidget(default_palette)
     ret2 = widget2.load_image("no_such_file.png")
@@ -75,7 +79,7 @@ def test_load_image_invalid_content(default_palette, tmp_path, capsys):
     # Warning printed
     captured = capsys.readouterr()
     assert f"Warning: Could not load image file: {str(bad)}" in captured.out
-    assert "dashed" in widget.styleSheet()
+    assert widget.property("state") == "empty"
 
 
 def test_load_image_valid(tmp_path, default_palette):
@@ -93,7 +97,7 @@ def test_load_image_valid(tmp_path, default_palette):
     assert widget._current_path == str(fp)
     assert widget.text() == ""
     # Solid border applied
-    assert "solid" in widget.styleSheet()
+    assert widget.property("state") == "filled"
     displayed = widget.pixmap()
     assert isinstance(displayed, QtGui.QPixmap)
     # Displayed pixmap fits within widget
@@ -118,7 +122,7 @@ def test_clear_method_and_tooltip(default_palette, tmp_path):
     assert widget.pixmap().isNull()
     assert widget.text() == "No Image Loaded"
     assert widget.toolTip() == ""
-    assert "dashed" in widget.styleSheet()
+    assert widget.property("state") == "empty"
 
 
 def test_resize_event_rescales(tmp_path, default_palette):
@@ -155,3 +159,50 @@ def test_display_scaled_pixmap_clears_when_no_pixmap(default_palette):
     widget._display_scaled_pixmap()
     # The label's pixmap should now be cleared
     assert widget.pixmap().isNull()
+
+
+def test_display_scaled_pixmap_reuses_scale_for_same_size(default_palette):
+    widget = ImageViewerWidget(default_palette)
+    widget._pixmap = QtGui.QPixmap(8, 4)
+    widget._pixmap.fill(QtCore.Qt.GlobalColor.green)
+    widget.resize(300, 150)
+    widget._display_scaled_pixmap()
+    first = widget.pixmap().cacheKey()
+    widget._display_scaled_pixmap()
+    assert widget.pixmap().cacheKey() == first
+
+    widget.resize(200, 100)
+    widget._display_scaled_pixmap()
+    assert widget.pixmap().cacheKey() != first
+    assert len(widget._scaled_cache) == 1
+    widget.clear()
+    assert not widget._scaled_cache
+
+
+def test_apply_styles_repolishes_only_on_state_change(default_palette, monkeypatch):
+    widget = ImageViewerWidget(default_palette)
+    polished = []
+    style = widget.style()
+    monkeypatch.setattr(widget, "style", lambda: style)
+    monkeypatch.setattr(style, "polish", lambda target: polished.append(target))
+
+    widget._apply_styles()
+    assert polished == []
+    widget._pixmap = QtGui.QPixmap(4, 4)
+    widget._apply_styles()
+    assert widget.property("state") == "filled"
+    assert polished == [widget]
+
+
+def test_resize_shows_fast_scale_until_smooth_pass(default_palette):
+    widget = ImageViewerWidget(default_palette)
+    widget._pixmap = QtGui.QPixmap(8, 4)
+    widget._pixmap.fill(QtCore.Qt.GlobalColor.green)
+    widget.resize(300, 150)
+    widget.resizeEvent(QtGui.QResizeEvent(widget.size(), QtCore.QSize(200, 100)))
+    assert widget._rescale_timer.isActive()
+    assert not widget._scaled_cache
+
+    widget._display_scaled_pixmap()
+    assert not widget._rescale_timer.isActive()
+    assert widget._scaled_cache
@@ -8,6 +8,7 @@ from typing import Any, cast
 from types import SimpleNamespace
 
 from unittest.mock import patch, MagicMock
+from openai.resources.responses import Responses
 
 from spritesage import inference
 from io import BytesIO
@@ -60,6 +61,22 @@ def test_process_image_valid(tmp_path):
     assert raw[:8] == b"\x89PNG\r\n\x1a\n"
 
 
+def test_process_image_mime_from_extension_table(tmp_path):
+    file = tmp_path / "shot.JPG"
+    file.write_bytes(b"jpeg")
+    data_url = inference.OpenAIClient._process_image(str(file))
+    assert data_url == "data:image/jpeg;base64," + base64.b64encode(b"jpeg").decode("ascii")
+
+
+def test_process_image_maps_large_files(tmp_path, monkeypatch):
+    file = tmp_path / "big.png"
+    payload = os.urandom(2048)
+    file.write_bytes(payload)
+    monkeypatch.setattr(inference, "_MMAP_MIN_BYTES", 1024)
+    data_url = inference.OpenAIClient._process_image(str(file))
+    assert data_url == "data:image/png;base64," + base64.b64encode(payload).decode("ascii")
+
+
 def test_build_user_content_no_images():
     prompt = "hello"
     # Use the updated internal method for building user content
@@ -95,6 +112,20 @@ def test_build_user_content_with_images(tmp_path, monkeypatch, capsys):
     assert content[-1] == {"type": "input_text", "text": prompt}
 
 
+@pytest.mark.parametrize("pooled", [True, False])
+def test_build_user_content_encodes_many_images_in_order(tmp_path, monkeypatch, pooled):
+    monkeypatch.setattr(inference, "_B64_RELEASES_GIL", pooled)
+    paths = []
+    for i in range(4):
+        path = tmp_path / f"{i}.png"
+        path.write_bytes(bytes([i]))
+        paths.append(str(path))
+    content = inference.OpenAIClient._build_user_content("p", paths)
+    encoded = [inference.OpenAIClient._process_image(path) for path in reversed(paths)]
+    assert [part["image_url"] for part in content[:-1]] == encoded
+    assert content[-1] == {"type": "input_text", "text": "p"}
+
+
 def test_base_ai_client_abstract():
     # Cannot instantiate abstract class
     with pytest.raises(TypeError):
@@ -158,6 +189,101 @@ def test_testing_client_outputs(tmp_path, capsys):
     assert sug == "TEST_sprite_animation_suggestion"
 
 
+def test_safe_name_matches_isalnum_sanitization():
+    for value in ("Walk Cycle!! (left side)", "héllo wörld", ""):
+        expected = "".join(c if c.isalnum() else "_" for c in value[:20])
+        assert inference._safe_name(value) == expected
+
+
+def test_timestamped_image_path_never_reuses_a_name(tmp_path):
+    paths = {inference._timestamped_image_path(str(tmp_path), "frame") for _ in range(3)}
+    assert len(paths) == 3
+    assert all(os.path.dirname(path) == str(tmp_path) for path in paths)
+
+
+def test_with_retries_backs_off_on_transient_errors_only(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(inference.time, "sleep", sleeps.append)
+    monkeypatch.setattr(
+        inference, "_is_transient_error", lambda error: isinstance(error, TimeoutError)
+    )
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise TimeoutError("slow")
+        return "ok"
+
+    assert inference._with_retries(flaky) == "ok"
+    assert len(sleeps) == 2 and sleeps[0] <= inference.RETRY_BASE_DELAY < sleeps[1] * 2
+
+    def always_slow():
+        raise TimeoutError("slow")
+
+    with pytest.raises(TimeoutError):
+        inference._with_retries(always_slow)
+    assert len(sleeps) == 2 + inference.RETRY_ATTEMPTS - 1
+
+    def broken():
+        raise ValueError("bad request")
+
+    with pytest.raises(ValueError):
+        inference._with_retries(broken)
+    assert len(sleeps) == 2 + inference.RETRY_ATTEMPTS - 1
+
+
+def test_with_retries_honors_retry_after_header(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(inference.time, "sleep", sleeps.append)
+    monkeypatch.setattr(inference, "_is_transient_error", lambda error: True)
+
+    class Throttled(Exception):
+        response = SimpleNamespace(headers={"retry-after": "7"})
+
+    attempts = iter([Throttled("429"), None])
+
+    def throttled_once():
+        error = next(attempts)
+        if error is not None:
+            raise error
+        return "ok"
+
+    assert inference._with_retries(throttled_once) == "ok"
+    assert sleeps == [7.0]
+
+
+def test_prompt_templates_fill_optional_sections():
+    assert inference._format_camera(" None ") == ""
+    assert inference._format_camera("top-down") == "\nCamera Perspective/Viewing Angle: top-down"
+    prompt = inference.GenerateReferenceImageInput(
+        output_folder="o", project_description="", keywords="k $x", images=[], camera=None
+    ).to_prompt()
+    assert "Project Description" not in prompt
+    assert "\nKeywords: k $x\n" in prompt
+
+
+def test_animation_suggestion_prompt_lists_names_compactly():
+    prompt = inference.GenerateSpriteAnimationSuggestion(
+        output_folder="o",
+        animation_names=["idle", "saut_élan"],
+        sprite_description="s",
+        project_description=None,
+        keywords=None,
+    ).to_prompt()
+    assert 'current animation names: ["idle","saut_élan"].' in prompt
+
+
+def test_prompts_keep_shared_context_as_a_fixed_prefix():
+    first = inference.GenerateKeywordsInput(project_description="one", images=[])
+    second = inference.GenerateKeywordsInput(project_description="two", images=[])
+    assert inference.GAME_ASSET_CONTEXT not in first.to_prompt()
+    for input_obj in (first, second):
+        full_prompt = input_obj.to_full_prompt()
+        assert full_prompt.startswith(inference.GAME_ASSET_CONTEXT)
+        assert full_prompt.endswith(input_obj.to_prompt())
+
+
 class DummyChoice:
     def __init__(self, content):
         self.message = SimpleNamespace(content=content)
@@ -170,8 +296,26 @@ class DummyResponse:
         self.output_text = content
 
 
+def patch_responses_create(monkeypatch, fake) -> None:
+    monkeypatch.setattr(Responses, "create", lambda self, **kwargs: fake(**kwargs))
+
+
+def patch_responses_parse(monkeypatch, fake) -> None:
+    """Serve responses.parse from a fake that returns raw JSON text, like create() does."""
+
+    def parse(self, **kwargs):
+        raw = fake(**kwargs)
+        parsed = kwargs["text_format"].model_validate_json(raw.output_text)
+        return SimpleNamespace(output_parsed=parsed)
+
+    monkeypatch.setattr(Responses, "parse", parse)
+
+
 def assert_openai_response_prompt(kwargs: dict[str, Any], expected_prompt: str) -> None:
-    user_content = kwargs["input"][0]["content"]
+    system_message, user_message = kwargs["input"]
+    assert system_message["role"] == "system"
+    assert system_message["content"][0]["text"] == inference.GAME_ASSET_CONTEXT
+    user_content = user_message["content"]
     prompt = user_content[-1]["text"]
     assert isinstance(prompt, str)
     assert prompt == expected_prompt
@@ -181,6 +325,7 @@ def assert_google_prompt_call(
     client: "DummyGClient", expected_prompt: str, call_index: int = -1
 ) -> None:
     contents = client.calls[call_index]["contents"]
+    assert contents[0] == inference.GAME_ASSET_CONTEXT
     prompt = contents[-1]
     assert isinstance(prompt, str)
     assert prompt == expected_prompt
@@ -196,20 +341,142 @@ def test_openai_client_generate_description_success(monkeypatch):
         calls.append(kwargs)
         return DummyResponse(json.dumps(data))
 
-    monkeypatch.setattr(inference.openai.responses, "create", fake_create)
+    patch_responses_parse(monkeypatch, fake_create)
     input = inference.GenerateDescriptionInput(keywords="kw", images=[])
     out = client.generate_description(input)
     assert out == "good"
     assert_openai_response_prompt(calls[0], input.to_prompt())
 
 
+def test_response_cache_skips_repeat_requests(tmp_path, monkeypatch):
+    monkeypatch.setattr(inference, "RESPONSE_CACHE_ENABLED", True)
+    monkeypatch.setattr(inference, "RESPONSE_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(inference, "_response_memory", {})
+    calls = []
+
+    def fake_create(**kwargs):
+        calls.append(kwargs)
+        return DummyResponse(json.dumps({"keywords": f"k{len(calls)}"}))
+
+    patch_responses_parse(monkeypatch, fake_create)
+    image = tmp_path / "ref.png"
+    image.write_bytes(b"first")
+    client = inference.OpenAIClient(text_model="t", image_model="i")
+    input_obj = inference.GenerateKeywordsInput(project_description="desc", images=[str(image)])
+
+    assert client.generate_keywords(input_obj) == "k1"
+    assert client.generate_keywords(input_obj) == "k1"
+    assert len(calls) == 1
+
+    # The disk store survives a fresh process-level memory cache.
+    monkeypatch.setattr(inference, "_response_memory", {})
+    assert client.generate_keywords(input_obj) == "k1"
+    assert len(calls) == 1
+    (shard,) = os.listdir(tmp_path / "cache")
+    assert len(shard) == 2 and os.listdir(tmp_path / "cache" / shard)[0].startswith(shard)
+
+    # Changing the bytes of an input image is a different request.
+    image.write_bytes(b"second")
+    assert client.generate_keywords(input_obj) == "k2"
+    assert len(calls) == 2
+
+
+def test_response_cache_setting_overrides_environment(tmp_path, monkeypatch):
+    sfile = tmp_path / "settings.json"
+    monkeypatch.setattr(inference, "SETTINGS_FILE_NAME", str(sfile))
+    monkeypatch.setattr(inference, "RESPONSE_CACHE_ENABLED", True)
+    assert inference._response_cache_enabled()
+
+    sfile.write_text(json.dumps({inference.RESPONSE_CACHE_SETTING: False}))
+    assert not inference._response_cache_enabled()
+
+    monkeypatch.setattr(inference, "RESPONSE_CACHE_ENABLED", False)
+    sfile.write_text(json.dumps({inference.RESPONSE_CACHE_SETTING: True}))
+    assert inference._response_cache_enabled()
+
+
+def test_response_cache_never_reuses_generated_images(tmp_path, monkeypatch):
+    monkeypatch.setattr(inference, "RESPONSE_CACHE_ENABLED", True)
+    monkeypatch.setattr(inference, "RESPONSE_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(inference, "_response_memory", {})
+    client = inference.OpenAIClient(text_model="t", image_model="i")
+    generated = []
+
+    def fake_generate(self, prompt, output_folder, filename_prefix, image_paths=None):
+        path = tmp_path / f"out{len(generated)}.png"
+        path.write_bytes(b"png")
+        generated.append(str(path))
+        return str(path)
+
+    monkeypatch.setattr(inference.OpenAIClient, "_generate_or_edit_image", fake_generate)
+    input_obj = inference.GenerateReferenceImageInput(
+        output_folder=str(tmp_path), project_description="pd", keywords="", images=[], camera=""
+    )
+
+    first = client.generate_reference_image(input_obj)
+    assert client.generate_reference_image(input_obj) != first
+    assert len(generated) == 2
+    assert not os.path.exists(tmp_path / "cache")
+
+
+def test_semantic_suggestion_cache_matches_near_duplicates():
+    cache = inference.SemanticSuggestionCache(threshold=0.95)
+    cache.add([1.0, 0.0, 0.0], "jump")
+    assert cache.lookup([0.99, 0.05, 0.0]) == "jump"
+    assert cache.lookup([0.0, 1.0, 0.0]) is None
+    assert cache.lookup([1.0, 0.0, 0.0], exclude=["jump"]) is None
+    assert cache.lookup([1.0, 0.0]) is None
+
+
+def test_semantic_suggestion_cache_stores_int8_rows():
+    cache = inference.SemanticSuggestionCache(threshold=0.9)
+    cache.add([0.3, -0.4, 0.5, 0.7], "run")
+    assert cache._rows[0].dtype.name == "int8"
+    assert cache.lookup([0.3, -0.4, 0.5, 0.7]) == "run"
+
+
+def test_semantic_cache_reuses_suggestions_for_similar_prompts(monkeypatch):
+    monkeypatch.setattr(inference, "SEMANTIC_CACHE_ENABLED", True)
+    monkeypatch.setattr(inference, "_semantic_caches", {})
+    client = inference.OpenAIClient(text_model="t")
+    monkeypatch.setattr(client, "_embed_text", lambda text: [1.0, 0.0])
+    calls = []
+
+    def fake_create(**kwargs):
+        calls.append(kwargs)
+        return DummyResponse("jump")
+
+    patch_responses_create(monkeypatch, fake_create)
+
+    def suggestion_input(description, names):
+        return inference.GenerateSpriteAnimationSuggestion(
+            output_folder="o",
+            animation_names=names,
+            sprite_description=description,
+            project_description=None,
+            keywords=None,
+        )
+
+    first = client.generate_sprite_animation_suggestion(
+        suggestion_input("knight with sword", ["idle"])
+    )
+    second = client.generate_sprite_animation_suggestion(
+        suggestion_input("knight holding sword", ["idle"])
+    )
+    assert first == second == "jump"
+    assert len(calls) == 1
+    # A cached name the sprite already has is never handed back.
+    client.generate_sprite_animation_suggestion(suggestion_input("knight", ["idle", "jump"]))
+    assert len(calls) == 2
+
+
 def test_openai_client_generate_description_error(monkeypatch, capsys):
     client = inference.OpenAIClient()
 
     def bad(**kwargs):
         raise RuntimeError("fail")
 
-    monkeypatch.setattr(inference.openai.responses, "create", bad)
+    patch_responses_parse(monkeypatch, bad)
     input_obj = inference.GenerateDescriptionInput(keywords=None, images=[])
     out = client.generate_description(input_obj)
     assert out is None
@@ -225,7 +492,7 @@ def test_openai_client_generate_keywords_success(monkeypatch):
         calls.append(kwargs)
         return DummyResponse(json.dumps(data))
 
-    monkeypatch.setattr(inference.openai.responses, "create", fake_create)
+    patch_responses_parse(monkeypatch, fake_create)
     input_obj = inference.GenerateKeywordsInput(project_description="desc", images=[])
     out = client.generate_keywords(input_obj)
     assert out == "k1,k2"
@@ -234,11 +501,7 @@ def test_openai_client_generate_keywords_success(monkeypatch):
 
 def test_openai_client_generate_keywords_error(monkeypatch, capsys):
     client = inference.OpenAIClient()
-    monkeypatch.setattr(
-        inference.openai.responses,
-        "create",
-        lambda **kwargs: (_ for _ in ()).throw(ValueError("oops")),
-    )
+    patch_responses_parse(monkeypatch, lambda **kwargs: (_ for _ in ()).throw(ValueError("oops")))
     input_obj = inference.GenerateKeywordsInput(project_description="desc", images=[])
     out = client.generate_keywords(input_obj)
     assert out is None
@@ -320,7 +583,7 @@ def test_openai_client_image_methods(monkeypatch, capsys):
 
                 ret = func(input_obj)
                 assert ret is None, f"Method {method_name} did not return None"
-                assert seen_prompts[-1] == input_obj.to_prompt()
+                assert seen_prompts[-1] == input_obj.to_full_prompt()
                 out = capsys.readouterr().out
                 assert (
                     "Error generating" in out and "Simulated API Error" in out
@@ -335,6 +598,36 @@ def test_openai_client_image_methods(monkeypatch, capsys):
         assert mock_edit.call_count >= len(method_names)
 
 
+def test_openai_image_edit_closes_files_and_rejects_oversized_inputs(tmp_path, monkeypatch):
+    client = inference.OpenAIClient(text_model="t", image_model="i")
+    first = tmp_path / "a.png"
+    first.write_bytes(b"a")
+    unreadable = tmp_path / "b.png"
+    unreadable.write_bytes(b"b")
+    opened = []
+    real_open = open
+
+    def tracking_open(path, *args, **kwargs):
+        if path == str(unreadable):
+            raise PermissionError(path)
+        handle = real_open(path, *args, **kwargs)
+        opened.append(handle)
+        return handle
+
+    monkeypatch.setattr("builtins.open", tracking_open)
+    with pytest.raises(PermissionError):
+        client._generate_or_edit_image("p", str(tmp_path), "x", [str(first), str(unreadable)])
+    monkeypatch.setattr("builtins.open", real_open)
+    assert opened and all(handle.closed for handle in opened)
+
+    monkeypatch.setattr(inference, "OPENAI_IMAGE_EDIT_MAX_BYTES", 0)
+    edit = MagicMock()
+    monkeypatch.setattr(openai.resources.images.Images, "edit", edit)
+    with pytest.raises(ValueError, match="image edit limit"):
+        client._generate_or_edit_image("p", str(tmp_path), "x", [str(first)])
+    edit.assert_not_called()
+
+
 def test_openai_client_animation_suggestion(monkeypatch):
     client = inference.OpenAIClient()
     # Success case
@@ -344,7 +637,7 @@ def test_openai_client_animation_suggestion(monkeypatch):
         calls.append(kwargs)
         return DummyResponse(" suggest ")
 
-    monkeypatch.setattr(inference.openai.responses, "create", fake_create)
+    patch_responses_create(monkeypatch, fake_create)
     input_obj = inference.GenerateSpriteAnimationSuggestion(
         output_folder="out",
         animation_names=["a"],
@@ -356,11 +649,7 @@ def test_openai_client_animation_suggestion(monkeypatch):
     assert out == "suggest"
     assert_openai_response_prompt(calls[0], input_obj.to_prompt())
     # Error case
-    monkeypatch.setattr(
-        inference.openai.responses,
-        "create",
-        lambda **kwargs: (_ for _ in ()).throw(Exception("err")),
-    )
+    patch_responses_create(monkeypatch, lambda **kwargs: (_ for _ in ()).throw(Exception("err")))
     input_obj2 = inference.GenerateSpriteAnimationSuggestion(
         output_folder="out",
         animation_names=[],
@@ -483,6 +772,36 @@ def test_ai_model_manager_requires_provider_configuration(tmp_path, monkeypatch)
         inference.AIModelManager().get_client()
 
 
+def test_ai_model_manager_remembers_unconfigured_vendor(tmp_path, monkeypatch):
+    sfile = tmp_path / "settings.json"
+    sfile.write_text(json.dumps({"Selected Inference Provider": "OPENAI"}))
+    monkeypatch.setattr(inference, "SETTINGS_FILE_NAME", str(sfile))
+    builds = []
+    real_build = inference.AIModelManager._build_client
+    monkeypatch.setattr(
+        inference.AIModelManager,
+        "_build_client",
+        lambda self, vendor: builds.append(vendor) or real_build(self, vendor),
+    )
+
+    for _ in range(2):
+        with pytest.raises(inference.MissingConfigurationException, match="OPENAI_API_KEY"):
+            inference.AIModelManager().get_client()
+    assert builds == [inference.AIModel.OPENAI]
+
+    sfile.write_text(
+        json.dumps(
+            {
+                "Selected Inference Provider": "OPENAI",
+                "OPENAI_API_KEY": "key",
+                "OPENAI_TEXT_MODEL": "t",
+                "OPENAI_IMAGE_MODEL": "i",
+            }
+        )
+    )
+    assert isinstance(inference.AIModelManager().get_client(), inference.OpenAIClient)
+
+
 def test_testing_provider_can_be_disabled(tmp_path, monkeypatch):
     sfile = tmp_path / "settings.json"
     sfile.write_text(json.dumps({"Selected Inference Provider": "TESTING"}))
@@ -493,6 +812,55 @@ def test_testing_provider_can_be_disabled(tmp_path, monkeypatch):
         inference.AIModelManager().get_client()
 
 
+def test_unknown_provider_is_rejected(tmp_path, monkeypatch):
+    sfile = tmp_path / "settings.json"
+    sfile.write_text(json.dumps({"Selected Inference Provider": "UNKNOWN"}))
+    monkeypatch.setattr(inference, "SETTINGS_FILE_NAME", str(sfile))
+
+    with pytest.raises(ValueError, match="AI Model UNKNOWN not supported"):
+        inference.AIModelManager.get_active_vendor()
+
+
+def test_settings_are_parsed_once_until_the_file_changes(tmp_path, monkeypatch):
+    sfile = tmp_path / "settings.json"
+    sfile.write_text(json.dumps({"Selected Inference Provider": "TESTING"}))
+    monkeypatch.setattr(inference, "SETTINGS_FILE_NAME", str(sfile))
+    inference._parse_settings.cache_clear()
+
+    mgr = inference.AIModelManager()
+    assert mgr.get_active_vendor() == inference.AIModel.TESTING
+    assert mgr.get_active_vendor() == inference.AIModel.TESTING
+    assert inference._parse_settings.cache_info().misses == 1
+
+    sfile.write_text(json.dumps({"Selected Inference Provider": "OPENAI", "OPENAI_API_KEY": "k"}))
+    assert mgr.get_active_vendor() == inference.AIModel.OPENAI
+    assert inference._parse_settings.cache_info().misses == 2
+
+
+def test_ai_model_manager_reuses_clients_until_settings_change(tmp_path, monkeypatch):
+    settings = {
+        "OPENAI_API_KEY": "openai-key",
+        "Selected Inference Provider": "OPENAI",
+        "OPENAI_TEXT_MODEL": "openai-text",
+        "OPENAI_IMAGE_MODEL": "openai-image",
+    }
+    sfile = tmp_path / "settings.json"
+    sfile.write_text(json.dumps(settings))
+    monkeypatch.setattr(inference, "SETTINGS_FILE_NAME", str(sfile))
+
+    client = inference.AIModelManager().get_client()
+    assert inference.AIModelManager().get_client() is client
+    closed = []
+    monkeypatch.setattr(client, "close", lambda: closed.append(client))
+
+    settings["OPENAI_TEXT_MODEL"] = "openai-text-2"
+    sfile.write_text(json.dumps(settings))
+    rebuilt = inference.AIModelManager().get_client()
+    assert rebuilt is not client
+    assert closed == [client]
+    assert rebuilt.text_model == "openai-text-2"
+
+
 class DummyParsedDesc:
     def __init__(self, description=None, keywords=None):
         self.description = description
@@ -611,6 +979,25 @@ def test_googleai_client_generate_description(monkeypatch):
     assert out2 is None
 
 
+def test_googleai_client_reuses_sdk_client(monkeypatch):
+    created = []
+    closed = []
+
+    def make_client(api_key=None):
+        gclient = DummyGClient(parsed_response=DummyParsedDesc(description="d"))
+        setattr(gclient, "close", lambda: closed.append(gclient))
+        created.append(gclient)
+        return gclient
+
+    monkeypatch.setattr(inference.genai, "Client", make_client)
+    input_obj = inference.GenerateDescriptionInput(keywords="kw", images=[])
+    with inference.GoogleAIClient(api_key="key") as client:
+        client.generate_description(input_obj)
+        client.generate_description(input_obj)
+    assert len(created) == 1
+    assert closed == created
+
+
 def test_googleai_client_generate_keywords(monkeypatch):
     parsed = DummyParsedDesc(keywords="k1,k2")
     gclient = DummyGClient(parsed_response=parsed)
@@ -911,7 +1298,7 @@ def test_googleai_client_generate_reference_image_error(monkeypatch, capsys):
     captured = capsys.readouterr().out
 
     assert result is None
-    assert "Error calling GoogleAI for reference image: ref_fail" in captured
+    assert "Error calling GoogleAI for reference image generation: ref_fail" in captured
 
 
 def test_googleai_client_generate_base_sprite_image_open_error(tmp_path, capsys):
@@ -936,7 +1323,10 @@ def test_googleai_client_generate_base_sprite_image_open_error(tmp_path, capsys)
     assert "Error opening reference image" in captured
     assert bad_file.name in captured
     # And still hit the final generation‐failure message
-    assert "Google AI image generation failed or no image data received." in captured
+    assert (
+        "Google AI image generation failed or no image data received for base sprite image."
+        in captured
+    )
 
 
 def test_googleai_client_generate_base_sprite_image_exception(monkeypatch, capsys):
@@ -963,6 +1353,21 @@ def test_googleai_client_generate_base_sprite_image_exception(monkeypatch, capsy
     assert "Error calling GoogleAI for base sprite image generation: base_fail" in captured
 
 
+def test_write_image_bytes_keeps_png_and_converts_others(tmp_path):
+    from PIL import Image
+
+    png_bytes = make_png_bytes()
+    png_path = tmp_path / "out.png"
+    inference._write_image_bytes(png_bytes, str(png_path))
+    assert png_path.read_bytes() == png_bytes
+
+    buf = BytesIO()
+    Image.new("RGB", (2, 2), color=cast(Any, "blue")).save(buf, format="JPEG")
+    converted = tmp_path / "converted.png"
+    inference._write_image_bytes(buf.getvalue(), str(converted))
+    assert converted.read_bytes().startswith(b"\x89PNG")
+
+
 @patch("spritesage.inference.Image.open")
 def test_googleai_next_sprite_image_open_error(mock_image_open, tmp_path, capsys, monkeypatch):
     """Test coverage for lines 460-463: Error opening the input image."""
@@ -1070,3 +1475,43 @@ def test_googleai_between_images_open_error(mock_image_open, tmp_path, capsys, m
         "Google AI image generation failed or no image data received for sprite between images."
         in captured.out
     )
+
+
+def test_googleai_open_cached_reuses_decoded_images(tmp_path, monkeypatch):
+    opened = []
+    real_open = inference._open_pil_image
+
+    def counting_open(source):
+        opened.append(source)
+        return real_open(source)
+
+    monkeypatch.setattr(inference, "_open_pil_image", counting_open)
+    monkeypatch.setattr(inference, "PIL_IMAGE_CACHE_SIZE", 2)
+    client = inference.GoogleAIClient(api_key="dummy_key")
+    paths = []
+    for name in ("a.png", "b.png", "c.png"):
+        path = tmp_path / name
+        path.write_bytes(make_png_bytes())
+        paths.append(str(path))
+
+    first = client._open_cached(paths[0])
+    assert client._open_cached(paths[0]) is first
+    assert opened == [paths[0]]
+
+    stat = os.stat(paths[0])
+    os.utime(paths[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert client._open_cached(paths[0]) is not first
+
+    client._open_cached(paths[1])
+    client._open_cached(paths[2])
+    assert len(client._image_cache) == 2
+    assert [key[0] for key in client._image_cache] == paths[1:]
+
+
+def test_openai_client_reuses_one_sdk_client_without_nested_retries():
+    client = inference.OpenAIClient(text_model="t", image_model="i", api_key="key")
+    sdk_client = client._client
+    assert client._client is sdk_client
+    assert sdk_client.max_retries == 0
+    assert sdk_client.timeout == inference.OPENAI_REQUEST_TIMEOUT
+    client.close()
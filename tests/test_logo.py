@@ -105,3 +105,37 @@ def test_resize_event_rescales(tmp_path, default_palette):
     # Dimensions should now not exceed available size
     assert displayed.size().width() <= avail.width()
     assert displayed.size().height() <= avail.height()
+
+
+def test_smooth_rescale_reuses_recent_sizes(tmp_path, default_palette):
+    pix = QtGui.QPixmap(40, 20)
+    pix.fill(QtCore.Qt.GlobalColor.green)
+    tmp = tmp_path / "logo4.png"
+    pix.save(str(tmp), "PNG")
+    widget = LogoWidget(default_palette, str(tmp))
+    sizes = [QtCore.QSize(110, 60 + i) for i in range(logo.SCALED_LOGO_CACHE_SIZE + 1)]
+
+    for size in sizes:
+        widget.size = lambda size=size: size
+        widget.resizeEvent(QtGui.QResizeEvent(size, size))
+        assert widget._rescale_timer.isActive()
+        widget._display_smooth_pixmap()
+
+    assert len(widget._scaled_cache) == logo.SCALED_LOGO_CACHE_SIZE
+    # The oldest size was evicted; the newest is served straight from the cache.
+    assert all(height != 50 for _, height, _, _ in widget._scaled_cache)
+    cached = next(reversed(widget._scaled_cache.values()))
+    widget.resizeEvent(QtGui.QResizeEvent(sizes[-1], sizes[-1]))
+    assert widget.logo_label.pixmap().cacheKey() == cached.cacheKey()
+
+
+def test_logo_widgets_share_one_decoded_pixmap(tmp_path, default_palette):
+    pix = QtGui.QPixmap(8, 8)
+    pix.fill(QtCore.Qt.GlobalColor.red)
+    tmp = tmp_path / "shared_logo.png"
+    pix.save(str(tmp), "PNG")
+
+    first = LogoWidget(default_palette, str(tmp))
+    second = LogoWidget(default_palette, str(tmp))
+    assert first.original_pixmap is not None and second.original_pixmap is not None
+    assert first.original_pixmap.cacheKey() == second.original_pixmap.cacheKey()
@@ -96,6 +96,7 @@ def test_load_project_records_recent_project(tmp_path, monkeypatch, qapp):
     assert loaded_files == [str(sage_file)]
     assert w.recent_projects[0]["name"] == "Example"
     assert w.recent_projects[0]["path"] == os.path.abspath(str(sage_file))
+    main_window.flush_pending_writes()
     saved = json.loads(settings_file.read_text(encoding="utf-8"))
     assert saved[config.RECENT_PROJECTS_KEY] == w.recent_projects
     assert w.sidebar_widget.recent_projects_list.count() == 1
@@ -149,6 +150,15 @@ def test_project_open_recent_missing_file_warns(tmp_path, monkeypatch, qapp):
     assert "could not be opened" in warnings[0][1]
 
 
+def test_load_or_create_settings_rejects_oversized_file(temp_settings_file, monkeypatch, capsys):
+    monkeypatch.setattr(main_window, "SETTINGS_FILE_MAX_BYTES", 16)
+    temp_settings_file.write_text(json.dumps({"OPENAI_API_KEY": "x" * 32}), encoding="utf-8")
+    w = main_window.MainWindow(logo_path=None)
+    out = capsys.readouterr().out
+    assert "too large" in out
+    assert w.settings.get("OPENAI_API_KEY") == config.DEFAULT_SETTINGS["OPENAI_API_KEY"]
+
+
 def test_load_or_create_settings_invalid_json(temp_settings_file, capsys):
     # Write invalid JSON
     temp_settings_file.write_text("{bad json}", encoding="utf-8")
@@ -249,6 +259,23 @@ def test_initial_sync_and_sync_methods(qapp, temp_settings_file):
     assert hasattr(w, "initial_sync")
 
 
+def test_splitter_sync_coalesces_drag_events(qapp, temp_settings_file, monkeypatch):
+    w = main_window.MainWindow(logo_path=None)
+    mirrored = []
+    monkeypatch.setattr(
+        w, "_mirror_splitter_sizes", lambda source, target: mirrored.append((source, target))
+    )
+
+    for pos in range(5):
+        w.inner_splitter.splitterMoved.emit(100 + pos, 1)
+    assert w._bottom_sync_timer.isActive()
+    assert mirrored == []
+
+    w._bottom_sync_timer.stop()
+    w._bottom_sync_timer.timeout.emit()
+    assert mirrored == [(w.inner_splitter, w.bottom_splitter)]
+
+
 def test_close_event(qapp, temp_settings_file):
     w = main_window.MainWindow(logo_path=None)
     event = QtGui.QCloseEvent()
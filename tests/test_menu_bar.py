@@ -521,6 +521,59 @@ class TestAppMenuBar:
         assert bar.current_app_settings == new_settings
         saved = json.loads(settings_file.read_text())
         assert saved == new_settings
+        assert not (tmp_path / "settings.json.tmp").exists()
+
+    def test_handle_settings_saved_writes_file_before_emitting(self, tmp_path, monkeypatch, qapp):
+        settings_file = tmp_path / "settings.json"
+        monkeypatch.setattr(menu_bar, "SETTINGS_FILE_NAME", str(settings_file))
+        settings_file.write_text(json.dumps({}))
+        parent = QtWidgets.QWidget()
+        monkeypatch.setattr(parent, "close", lambda: True)
+        bar = AppMenuBar(parent)
+        on_disk = []
+        bar.settings_updated.connect(
+            lambda s: on_disk.append(json.loads(settings_file.read_text()))
+        )
+
+        bar._handle_settings_saved({"OPENAI_API_KEY": "fresh"})
+
+        assert on_disk == [{"OPENAI_API_KEY": "fresh"}]
+
+    def test_handle_settings_saved_reports_write_errors(self, tmp_path, monkeypatch, qapp):
+        settings_file = tmp_path / "settings.json"
+        monkeypatch.setattr(menu_bar, "SETTINGS_FILE_NAME", str(settings_file))
+        settings_file.write_text(json.dumps({}))
+        parent = QtWidgets.QWidget()
+        monkeypatch.setattr(parent, "close", lambda: True)
+        logged = []
+        console_widget = type("C", (), {"log_message": lambda self, msg: logged.append(msg)})()
+        monkeypatch.setattr(parent, "console_widget", console_widget, raising=False)
+        bar = AppMenuBar(parent)
+
+        def fail_write(path, text):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(menu_bar, "write_text_atomic", fail_write)
+        bar._handle_settings_saved({"OPENAI_API_KEY": "fresh"})
+
+        assert len(logged) == 1 and "disk full" in logged[0]
+        assert bar.current_app_settings == {"OPENAI_API_KEY": "fresh"}
+
+    def test_handle_settings_saved_ignores_unchanged_settings(self, tmp_path, monkeypatch, qapp):
+        settings_file = tmp_path / "settings.json"
+        monkeypatch.setattr(menu_bar, "SETTINGS_FILE_NAME", str(settings_file))
+        settings_file.write_text(json.dumps({"OPENAI_API_KEY": "a"}))
+        parent = QtWidgets.QWidget()
+        monkeypatch.setattr(parent, "close", lambda: True)
+        bar = AppMenuBar(parent)
+        captured = []
+        bar.settings_updated.connect(lambda s: captured.append(s))
+        settings_file.write_text("sentinel")
+
+        bar._handle_settings_saved({"OPENAI_API_KEY": "a"})
+
+        assert captured == []
+        assert settings_file.read_text() == "sentinel"
 
     def test_open_settings_dialog_invokes_dialog(self, tmp_path, monkeypatch, qapp):
         settings_file = tmp_path / "settings.json"
@@ -557,3 +610,21 @@ class TestAppMenuBar:
         assert instantiated == [(bar.current_app_settings, parent)]
         assert len(connect_calls) == 1
         assert exec_calls == [True]
+
+    def test_open_settings_dialog_reuses_dialog(self, tmp_path, monkeypatch, qapp):
+        settings_file = tmp_path / "settings.json"
+        monkeypatch.setattr(menu_bar, "SETTINGS_FILE_NAME", str(settings_file))
+        settings_file.write_text(json.dumps({"OPENAI_API_KEY": "first"}))
+        parent = QtWidgets.QWidget()
+        monkeypatch.setattr(parent, "close", lambda: True)
+        bar = AppMenuBar(parent)
+        shown = []
+        monkeypatch.setattr(SettingsDialog, "exec", lambda self: shown.append(self) or 0)
+
+        bar._open_settings_dialog()
+        bar.current_app_settings = {"OPENAI_API_KEY": "second"}
+        bar._open_settings_dialog()
+
+        assert len(shown) == 2
+        assert shown[0] is shown[1]
+        assert shown[1].openai_api_key_input.text() == "second"
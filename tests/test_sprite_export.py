@@ -1,5 +1,6 @@
 import json
 import os
+import re
 from typing import Any, cast
 
 from PIL import Image
@@ -267,3 +268,106 @@ def test_spritesheet_extracts_alpha_per_opaque_frame(tmp_path, monkeypatch):
     result = Image.open(output_path).convert("RGBA")
     assert result.getpixel((8, 0)) == (0, 0, 0, 0)
     assert result.getpixel((12, 0)) == (10, 20, 30, 255)
+
+
+def _normalize_godot_ids(text):
+    seen = {}
+
+    def replace(match):
+        return seen.setdefault(match.group(0), f"<id{len(seen)}>")
+
+    return re.sub(r"uid://[0-9a-f]+|AtlasTexture_[0-9a-f]+|1_[0-9a-f]{6}", replace, text)
+
+
+EXPECTED_HERO_TRES = """\
+[gd_resource type="SpriteFrames" load_steps=1 format=3 uid="<id0>"]
+
+[ext_resource type="Texture2D" uid="<id1>" path="Hero_sheet.png" id="1"]
+
+[sub_resource type="AtlasTexture" id="<id2>"]
+atlas = ExtResource("1")
+region = Rect2(0, 0, 8, 8)
+
+[sub_resource type="AtlasTexture" id="<id3>"]
+atlas = ExtResource("1")
+region = Rect2(8, 0, 8, 8)
+
+[sub_resource type="AtlasTexture" id="<id4>"]
+atlas = ExtResource("1")
+region = Rect2(0, 8, 8, 8)
+
+[sub_resource type="AtlasTexture" id="<id5>"]
+atlas = ExtResource("1")
+region = Rect2(8, 8, 8, 8)
+
+[resource]
+animations = [
+  {
+    "frames": [
+      {
+        "duration": 1.0,
+        "texture": SubResource("<id2>")
+      },
+      {
+        "duration": 1.0,
+        "texture": SubResource("<id3>")
+      },
+    ],
+    "loop": true,
+    "name": &"idle",
+    "speed": 1.0
+  },
+  {
+    "frames": [
+      {
+        "duration": 1.0,
+        "texture": SubResource("<id4>")
+      },
+      {
+        "duration": 1.0,
+        "texture": SubResource("<id5>")
+      },
+    ],
+    "loop": true,
+    "name": &"walk",
+    "speed": 1.0
+  },
+]
+"""
+
+EXPECTED_HERO_TSCN = """\
+[gd_scene load_steps=2 format=3 uid="<id0>"]
+
+[ext_resource type="SpriteFrames" uid="<id1>" path="Hero_frames.tres" id="<id2>"]
+
+[node name="Hero" type="AnimatedSprite2D"]
+sprite_frames = ExtResource("<id2>")
+animation = &"walk"
+"""
+
+
+def test_godot_sprite_exporter_writes_expected_resources(tmp_path):
+    for name in ("base", "a", "c"):
+        Image.new("RGBA", (8, 8)).save(tmp_path / f"{name}.png")
+    sprite = SpriteFile(
+        uuid="hero",
+        name="Hero",
+        description="",
+        width=8,
+        height=8,
+        base_image=str(tmp_path / "base.png"),
+        animations={
+            "walk": Animation(name="walk", frames=[str(tmp_path / "a.png")]),
+            "idle": Animation(name="idle", frames=[str(tmp_path / "c.png")]),
+        },
+    )
+    output_dir = tmp_path / "out"
+
+    GodotSpriteExporter(sprite, str(output_dir)).export()
+
+    tres = (output_dir / "Hero_frames.tres").read_text(encoding="utf-8")
+    tscn = (output_dir / "Hero.tscn").read_text(encoding="utf-8")
+    atlas_ids = re.findall(r'id="(AtlasTexture_[0-9a-f]+)"', tres)
+    assert len(atlas_ids) == len(set(atlas_ids)) == 4
+    assert _normalize_godot_ids(tres) == EXPECTED_HERO_TRES
+    assert _normalize_godot_ids(tscn) == EXPECTED_HERO_TSCN
@@ -1,3 +1,4 @@
+import os
 import pytest
 from PySide6 import QtWidgets
 
@@ -83,3 +84,19 @@ def test_call_with_progress_returns_none_result(qapp):
 
     assert utils.call_with_progress(None, worker, message="Working") is None
     assert progress == ["ran"]
+
+
+def test_background_writes_land_in_order(tmp_path):
+    target = tmp_path / "settings.json"
+    for i in range(5):
+        utils.write_text_in_background(str(target), f'{{"n": {i}}}')
+    utils.flush_pending_writes()
+    assert target.read_text(encoding="utf-8") == '{"n": 4}'
+
+
+def test_write_text_atomic_replaces_file_without_leftovers(tmp_path):
+    target = tmp_path / "project.sage"
+    target.write_text("old", encoding="utf-8")
+    utils.write_text_atomic(str(target), "new")
+    assert target.read_text(encoding="utf-8") == "new"
+    assert os.listdir(tmp_path) == ["project.sage"]